@@ -0,0 +1,90 @@
+"""Partition coins prices by day
+
+Revision ID: d3a9c6e2b715
+Revises: b6e3a1f47c28
+Create Date: 2026-10-18 18:02:36.470193
+
+"""
+from datetime import date, timedelta
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a9c6e2b715'
+down_revision: Union[str, None] = 'b6e3a1f47c28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS_AHEAD_DAYS = 7
+
+
+def create_indexes() -> None:
+    op.create_index(op.f('ix_coins_prices_timedate'), 'coins_prices', ['timedate'], unique=False)
+    op.create_index('ix_coins_prices_coin_id_timedate', 'coins_prices', ['coin_id', sa.text('timedate DESC')], unique=False)
+
+
+def rename_old_table() -> None:
+    op.drop_index('ix_coins_prices_coin_id_timedate', table_name='coins_prices')
+    op.drop_index(op.f('ix_coins_prices_timedate'), table_name='coins_prices')
+    op.rename_table('coins_prices', 'coins_prices_old')
+    op.execute('ALTER INDEX coins_prices_pkey RENAME TO coins_prices_old_pkey')
+
+
+def create_day_partitions(first_day: date, last_day: date) -> None:
+    day = first_day
+    while day <= last_day:
+        next_day = day + timedelta(days=1)
+        op.execute(
+            f"CREATE TABLE coins_prices_p{day.isoformat().replace('-', '_')} "
+            f"PARTITION OF coins_prices FOR VALUES FROM ('{day} UTC') TO ('{next_day} UTC')"
+        )
+        day = next_day
+
+
+def upgrade() -> None:
+    rename_old_table()
+    op.create_table('coins_prices',
+    sa.Column('price', sa.Float(), nullable=False),
+    sa.Column('timedate', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('coin_id', sa.Uuid(), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.ForeignKeyConstraint(['coin_id'], ['coins.id'], ),
+    sa.PrimaryKeyConstraint('timedate', 'id'),
+    postgresql_partition_by='RANGE (timedate)'
+    )
+    op.execute('CREATE TABLE coins_prices_default PARTITION OF coins_prices DEFAULT')
+    first_day = op.get_bind().execute(
+        sa.text("SELECT min(timedate AT TIME ZONE 'UTC')::date FROM coins_prices_old")
+    ).scalar()
+    today = op.get_bind().execute(sa.text("SELECT (now() AT TIME ZONE 'UTC')::date")).scalar()
+    create_day_partitions(first_day or today, today + timedelta(days=PARTITIONS_AHEAD_DAYS))
+    op.execute(
+        'INSERT INTO coins_prices (price, timedate, coin_id, id) '
+        'SELECT price, timedate, coin_id, id FROM coins_prices_old'
+    )
+    op.drop_table('coins_prices_old')
+    create_indexes()
+
+
+def downgrade() -> None:
+    op.rename_table('coins_prices', 'coins_prices_partitioned')
+    op.execute('ALTER INDEX coins_prices_pkey RENAME TO coins_prices_partitioned_pkey')
+    op.drop_index('ix_coins_prices_coin_id_timedate', table_name='coins_prices_partitioned')
+    op.drop_index(op.f('ix_coins_prices_timedate'), table_name='coins_prices_partitioned')
+    op.create_table('coins_prices',
+    sa.Column('price', sa.Float(), nullable=False),
+    sa.Column('timedate', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('coin_id', sa.Uuid(), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.ForeignKeyConstraint(['coin_id'], ['coins.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute(
+        'INSERT INTO coins_prices (price, timedate, coin_id, id) '
+        'SELECT price, timedate, coin_id, id FROM coins_prices_partitioned'
+    )
+    op.drop_table('coins_prices_partitioned')
+    create_indexes()
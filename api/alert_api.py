@@ -3,19 +3,44 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.coin_api import get_coin, get_current_coin_price
-from api_models.alert_models import (AlertCreate, AlertRead, AlertsRead,
-                                     AlertUpdate)
+from api_models.alert_models import (AlertCreate, AlertFilters, AlertRead,
+                                     AlertsRead, AlertUpdate)
 from models import Alert, Coin
+from utils.alert_index import alert_index
 from utils.db_utils import get_session
+from utils.pagination import PageParams, decode_cursor, paginate, split_page
 
 router = APIRouter()
 
 
+def filter_alerts(query: Select, filters: AlertFilters) -> Select:
+    """Add filters conditions to alerts query.
+
+    Args:
+        query: Select - alerts query.
+        filters: AlertFilters - alerts filters.
+
+    Returns:
+        Select: filtered query.
+    """
+    if filters.email is not None:
+        query = query.where(Alert.email == filters.email)
+    if filters.coin_id is not None:
+        query = query.where(Alert.coin_id == filters.coin_id)
+    if filters.alert_type is not None:
+        query = query.where(Alert.alert_type == filters.alert_type)
+    if filters.min_price is not None:
+        query = query.where(Alert.threshold_price >= filters.min_price)
+    if filters.max_price is not None:
+        query = query.where(Alert.threshold_price <= filters.max_price)
+    return query
+
+
 async def get_alert(alert_id: UUID, db: AsyncSession) -> Alert:
     """Get Alert by id.
 
@@ -57,17 +82,25 @@ async def get_coin_data_from_alert(
 
 
 @router.get('/alerts', response_model=AlertsRead)
-async def get_alerts(db: AsyncSession = Depends(get_session)) -> AlertsRead:
-    """Get all alerts.
+async def get_alerts(
+    filters: AlertFilters = Depends(),
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_session),
+) -> AlertsRead:
+    """Get page of filtered alerts ordered by id.
 
     Args:
+        filters: AlertFilters, optional - alerts filters. Defaults to Depends() (all alerts).
+        page: PageParams, optional - page cursor and size. Defaults to Depends() (first page).
         db: AsyncSession, optional - db session. Defaults to Depends(get_session).
 
     Returns:
         AlertsRead: Pydantic model with fields for read.
     """
-    query = await db.execute(select(Alert))
-    alerts = query.scalars().all()
+    after_key = decode_cursor(page.after, UUID) if page.after else None
+    alerts_query = filter_alerts(select(Alert), filters)
+    query = await db.execute(paginate(alerts_query, (Alert.id,), after_key, page.limit))
+    alerts, next_cursor = split_page(query.scalars().all(), page.limit, lambda row: (row.id,))
     alerts_list = []
     for alert in alerts:
         alerts_list.append(
@@ -79,7 +112,7 @@ async def get_alerts(db: AsyncSession = Depends(get_session)) -> AlertsRead:
                 threshold_price=alert.threshold_price,
             ),
         )
-    return AlertsRead(alerts=alerts_list)
+    return AlertsRead(alerts=alerts_list, next_cursor=next_cursor)
 
 
 @router.post('/alerts', response_model=AlertRead, status_code=status.HTTP_201_CREATED)
@@ -111,6 +144,7 @@ async def create_alert(alert: AlertCreate, db: AsyncSession = Depends(get_sessio
         await db.rollback()
         raise HTTPException(status.HTTP_400_BAD_REQUEST, 'Такая подписка уже оформлена!')
     await db.refresh(new_alert)
+    alert_index.add(new_alert)
     return AlertRead(
         id=new_alert.id,
         alert_type=new_alert.alert_type,
@@ -134,6 +168,7 @@ async def delete_alert(alert_id: UUID, db: AsyncSession = Depends(get_session))
     alert = await get_alert(alert_id, db)
     await db.delete(alert)
     await db.commit()
+    alert_index.remove(alert_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -174,6 +209,7 @@ async def update_alert(
             'Ошибка обновления уведомления. Возможно, монеты с таким id нет.',
         )
     await db.refresh(alert)
+    alert_index.add(alert)
     return AlertRead(
         id=alert.id,
         alert_type=alert.alert_type,
@@ -0,0 +1,213 @@
+"""Module with bulk Alert API views."""
+
+import math
+from uuid import UUID, uuid4
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api_models.alert_bulk_models import (AlertBulkItem, AlertBulkResult,
+                                          AlertsBulkCreate, AlertsBulkDelete,
+                                          AlertsBulkRead)
+from models import NAME_FIELD_LENGTH, Alert, Coin, CoinLatestPrice
+from utils import price_cache
+from utils.alert_index import DEC_ALERT, INC_ALERT, AlertEntry, alert_index
+from utils.db_utils import get_session
+from utils.validators import validate_email
+
+router = APIRouter()
+
+# asyncpg allows 32767 query parameters, alert row takes 5 of them.
+BULK_CHUNK_SIZE = 5000
+
+
+async def get_coins_prices(coin_ids: set[UUID], db: AsyncSession) -> dict[UUID, float | None]:
+    """Get current prices of coins with one query.
+
+    Args:
+        coin_ids: set[UUID] - coins ids.
+        db: AsyncSession - db session.
+
+    Returns:
+        dict[UUID, float | None]: price by coin id, None if coin has no price yet.
+            Unknown coins are skipped.
+    """
+    query = await db.execute(
+        select(
+            Coin.id,
+            Coin.name,
+            CoinLatestPrice.price,
+        ).outerjoin(
+            CoinLatestPrice, Coin.id == CoinLatestPrice.coin_id,
+        ).where(
+            Coin.id.in_(coin_ids),
+        ),
+    )
+    prices = {}
+    for coin_id, name, price in query.all():
+        cached_price = price_cache.get_price(name)
+        prices[coin_id] = price if cached_price is None else cached_price
+    return prices
+
+
+def validate_alert_fields(alert: AlertBulkItem) -> str | None:
+    """Check alert fields against db columns, so one alert does not fail whole insert.
+
+    Args:
+        alert: AlertBulkItem - alert for create.
+
+    Returns:
+        str | None: error message or None if fields are correct.
+    """
+    if not math.isfinite(alert.threshold_price):
+        return 'threshold_price должен быть конечным числом.'
+    if alert.threshold_price < 0:
+        return 'threshold_price должен быть больше нуля.'
+    if len(alert.email) > NAME_FIELD_LENGTH:
+        return f'email не может быть длиннее {NAME_FIELD_LENGTH} символов.'
+    try:
+        validate_email(alert.email)
+    except HTTPException as error:
+        return error.detail
+    return None
+
+
+def validate_alert(alert: AlertBulkItem, prices: dict[UUID, float | None]) -> str | None:
+    """Check alert of bulk request.
+
+    Args:
+        alert: AlertBulkItem - alert for create.
+        prices: dict[UUID, float | None] - current prices by coin id.
+
+    Returns:
+        str | None: error message or None if alert is correct.
+    """
+    error = validate_alert_fields(alert)
+    if error is not None:
+        return error
+    if alert.coin_id not in prices:
+        return 'Монета не найдена в базе данных!'
+    if prices[alert.coin_id] is None:
+        return 'Не удалось получить текущую цену монеты'
+    return None
+
+
+def prepare_alerts(
+    alerts: list[AlertBulkItem],
+    prices: dict[UUID, float | None],
+) -> tuple[list[AlertBulkResult], list[dict]]:
+    """Validate alerts and build rows for insert.
+
+    Results of correct alerts are marked as created until insert shows existing ones.
+
+    Args:
+        alerts: list[AlertBulkItem] - alerts for create.
+        prices: dict[UUID, float | None] - current prices by coin id.
+
+    Returns:
+        tuple[list[AlertBulkResult], list[dict]]: results in alerts order and rows for insert.
+    """
+    alert_results = []
+    rows = []
+    for alert in alerts:
+        error = validate_alert(alert, prices)
+        if error is not None:
+            alert_results.append(AlertBulkResult(status='invalid', detail=error))
+            continue
+        alert_id = uuid4()
+        alert_type = INC_ALERT if alert.threshold_price > prices[alert.coin_id] else DEC_ALERT
+        alert_results.append(AlertBulkResult(status='created', id=alert_id))
+        rows.append({
+            'id': alert_id,
+            'coin_id': alert.coin_id,
+            'email': alert.email,
+            'threshold_price': alert.threshold_price,
+            'alert_type': alert_type,
+        })
+    return alert_results, rows
+
+
+async def insert_alerts(rows: list[dict], db: AsyncSession) -> set[UUID]:
+    """Insert alerts skipping existing ones.
+
+    Args:
+        rows: list[dict] - alerts rows.
+        db: AsyncSession - db session.
+
+    Returns:
+        set[UUID]: ids of inserted alerts.
+    """
+    inserted = set()
+    for start in range(0, len(rows), BULK_CHUNK_SIZE):
+        query = await db.execute(
+            insert(Alert).values(
+                rows[start:start + BULK_CHUNK_SIZE],
+            ).on_conflict_do_nothing(
+                constraint='coin_alert_type',
+            ).returning(Alert.id),
+        )
+        inserted.update(query.scalars().all())
+    return inserted
+
+
+@router.post('/alerts/bulk', response_model=AlertsBulkRead, status_code=status.HTTP_200_OK)
+async def create_alerts(
+    alerts: AlertsBulkCreate,
+    db: AsyncSession = Depends(get_session),
+) -> AlertsBulkRead:
+    """Create many alerts, price of each coin is taken once.
+
+    Args:
+        alerts: AlertsBulkCreate - Pydantic model with alerts for create.
+        db: AsyncSession, optional - db session. Defaults to Depends(get_session).
+
+    Returns:
+        AlertsBulkRead: result of each alert: created, exists or invalid.
+    """
+    prices = await get_coins_prices({alert.coin_id for alert in alerts.alerts}, db)
+    alert_results, rows = prepare_alerts(alerts.alerts, prices)
+    inserted = await insert_alerts(rows, db)
+    await db.commit()
+    for row in rows:
+        if row['id'] in inserted:
+            alert_index.add(AlertEntry(**row))
+    for alert_result in alert_results:
+        if alert_result.id is not None and alert_result.id not in inserted:
+            alert_result.status = 'exists'
+            alert_result.id = None
+    return AlertsBulkRead(alerts=alert_results)
+
+
+@router.delete('/alerts/bulk', response_model=AlertsBulkRead, status_code=status.HTTP_200_OK)
+async def delete_alerts(
+    alerts: AlertsBulkDelete,
+    db: AsyncSession = Depends(get_session),
+) -> AlertsBulkRead:
+    """Delete many alerts by ids.
+
+    Args:
+        alerts: AlertsBulkDelete - Pydantic model with ids of alerts for delete.
+        db: AsyncSession, optional - db session. Defaults to Depends(get_session).
+
+    Returns:
+        AlertsBulkRead: result of each id: deleted or not_found.
+    """
+    deleted = set()
+    for start in range(0, len(alerts.ids), BULK_CHUNK_SIZE):
+        query = await db.execute(
+            delete(Alert).where(
+                Alert.id.in_(alerts.ids[start:start + BULK_CHUNK_SIZE]),
+            ).returning(Alert.id),
+        )
+        deleted.update(query.scalars().all())
+    await db.commit()
+    for deleted_id in deleted:
+        alert_index.remove(deleted_id)
+    return AlertsBulkRead(
+        alerts=[
+            AlertBulkResult(status='deleted' if alert_id in deleted else 'not_found', id=alert_id)
+            for alert_id in alerts.ids
+        ],
+    )
@@ -1,20 +1,36 @@
 """Module with Coin API views."""
 
+from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api_models.coin_models import (CoinCreate, CoinPriceRead, CoinRead,
-                                    CoinsRead, Price)
-from models import Alert, Coin, CoinPrice
+from api_models.coin_models import (Candle, CoinCreate, CoinPriceRead,
+                                    CoinRead, CoinsRead, Price)
+from models import Alert, Coin, CoinLatestPrice, CoinPrice, CoinPriceRollup
+from utils import price_cache, rollups
 from utils.db_utils import get_session
+from utils.pagination import PageParams, decode_cursor, paginate, split_page
 from utils.validators import check_coin_name, validate_timestamps
 
 router = APIRouter()
 
 
+@dataclass
+class PricesParams:
+    """Query parameters of coin prices.
+
+    Timestamps default to the last 5 minutes, without resolution raw prices are returned.
+    """
+
+    start_timestamp: float | None = None
+    end_timestamp: float | None = None
+    resolution: str | None = None
+
+
 async def get_coin(coin_id: UUID, db: AsyncSession) -> Coin:
     """Get Coin by id.
 
@@ -36,7 +52,9 @@ async def get_coin(coin_id: UUID, db: AsyncSession) -> Coin:
 
 
 async def get_current_coin_price(coin_name: str, db: AsyncSession) -> float:
-    """Get last coin price from database.
+    """Get last coin price saved by the price poller.
+
+    Price is taken from the in-process cache, db is used on cache miss.
 
     Args:
         coin_name: str - Name of coin.
@@ -48,16 +66,17 @@ async def get_current_coin_price(coin_name: str, db: AsyncSession) -> float:
     Returns:
         float: coin price.
     """
+    cached_price = price_cache.get_price(coin_name)
+    if cached_price is not None:
+        return cached_price
     query = await db.execute(
         select(
-            CoinPrice.price,
+            CoinLatestPrice.price,
         ).join(
-            Coin, Coin.id == CoinPrice.coin_id,
+            Coin, Coin.id == CoinLatestPrice.coin_id,
         ).where(
             Coin.name == coin_name.upper(),
-        ).order_by(
-            CoinPrice.timedate.desc(),
-        ).limit(1),
+        ),
     )
     price = query.scalars().first()
     if price:
@@ -86,6 +105,64 @@ async def get_coin_data_pretty(name: str, db: AsyncSession) -> tuple | str:
     return coin, current_price
 
 
+def get_candle(rollup: CoinPriceRollup) -> Candle:
+    """Convert rollup bucket to candle.
+
+    Args:
+        rollup: CoinPriceRollup - rollup bucket.
+
+    Returns:
+        Candle: Pydantic model with fields for read.
+    """
+    return Candle(
+        timedate=rollup.bucket,
+        open=rollup.open_price,
+        high=rollup.high_price,
+        low=rollup.low_price,
+        close=rollup.close_price,
+        count=rollup.ticks_count,
+    )
+
+
+async def get_prices_page(
+    coin_id: UUID,
+    period: tuple[datetime, datetime],
+    page: PageParams,
+    db: AsyncSession,
+) -> tuple[list[Price], str | None]:
+    """Get page of coin prices of period ordered by time.
+
+    Args:
+        coin_id: UUID - coin id.
+        period: tuple[datetime, datetime] - period start and end.
+        page: PageParams - page cursor and size.
+        db: AsyncSession - db session.
+
+    Returns:
+        tuple[list[Price], str | None]: prices and next page cursor.
+    """
+    after_key = decode_cursor(page.after, datetime.fromisoformat, UUID) if page.after else None
+    start_datetime, end_datetime = period
+    query = await db.execute(
+        paginate(
+            select(CoinPrice).filter(
+                CoinPrice.coin_id == coin_id,
+                CoinPrice.timedate >= start_datetime,
+                CoinPrice.timedate <= end_datetime,
+            ),
+            (CoinPrice.timedate, CoinPrice.id),
+            after_key,
+            page.limit,
+        ),
+    )
+    prices, next_cursor = split_page(
+        query.scalars().all(),
+        page.limit,
+        lambda row: (row.timedate, row.id),
+    )
+    return [Price(price=price.price, timedate=price.timedate) for price in prices], next_cursor
+
+
 @router.post('/coins/', response_model=CoinRead, status_code=status.HTTP_201_CREATED)
 async def create_coin(coin: CoinCreate, db: AsyncSession = Depends(get_session)) -> CoinRead:
     """Create new Coin.
@@ -109,6 +186,7 @@ async def create_coin(coin: CoinCreate, db: AsyncSession = Depends(get_session))
     db_coin = Coin(name=coin.name.upper())
     db.add(db_coin)
     await db.commit()
+    price_cache.invalidate()
     await db.refresh(db_coin)
     return CoinRead(
         id=db_coin.id,
@@ -117,17 +195,22 @@ async def create_coin(coin: CoinCreate, db: AsyncSession = Depends(get_session))
 
 
 @router.get('/coins/', response_model=CoinsRead)
-async def read_coins(db: AsyncSession = Depends(get_session)) -> CoinsRead:
-    """Get list of all Coins.
+async def read_coins(
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_session),
+) -> CoinsRead:
+    """Get page of Coins ordered by id.
 
     Args:
+        page: PageParams, optional - page cursor and size. Defaults to Depends() (first page).
         db: AsyncSession, optional - db session. Defaults to Depends(get_session).
 
     Returns:
         CoinsRead: Pydantic model with fields for read.
     """
-    query = await db.execute(select(Coin))
-    coins = query.scalars().all()
+    after_key = decode_cursor(page.after, UUID) if page.after else None
+    query = await db.execute(paginate(select(Coin), (Coin.id,), after_key, page.limit))
+    coins, next_cursor = split_page(query.scalars().all(), page.limit, lambda row: (row.id,))
     coins_list = []
     for coin in coins:
         coins_list.append(
@@ -136,26 +219,29 @@ async def read_coins(db: AsyncSession = Depends(get_session)) -> CoinsRead:
                 name=coin.name,
             ),
         )
-    return CoinsRead(coins=coins_list)
+    return CoinsRead(coins=coins_list, next_cursor=next_cursor)
 
 
 @router.get('/coins/{coin_id}', response_model=CoinPriceRead)
 async def read_coin(
     coin_id: str,
-    start_timestamp: float = None,
-    end_timestamp: float = None,
+    prices_params: PricesParams = Depends(),
+    page: PageParams = Depends(),
     db: AsyncSession = Depends(get_session),
 ) -> CoinPriceRead:
     """Get all data about Coin.
 
+    With resolution prices are returned as candles of the matching rollup,
+    otherwise raw prices are paginated.
+
     Args:
         coin_id: str - Coin id.
-        start_timestamp: float - start timestamp for find prices. Defaults to None (5 minutes ago).
-        end_timestamp: float - end timestamp for find prices. Defaults to None (now).
+        prices_params: PricesParams, optional - period and resolution. Defaults to Depends().
+        page: PageParams, optional - prices page cursor and size. Defaults to Depends().
         db: AsyncSession, optional - db session. Defaults to Depends(get_session).
 
     Raises:
-        HTTPException: when coin is not found in the database.
+        HTTPException: when coin id or resolution is wrong.
 
     Returns:
         CoinPriceRead: Pydantic model with fields for read coin data with prices.
@@ -164,21 +250,28 @@ async def read_coin(
         UUID(coin_id)
     except ValueError:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, 'Неверный id монеты')
-    start_datetime, end_datetime = await validate_timestamps(start_timestamp, end_timestamp)
-    coin = await get_coin(coin_id, db)
-    query = await db.execute(
-        select(CoinPrice).filter(
-            CoinPrice.coin_id == coin_id,
-            CoinPrice.timedate >= start_datetime,
-            CoinPrice.timedate <= end_datetime,
-        ),
+    resolution = prices_params.resolution
+    if resolution is not None and resolution not in rollups.RESOLUTIONS:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, 'Неверное разрешение свечей')
+    period = await validate_timestamps(
+        prices_params.start_timestamp,
+        prices_params.end_timestamp,
     )
-    prices = query.scalars().all()
+    coin = await get_coin(coin_id, db)
     query = await db.execute(select(Alert).filter(Alert.coin_id == coin_id))
-    alerts = query.scalars().all()
-    alert_ids = [alert.id for alert in alerts]
+    alert_ids = [alert.id for alert in query.scalars().all()]
+    if resolution is not None:
+        rollup = await rollups.get_candles(db, coin.id, resolution, period)
+        return CoinPriceRead(
+            name=coin.name,
+            alert_ids=alert_ids,
+            prices=[],
+            candles=[get_candle(bucket) for bucket in rollup],
+        )
+    prices, next_cursor = await get_prices_page(coin.id, period, page, db)
     return CoinPriceRead(
         name=coin.name,
         alert_ids=alert_ids,
-        prices=[Price(price=price.price, timedate=price.timedate) for price in prices],
+        prices=prices,
+        next_cursor=next_cursor,
     )
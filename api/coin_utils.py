@@ -1,7 +1,62 @@
 """Module with utils for coin API."""
 
+import asyncio
+from http import HTTPStatus
+
 import aiohttp
 
+from utils import rate_limiter
+from utils.constants import COIN_FETCH_TIMEOUT, OKX_API_URL
+from utils.http_utils import get_http_session
+
+INSTRUMENT_SUFFIX = '-USD-SWAP'
+
+
+def get_inst_id(name: str) -> str:
+    """Get okx instrument id for coin.
+
+    Args:
+        name: str - coin name.
+
+    Returns:
+        str: instrument id.
+    """
+    return f'{name.upper()}{INSTRUMENT_SUFFIX}'
+
+
+async def _get_json(url: str) -> dict:
+    """Make GET request to okx api within host rate limit.
+
+    Args:
+        url: str - request url.
+
+    Returns:
+        dict: decoded json response.
+    """
+    bucket = rate_limiter.get_bucket(url)
+    await bucket.acquire()
+    async with get_http_session().get(url) as response:
+        if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+            bucket.backoff(rate_limiter.parse_retry_after(response.headers.get('Retry-After')))
+        else:
+            bucket.succeed()
+        return await response.json()
+
+
+async def _get_data(url: str) -> list[dict]:
+    """Make GET request to okx api and get data of successful response.
+
+    Args:
+        url: str - request url.
+
+    Returns:
+        list[dict]: response data, empty if okx returned error.
+    """
+    response_data = await _get_json(url)
+    if response_data.get('code') != '0':
+        return []
+    return response_data.get('data') or []
+
 
 async def get_coin_data(name: str) -> dict:
     """Get coin data from okx api.
@@ -12,8 +67,62 @@ async def get_coin_data(name: str) -> dict:
     Returns:
         dict: response with coin data.
     """
-    inst_coin = f'{name.upper()}-USD-SWAP'
-    url = f'https://www.okx.com/api/v5/market/ticker?instId={inst_coin}'
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            return await response.json()
+    inst_coin = get_inst_id(name)
+    return await _get_json(f'{OKX_API_URL}/market/ticker?instId={inst_coin}')
+
+
+async def get_swap_tickers() -> dict[str, dict]:
+    """Get all USD swap tickers from okx api with one request.
+
+    Returns:
+        dict[str, dict]: ticker data by upper cased coin name.
+    """
+    tickers = {}
+    for ticker in await _get_data(f'{OKX_API_URL}/market/tickers?instType=SWAP'):
+        inst_id = ticker.get('instId', '')
+        if inst_id.endswith(INSTRUMENT_SUFFIX):
+            tickers[inst_id.removesuffix(INSTRUMENT_SUFFIX)] = ticker
+    return tickers
+
+
+async def get_swap_instruments() -> set[str]:
+    """Get names of all coins with USD swap instrument from okx api.
+
+    Returns:
+        set[str]: upper cased coin names, empty if request failed.
+    """
+    instruments = await _get_data(f'{OKX_API_URL}/public/instruments?instType=SWAP')
+    return {
+        instrument['instId'].removesuffix(INSTRUMENT_SUFFIX)
+        for instrument in instruments
+        if instrument.get('instId', '').endswith(INSTRUMENT_SUFFIX)
+    }
+
+
+async def get_coins_tickers(names: list[str]) -> dict[str, dict]:
+    """Get tickers for coins with one bulk request.
+
+    Coins missing in the bulk response are requested one by one.
+    Every request is limited by COIN_FETCH_TIMEOUT, coins which failed are skipped.
+
+    Args:
+        names: list[str] - coins names.
+
+    Returns:
+        dict[str, dict]: ticker data by upper cased coin name.
+    """
+    try:
+        swap_tickers = await asyncio.wait_for(get_swap_tickers(), COIN_FETCH_TIMEOUT)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        swap_tickers = {}
+    names = [name.upper() for name in names]
+    tickers = {name: swap_tickers[name] for name in names if name in swap_tickers}
+    missing = [name for name in names if name not in tickers]
+    responses = await asyncio.gather(
+        *[asyncio.wait_for(get_coin_data(name), COIN_FETCH_TIMEOUT) for name in missing],
+        return_exceptions=True,
+    )
+    for name, coin_data in zip(missing, responses):
+        if isinstance(coin_data, dict) and coin_data.get('code') == '0' and coin_data['data']:
+            tickers[name] = coin_data['data'][0]
+    return tickers
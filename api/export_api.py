@@ -0,0 +1,149 @@
+"""Module with streaming export of coin prices."""
+
+import json
+from datetime import datetime
+from typing import AsyncIterator, Callable
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, responses
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.coin_api import get_coin
+from models import CoinPrice
+from utils.constants import EXPORT_CHUNK_SIZE
+from utils.db_utils import SessionLocal, get_session
+from utils.validators import validate_timestamps
+
+router = APIRouter()
+
+CSV_HEADER = 'price,timedate\n'
+
+
+def format_ndjson(price: float, timedate: datetime) -> str:
+    """Format price as NDJSON line.
+
+    Args:
+        price: float - coin price.
+        timedate: datetime - price time.
+
+    Returns:
+        str: JSON object line.
+    """
+    price_data = json.dumps({'price': price, 'timedate': timedate.isoformat()})
+    return f'{price_data}\n'
+
+
+def format_csv(price: float, timedate: datetime) -> str:
+    """Format price as CSV line.
+
+    Args:
+        price: float - coin price.
+        timedate: datetime - price time.
+
+    Returns:
+        str: CSV line.
+    """
+    return f'{price},{timedate.isoformat()}\n'
+
+
+async def stream_prices(
+    coin_id: UUID,
+    period: tuple[datetime, datetime],
+    format_row: Callable[[float, datetime], str],
+) -> AsyncIterator[str]:
+    """Stream coin prices of period with server-side cursor.
+
+    Own session is used because request session is closed
+    before response streaming starts.
+
+    Args:
+        coin_id: UUID - coin id.
+        period: tuple[datetime, datetime] - period start and end.
+        format_row: Callable[[float, datetime], str] - price formatter.
+
+    Yields:
+        str: formatted chunk of prices.
+    """
+    start, end = period
+    async with SessionLocal() as session:
+        rows = await session.stream(
+            select(
+                CoinPrice.price,
+                CoinPrice.timedate,
+            ).where(
+                CoinPrice.coin_id == coin_id,
+                CoinPrice.timedate >= start,
+                CoinPrice.timedate <= end,
+            ).order_by(
+                CoinPrice.timedate,
+            ).execution_options(yield_per=EXPORT_CHUNK_SIZE),
+        )
+        async for chunk in rows.partitions():
+            yield ''.join(format_row(price, timedate) for price, timedate in chunk)
+
+
+async def csv_stream(rows: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Add CSV header to rows stream.
+
+    Args:
+        rows: AsyncIterator[str] - CSV rows chunks.
+
+    Yields:
+        str: header and rows chunks.
+    """
+    yield CSV_HEADER
+    async for chunk in rows:
+        yield chunk
+
+
+@router.get('/coins/{coin_id}/prices.ndjson')
+async def export_prices_ndjson(
+    coin_id: UUID,
+    start_timestamp: float = None,
+    end_timestamp: float = None,
+    db: AsyncSession = Depends(get_session),
+) -> responses.StreamingResponse:
+    """Export coin prices as newline delimited JSON.
+
+    Args:
+        coin_id: UUID - Coin id.
+        start_timestamp: float - start timestamp for find prices. Defaults to None (5 minutes ago).
+        end_timestamp: float - end timestamp for find prices. Defaults to None (now).
+        db: AsyncSession, optional - db session. Defaults to Depends(get_session).
+
+    Returns:
+        responses.StreamingResponse: prices stream.
+    """
+    period = await validate_timestamps(start_timestamp, end_timestamp)
+    await get_coin(coin_id, db)
+    return responses.StreamingResponse(
+        stream_prices(coin_id, period, format_ndjson),
+        media_type='application/x-ndjson',
+    )
+
+
+@router.get('/coins/{coin_id}/prices.csv')
+async def export_prices_csv(
+    coin_id: UUID,
+    start_timestamp: float = None,
+    end_timestamp: float = None,
+    db: AsyncSession = Depends(get_session),
+) -> responses.StreamingResponse:
+    """Export coin prices as CSV with header.
+
+    Args:
+        coin_id: UUID - Coin id.
+        start_timestamp: float - start timestamp for find prices. Defaults to None (5 minutes ago).
+        end_timestamp: float - end timestamp for find prices. Defaults to None (now).
+        db: AsyncSession, optional - db session. Defaults to Depends(get_session).
+
+    Returns:
+        responses.StreamingResponse: prices stream.
+    """
+    period = await validate_timestamps(start_timestamp, end_timestamp)
+    await get_coin(coin_id, db)
+    return responses.StreamingResponse(
+        csv_stream(stream_prices(coin_id, period, format_csv)),
+        media_type='text/csv',
+    )
@@ -0,0 +1,17 @@
+"""Module with metrics API view."""
+
+from fastapi import APIRouter
+
+from utils.metrics import get_metrics
+
+router = APIRouter()
+
+
+@router.get('/metrics')
+async def read_metrics() -> dict:
+    """Get app metrics.
+
+    Returns:
+        dict: counters, gauges and histograms.
+    """
+    return get_metrics()
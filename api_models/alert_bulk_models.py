@@ -0,0 +1,42 @@
+"""Module with pydantic models of bulk Alert requests."""
+
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from api_models.alert_models import AlertBase
+
+BULK_ALERTS_LIMIT = 50000
+
+
+class AlertBulkItem(AlertBase):
+    """Model for alert of bulk create, validated by the endpoint to report errors per item."""
+
+    coin_id: UUID
+
+
+class AlertsBulkCreate(BaseModel):
+    """Model for create many alerts."""
+
+    alerts: list[AlertBulkItem] = Field(max_length=BULK_ALERTS_LIMIT)
+
+
+class AlertsBulkDelete(BaseModel):
+    """Model for delete many alerts."""
+
+    ids: list[UUID] = Field(max_length=BULK_ALERTS_LIMIT)
+
+
+class AlertBulkResult(BaseModel):
+    """Model for result of one item of bulk request."""
+
+    status: Literal['created', 'exists', 'invalid', 'deleted', 'not_found']
+    id: UUID | None = None
+    detail: str | None = None
+
+
+class AlertsBulkRead(BaseModel):
+    """Model for return bulk request results in items order."""
+
+    alerts: list[AlertBulkResult]
@@ -1,6 +1,7 @@
 """Module with pydantic Alert modules."""
 
-from typing import Optional
+from dataclasses import dataclass
+from typing import Literal, Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -70,6 +71,7 @@ class AlertsRead(BaseModel):
     """Model for return list of alerts."""
 
     alerts: list[AlertRead]
+    next_cursor: str | None = None
 
 
 class AlertUpdate(BaseModel):
@@ -111,3 +113,14 @@ class AlertUpdate(BaseModel):
             str: email
         """
         return validate_email(email_value)
+
+
+@dataclass
+class AlertFilters:
+    """Query parameters for filtering alerts, unset filters are skipped."""
+
+    email: str | None = None
+    coin_id: UUID | None = None
+    alert_type: Literal['inc', 'dec'] | None = None
+    min_price: float | None = None
+    max_price: float | None = None
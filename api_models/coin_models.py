@@ -26,6 +26,7 @@ class CoinsRead(BaseModel):
     """Model for return list of coins."""
 
     coins: list[CoinRead]
+    next_cursor: str | None = None
 
 
 class Price(BaseModel):
@@ -35,9 +36,22 @@ class Price(BaseModel):
     timedate: datetime
 
 
+class Candle(BaseModel):
+    """Model for return coin prices of a time bucket."""
+
+    timedate: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    count: int
+
+
 class CoinPriceRead(BaseModel):
     """Model for return coin with prices."""
 
     name: str
     alert_ids: list[UUID]
     prices: list[Price]
+    candles: list[Candle] | None = None
+    next_cursor: str | None = None
@@ -0,0 +1,143 @@
+"""Benchmark of exchange calls with per-call and shared HTTP sessions.
+
+Runs a local stub exchange and polls it like the price poller does.
+Every new connection accepted by the stub is one TCP (and TLS) handshake.
+
+Usage:
+    python -m benchmarks.http_client_benchmark --coins 200 --cycles 10
+
+TLS handshakes are measured with `--certfile` and `--keyfile` of a
+certificate issued for `localhost` and trusted via `SSL_CERT_FILE`.
+"""
+
+import argparse
+import asyncio
+import ssl
+import sys
+import time
+
+from aiohttp import ClientSession, web
+
+from api import coin_utils
+from utils import rate_limiter
+from utils.http_utils import close_http_session
+
+STUB_HOST = 'localhost'
+DEFAULT_COINS = 200
+DEFAULT_CYCLES = 10
+MS_IN_SECOND = 1000
+TICKER_PATH = '/api/v5/market/ticker'
+
+
+def get_unlimited_bucket(url: str) -> rate_limiter.TokenBucket:
+    """Get disabled rate limiter, so shared mode is compared without exchange limit.
+
+    Args:
+        url: str - request url.
+
+    Returns:
+        rate_limiter.TokenBucket: bucket which never waits.
+    """
+    return rate_limiter.TokenBucket(0, 0)
+
+
+async def ticker_handler(request: web.Request) -> web.Response:
+    """Stub of the okx ticker endpoint.
+
+    Args:
+        request: web.Request - client request.
+
+    Returns:
+        web.Response: ticker response.
+    """
+    request.app['transports'].add(request.transport)
+    ticker = {'instId': request.query.get('instId'), 'last': '1.0'}
+    return web.json_response({'code': '0', 'data': [ticker]})
+
+
+async def start_stub(ssl_context: ssl.SSLContext | None) -> tuple[web.AppRunner, str]:
+    """Start stub exchange server.
+
+    Args:
+        ssl_context: ssl.SSLContext | None - server TLS context.
+
+    Returns:
+        tuple[web.AppRunner, str]: server runner and api url.
+    """
+    stub_app = web.Application()
+    stub_app['transports'] = set()
+    stub_app.router.add_get(TICKER_PATH, ticker_handler)
+    runner = web.AppRunner(stub_app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, STUB_HOST, 0, ssl_context=ssl_context)
+    await site.start()
+    port = runner.addresses[0][1]
+    scheme = 'https' if ssl_context else 'http'
+    return runner, f'{scheme}://{STUB_HOST}:{port}/api/v5'
+
+
+async def get_coin_data_per_call(url: str, name: str) -> dict:
+    """Previous implementation: new session for every call.
+
+    Args:
+        url: str - api url.
+        name: str - coin name.
+
+    Returns:
+        dict: response with coin data.
+    """
+    async with ClientSession() as session:
+        async with session.get(f'{url}/market/ticker?instId={name}-USD-SWAP') as response:
+            return await response.json()
+
+
+async def run_mode(mode: str, args: argparse.Namespace, stub: web.AppRunner, url: str) -> None:
+    """Run poll cycles and write results.
+
+    Args:
+        mode: str - `per-call` or `shared`.
+        args: argparse.Namespace - benchmark arguments.
+        stub: web.AppRunner - stub server runner.
+        url: str - stub api url.
+    """
+    names = [f'COIN{index}' for index in range(args.coins)]
+    transports = stub.app['transports']
+    transports.clear()
+    started = time.perf_counter()
+    for _ in range(args.cycles):
+        if mode == 'shared':
+            await asyncio.gather(*[coin_utils.get_coin_data(name) for name in names])
+        else:
+            await asyncio.gather(*[get_coin_data_per_call(url, name) for name in names])
+    cycle_ms = (time.perf_counter() - started) / args.cycles * MS_IN_SECOND
+    handshakes = len(transports) / args.cycles
+    await close_http_session()
+    report = f'{mode:>8}: {handshakes:8.1f} handshakes/cycle, {cycle_ms:8.1f} ms/cycle'
+    sys.stdout.write(f'{report}\n')
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run benchmark for both modes.
+
+    Args:
+        args: argparse.Namespace - benchmark arguments.
+    """
+    ssl_context = None
+    if args.certfile:
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(args.certfile, args.keyfile)
+    stub, url = await start_stub(ssl_context)
+    coin_utils.OKX_API_URL = url
+    rate_limiter.get_bucket = get_unlimited_bucket
+    for mode in ('per-call', 'shared'):
+        await run_mode(mode, args, stub, url)
+    await stub.cleanup()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--coins', type=int, default=DEFAULT_COINS)
+    parser.add_argument('--cycles', type=int, default=DEFAULT_CYCLES)
+    parser.add_argument('--certfile')
+    parser.add_argument('--keyfile')
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,235 @@
+"""Benchmark of latest coin prices lookup for the index page.
+
+Seeds a separate schema of the configured database with `generate_series`
+and compares one query per coin, one LATERAL query over the prices history
+and `main.get_coins_data` which reads the `coin_latest_price` table.
+Seeding 100M rows takes a while, pass `--keep` to reuse seeded data
+in the next run. Pass `--explain` to also write `EXPLAIN (ANALYZE, BUFFERS)`
+plans of the per coin and LATERAL queries.
+
+Usage:
+    python -m benchmarks.latest_price_benchmark --coins 1000 --rows 100000000 --explain
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from types import MappingProxyType
+from uuid import UUID
+
+from sqlalchemy import Select, select, text, true
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import (AsyncConnection, AsyncSession,
+                                    create_async_engine)
+
+from main import get_coins_data
+from models import Base, Coin, CoinPrice
+from utils.db_utils import load_async_db
+
+SCHEMA = 'latest_price_benchmark'
+DEFAULT_COINS = 1000
+DEFAULT_ROWS = 100000000
+DEFAULT_REPEAT = 5
+MS_IN_SECOND = 1000
+SEED_COINS = """
+INSERT INTO coins (id, name)
+SELECT gen_random_uuid(), 'BENCH' || n FROM generate_series(1, :coins) AS n
+"""
+SEED_PRICES = """
+INSERT INTO coins_prices (id, coin_id, price, timedate)
+SELECT gen_random_uuid(), coins.id, random() * 100, now() - n * interval '2 seconds'
+FROM generate_series(1, :per_coin) AS n CROSS JOIN coins
+"""
+SEED_LATEST = """
+INSERT INTO coin_latest_price (coin_id, price, timedate)
+SELECT DISTINCT ON (coin_id) coin_id, price, timedate FROM coins_prices
+ORDER BY coin_id, timedate DESC
+"""
+
+
+def get_coin_price_query(coin_id: UUID) -> Select:
+    """Get query of the latest price of one coin.
+
+    Args:
+        coin_id: UUID - coin id.
+
+    Returns:
+        Select: latest price query.
+    """
+    return select(
+        CoinPrice.price,
+    ).where(
+        CoinPrice.coin_id == coin_id,
+    ).order_by(
+        CoinPrice.timedate.desc(),
+    ).limit(1)
+
+
+def get_lateral_query() -> Select:
+    """Get query of all coins names and their latest prices with LATERAL join.
+
+    Returns:
+        Select: coins names and prices query.
+    """
+    latest_price = select(
+        CoinPrice.price,
+    ).where(
+        CoinPrice.coin_id == Coin.id,
+    ).order_by(
+        CoinPrice.timedate.desc(),
+    ).limit(1).lateral()
+    return select(
+        Coin.name,
+        latest_price.c.price,
+    ).outerjoin(
+        latest_price, true(),
+    ).order_by(Coin.name)
+
+
+async def get_coins_data_per_coin(db: AsyncSession) -> list[dict]:
+    """Get coins names and prices with one query per coin.
+
+    Args:
+        db: AsyncSession - db session.
+
+    Returns:
+        list[dict]: list of dicts with coin name and price.
+    """
+    coins_data = []
+    coins = await db.execute(select(Coin).order_by(Coin.name))
+    for coin in coins.scalars().all():
+        price = await db.execute(get_coin_price_query(coin.id))
+        coins_data.append({'name': coin.name, 'price': price.scalar()})
+    return coins_data
+
+
+async def get_coins_data_lateral(db: AsyncSession) -> list[dict]:
+    """Get coins names and prices with one LATERAL query over prices history.
+
+    Args:
+        db: AsyncSession - db session.
+
+    Returns:
+        list[dict]: list of dicts with coin name and price.
+    """
+    query = await db.execute(get_lateral_query())
+    return [{'name': name, 'price': price} for name, price in query.all()]
+
+
+async def write_plans(db: AsyncSession) -> None:
+    """Write execution plans of the query of the first coin price and the LATERAL query.
+
+    Args:
+        db: AsyncSession - db session.
+    """
+    coin_id = await db.scalar(select(Coin.id).order_by(Coin.name).limit(1))
+    for query in (get_coin_price_query(coin_id), get_lateral_query()):
+        compiled = query.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={'literal_binds': True},
+        )
+        plan = await db.execute(text(f'EXPLAIN (ANALYZE, BUFFERS) {compiled}'))
+        plan_lines = '\n'.join(plan.scalars().all())
+        sys.stdout.write(f'\n{plan_lines}\n')
+
+
+async def prepare(connection: AsyncConnection) -> None:
+    """Create benchmark schema and tables, use schema for connection queries.
+
+    All benchmark prices are kept in the default partition.
+
+    Args:
+        connection: AsyncConnection - db connection.
+    """
+    await connection.execute(text(f'CREATE SCHEMA IF NOT EXISTS {SCHEMA}'))
+    await connection.execute(text(f'SET search_path TO {SCHEMA}'))
+    await connection.run_sync(Base.metadata.create_all)
+    await connection.execute(
+        text('CREATE TABLE IF NOT EXISTS coins_prices_default PARTITION OF coins_prices DEFAULT'),
+    )
+
+
+async def seed(connection: AsyncConnection, args: argparse.Namespace) -> None:
+    """Fill benchmark tables with prices if they are empty.
+
+    Args:
+        connection: AsyncConnection - connection with benchmark search path.
+        args: argparse.Namespace - benchmark arguments.
+    """
+    seeded = await connection.execute(select(Coin.id).limit(1))
+    if seeded.first() is not None:
+        return
+    await connection.execute(text(SEED_COINS), {'coins': args.coins})
+    await connection.execute(text(SEED_PRICES), {'per_coin': args.rows // args.coins})
+    await connection.execute(text(SEED_LATEST))
+    await connection.execute(text('ANALYZE coins, coins_prices, coin_latest_price'))
+
+
+async def measure(session: AsyncSession, get_data, repeat: int) -> float:
+    """Get best time of coins data loading.
+
+    Args:
+        session: AsyncSession - db session.
+        get_data: loader of coins data.
+        repeat: int - number of runs.
+
+    Returns:
+        float: best run time in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await get_data(session)
+        timings.append(time.perf_counter() - started)
+    return min(timings) * MS_IN_SECOND
+
+
+LOADERS = MappingProxyType({
+    'query per coin': get_coins_data_per_coin,
+    'lateral query': get_coins_data_lateral,
+    'latest price table': get_coins_data,
+})
+
+
+async def run(connection: AsyncConnection, args: argparse.Namespace) -> None:
+    """Seed benchmark schema and write results.
+
+    Args:
+        connection: AsyncConnection - db connection.
+        args: argparse.Namespace - benchmark arguments.
+    """
+    await prepare(connection)
+    await seed(connection, args)
+    await connection.commit()
+    async with AsyncSession(bind=connection) as session:
+        for name, get_data in LOADERS.items():
+            timing = await measure(session, get_data, args.repeat)
+            sys.stdout.write(f'{name:>18}: {timing:10.1f} ms\n')
+        if args.explain:
+            await write_plans(session)
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run benchmark, drop benchmark schema unless `--keep` is passed.
+
+    Args:
+        args: argparse.Namespace - benchmark arguments.
+    """
+    engine = create_async_engine(load_async_db())
+    async with engine.connect() as connection:
+        await run(connection, args)
+        if not args.keep:
+            await connection.execute(text(f'DROP SCHEMA {SCHEMA} CASCADE'))
+            await connection.commit()
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--coins', type=int, default=DEFAULT_COINS)
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS)
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--keep', action='store_true')
+    parser.add_argument('--explain', action='store_true')
+    asyncio.run(main(parser.parse_args()))
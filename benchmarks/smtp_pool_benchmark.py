@@ -0,0 +1,102 @@
+"""Benchmark of email sending with a connection per message and with SMTP pool.
+
+Runs a local `aiosmtpd` sink server which accepts and drops messages.
+
+Usage:
+    python -m benchmarks.smtp_pool_benchmark --messages 1000 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+import aiosmtplib
+from aiosmtpd.controller import Controller
+
+from tests.smtp_sink import SINK_HOST, SinkHandler, get_free_port, make_message
+from utils.smtp_pool import SMTPPool
+
+DEFAULT_MESSAGES = 1000
+DEFAULT_CONCURRENCY = 10
+
+
+async def send_one(
+    index: int,
+    semaphore: asyncio.Semaphore,
+    controller: Controller,
+    pool: SMTPPool | None,
+) -> None:
+    """Send one test message.
+
+    Args:
+        index: int - message number.
+        semaphore: asyncio.Semaphore - limit of messages sent at the same time.
+        controller: Controller - sink server controller.
+        pool: SMTPPool | None - pool, connection per message if None.
+    """
+    async with semaphore:
+        if pool is None:
+            await aiosmtplib.send(
+                make_message(index),
+                hostname=controller.hostname,
+                port=controller.port,
+                start_tls=False,
+            )
+        else:
+            await pool.send(make_message(index))
+
+
+async def send_all(
+    args: argparse.Namespace,
+    controller: Controller,
+    pool: SMTPPool | None,
+) -> None:
+    """Send messages and write results.
+
+    Args:
+        args: argparse.Namespace - benchmark arguments.
+        controller: Controller - sink server controller.
+        pool: SMTPPool | None - pool, connection per message if None.
+    """
+    semaphore = asyncio.Semaphore(args.concurrency)
+    sink = controller.handler
+    sink.sessions.clear()
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        send_one(index, semaphore, controller, pool) for index in range(args.messages)
+    ])
+    rate = args.messages / (time.perf_counter() - started)
+    mode = 'per-message' if pool is None else 'pool'
+    connections = len(sink.sessions)
+    report = f'{mode:>11}: {rate:8.1f} messages/s, {connections} connections'
+    sys.stdout.write(f'{report}\n')
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run benchmark for both modes.
+
+    Args:
+        args: argparse.Namespace - benchmark arguments.
+    """
+    controller = Controller(SinkHandler(), hostname=SINK_HOST, port=get_free_port())
+    controller.start()
+    pool = SMTPPool(
+        size=args.concurrency,
+        hostname=controller.hostname,
+        port=controller.port,
+        username=None,
+        password=None,
+        start_tls=False,
+    )
+    await send_all(args, controller, None)
+    await send_all(args, controller, pool)
+    await pool.close()
+    controller.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--messages', type=int, default=DEFAULT_MESSAGES)
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    asyncio.run(main(parser.parse_args()))
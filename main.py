@@ -1,6 +1,5 @@
 """FastAPI app for crypto alerts."""
 
-import asyncio
 from contextlib import asynccontextmanager
 
 import uvicorn
@@ -9,102 +8,36 @@ from fastapi import (Depends, FastAPI, Form, HTTPException, Request, responses,
 from sqlalchemy import Sequence, exc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api import alert_api, coin_api, coin_utils
-from models import Alert, Coin, CoinPrice
+from api import alert_api, alert_bulk_api, coin_api, export_api, metrics_api
+from models import Alert, Coin, CoinLatestPrice
+from utils import background, price_cache
+from utils.alert_index import alert_index
 from utils.constants import APP_HOST, APP_PORT
 from utils.db_utils import get_session
-from utils.email_utils import send_email
 from utils.validators import check_coin_name, validate_email
 
+alert_bulk_router = alert_bulk_api.router
 alert_router = alert_api.router
 coin_router = coin_api.router
-
-
-async def check_alerts_and_send_emails(
-    db: AsyncSession,
-    coin: Coin,
-    current_price: float,
-) -> AsyncSession:
-    """Alerts check and send emails if price reached expected value.
-
-    Args:
-        db: AsyncSession - db session.
-        coin: Coin - coin for price update.
-        current_price: float - current coin price.
-
-    Returns:
-        AsyncSession: updated db session.
-    """
-    alerts = await db.execute(
-        select(Alert).where(Alert.coin_id == coin.id),
-    )
-    alerts = alerts.scalars().all()
-    for alert in alerts:
-        increment = alert.alert_type == 'inc' and current_price >= alert.threshold_price
-        decrement = alert.alert_type == 'dec' and current_price <= alert.threshold_price
-        if (increment or decrement):
-            email_body = f"""Спешим сообщить!
-Цена {coin.name} достигла {current_price}.
-Вы получили это сообщение потому что подписались на обновление цены до {alert.threshold_price}.
-            """
-            await send_email(
-                'Ваша цена!',
-                alert.email,
-                email_body,
-            )
-            await db.delete(alert)
-    return db
-
-
-async def update_price_for_coin(coin: Coin) -> None:
-    """Get new price for coin.
-
-    Args:
-        coin: Coin - coin for price update.
-    """
-    async for session in get_session():
-        coin_data = await coin_utils.get_coin_data(coin.name)
-        if coin_data['code'] == '0' and coin_data['data']:
-            price_data = coin_data['data'][0]
-            current_price = float(price_data['last'])
-            new_price = CoinPrice(
-                coin_id=coin.id,
-                price=current_price,
-            )
-            session.add(new_price)
-            session = await check_alerts_and_send_emails(session, coin, current_price)
-        await session.commit()
-
-
-async def update_prices() -> None:
-    """Update prices for all coins."""
-    async for session in get_session():
-        coins = await session.execute(select(Coin))
-        coins = coins.scalars().all()
-    tasks = [update_price_for_coin(coin) for coin in coins]
-    await asyncio.gather(*tasks)
-
-
-async def periodic_function() -> None:
-    """Infinite loop for update prices."""
-    infinite = True
-    while infinite:
-        await update_prices()
-        await asyncio.sleep(2)
+export_router = export_api.router
+metrics_router = metrics_api.router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Background task starts at statrup.
 
+    Background tasks and shared clients are stopped at shutdown.
+
     Args:
         app: FastAPI - FasrAPI app instance.
 
     Yields:
         None
     """
-    asyncio.create_task(periodic_function())
+    await background.start_background_tasks()
     yield
+    await background.stop_background_tasks()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -114,32 +47,29 @@ templates = templating.Jinja2Templates(directory='templates')
 async def get_coins_data(db: AsyncSession) -> list[dict]:
     """Get coins names and prices.
 
+    Prices are taken from the in-process cache, db is used on cache miss.
+
     Args:
         db: AsyncSession - db session.
 
     Returns:
         list[dict]: list of dicts with coin name and price.
     """
-    coins_data = []
-    coins_result = await db.execute(select(Coin).order_by(Coin.name))
-    coins = coins_result.scalars().all()
-    for coin in coins:
-        price_result = await db.execute(
-            select(
-                CoinPrice,
-            ).where(
-                CoinPrice.coin_id == coin.id,
-            ).order_by(
-                CoinPrice.timedate.desc(),
-            ).limit(1),
-        )
-        price = price_result.scalars().first()
-        coin_data = {
-            'name': coin.name,
-            'price': price.price if price else 'Нет цены',
-        }
-        coins_data.append(coin_data)
-    return coins_data
+    cached_prices = price_cache.get_prices()
+    if cached_prices is not None:
+        return [{'name': name, 'price': price} for name, price in cached_prices]
+    query = await db.execute(
+        select(
+            Coin.name,
+            CoinLatestPrice.price,
+        ).outerjoin(
+            CoinLatestPrice, CoinLatestPrice.coin_id == Coin.id,
+        ).order_by(Coin.name),
+    )
+    return [
+        {'name': name, 'price': 'Нет цены' if price is None else price}
+        for name, price in query.all()
+    ]
 
 
 async def get_all_coins(db: AsyncSession) -> Sequence[Coin]:
@@ -182,6 +112,27 @@ async def root(
     )
 
 
+async def save_alert(new_alert: Alert, db: AsyncSession) -> str:
+    """Save subscription alert.
+
+    Args:
+        new_alert: Alert - alert for save.
+        db: AsyncSession - db session.
+
+    Returns:
+        str: message about subscription.
+    """
+    db.add(new_alert)
+    try:
+        await db.commit()
+    except exc.IntegrityError:
+        await db.rollback()
+        return 'Такая подписка уже оформлена!'
+    await db.refresh(new_alert)
+    alert_index.add(new_alert)
+    return 'Подписка оформлена успешно'
+
+
 @app.post('/subscribe')
 async def subscribe(
     request: Request,
@@ -223,14 +174,7 @@ async def subscribe(
             threshold_price=threshold_price,
             alert_type=alert_type,
         )
-        db.add(new_alert)
-        try:
-            await db.commit()
-        except exc.IntegrityError:
-            messages = {subscribe_message_literal: 'Такая подписка уже оформлена!'}
-            await db.rollback()
-        else:
-            messages = {subscribe_message_literal: 'Подписка оформлена успешно'}
+        messages = {subscribe_message_literal: await save_alert(new_alert, db)}
     return await root(request, db, messages)
 
 
@@ -257,6 +201,7 @@ async def add_coin(
         new_coin = Coin(name=name)
         db.add(new_coin)
         await db.commit()
+        price_cache.invalidate()
         messages = {'add_message': 'Монета успешно добавлена!'}
     elif coin_in_db:
         messages = {'add_message': 'Монета с таким именем уже существует в базе данных!'}
@@ -265,8 +210,11 @@ async def add_coin(
     return await root(request, db, messages)
 
 
+app.include_router(alert_bulk_router)
 app.include_router(alert_router)
 app.include_router(coin_router)
+app.include_router(export_router)
+app.include_router(metrics_router)
 
 
 if __name__ == '__main__':
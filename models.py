@@ -3,15 +3,21 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, UniqueConstraint
+from sqlalchemy import (DateTime, Float, ForeignKey, Index, Integer, String,
+                        Text, UniqueConstraint)
 from sqlalchemy.orm import (DeclarativeBase, Mapped, mapped_column,
                             relationship, validates)
 
+from utils.instruments import is_listed
 from utils.time_utils import get_current_datetime
-from utils.validators import check_coin_name, validate_email
+from utils.validators import validate_email
 
 NAME_FIELD_LENGTH = 50
 ALERT_FIELD_LENGTH = 3
+SUBJECT_FIELD_LENGTH = 255
+RESOLUTION_FIELD_LENGTH = 3
+COIN_ID_FIELD = 'coins.id'
+THRESHOLD_PRICE_FIELD = 'threshold_price'
 
 
 class Base(DeclarativeBase):
@@ -36,6 +42,8 @@ class Coin(UUIDMixin, Base):
     def validate_name(self, field_key: str, field_value: str) -> str:
         """Coin name validator.
 
+        Name is checked with cached instruments catalog, check is skipped until it is loaded.
+
         Args:
             field_key: str - column name.
             field_value: str - column value.
@@ -46,31 +54,62 @@ class Coin(UUIDMixin, Base):
         Returns:
             str: upper cased coin name.
         """
-        if not check_coin_name(field_value):
-            raise ValueError(f'Монеты {field_key} не существует.')
+        if is_listed(field_value) is False:
+            raise ValueError(f'Монеты {field_value} не существует.')
         return field_value.upper()
 
 
 class CoinPrice(UUIDMixin, Base):
-    """Model for table with Coin Prices."""
+    """Model for table with Coin Prices, partitioned by days of timedate."""
 
     __tablename__ = 'coins_prices'
     price: Mapped[float] = mapped_column(Float, nullable=False)
     timedate: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
         default=get_current_datetime,
         index=True,
     )
-    coin_id: Mapped[UUID] = mapped_column(ForeignKey('coins.id'))
+    coin_id: Mapped[UUID] = mapped_column(ForeignKey(COIN_ID_FIELD))
     coin: Mapped[Coin] = relationship(back_populates='prices')
+    __table_args__ = {'postgresql_partition_by': 'RANGE (timedate)'}
+
+
+Index('ix_coins_prices_coin_id_timedate', CoinPrice.coin_id, CoinPrice.timedate.desc())
+
+
+class CoinLatestPrice(Base):
+    """Model for last known price of every coin, kept by the price poller."""
+
+    __tablename__ = 'coin_latest_price'
+    coin_id: Mapped[UUID] = mapped_column(ForeignKey(COIN_ID_FIELD), primary_key=True)
+    price: Mapped[float] = mapped_column(Float, nullable=False)
+    timedate: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class CoinPriceRollup(Base):
+    """Model for open, high, low and close coin prices in time buckets."""
+
+    __tablename__ = 'coin_price_rollups'
+    coin_id: Mapped[UUID] = mapped_column(ForeignKey(COIN_ID_FIELD), primary_key=True)
+    resolution: Mapped[str] = mapped_column(String(RESOLUTION_FIELD_LENGTH), primary_key=True)
+    bucket: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    open_price: Mapped[float] = mapped_column(Float, nullable=False)
+    high_price: Mapped[float] = mapped_column(Float, nullable=False)
+    low_price: Mapped[float] = mapped_column(Float, nullable=False)
+    close_price: Mapped[float] = mapped_column(Float, nullable=False)
+    ticks_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    __table_args__ = (
+        Index('ix_coin_price_rollups_resolution_bucket', 'resolution', 'bucket'),
+    )
 
 
 class Alert(UUIDMixin, Base):
     """Model for Alerts."""
 
     __tablename__ = 'alerts'
-    coin_id: Mapped[UUID] = mapped_column(ForeignKey('coins.id'))
+    coin_id: Mapped[UUID] = mapped_column(ForeignKey(COIN_ID_FIELD))
     threshold_price: Mapped[float] = mapped_column(Float, nullable=False)
     email: Mapped[str] = mapped_column(String(NAME_FIELD_LENGTH), nullable=False)
     alert_type: Mapped[str] = mapped_column(String(ALERT_FIELD_LENGTH), nullable=False)
@@ -80,9 +119,12 @@ class Alert(UUIDMixin, Base):
             'email',
             'coin_id',
             'alert_type',
-            'threshold_price',
+            THRESHOLD_PRICE_FIELD,
             name='coin_alert_type',
         ),
+        Index('ix_alerts_coin_type_threshold', 'coin_id', 'alert_type', THRESHOLD_PRICE_FIELD),
+        Index('ix_alerts_alert_type_id', 'alert_type', 'id'),
+        Index('ix_alerts_threshold_price', THRESHOLD_PRICE_FIELD),
     )
 
     @validates('email')
@@ -98,3 +140,25 @@ class Alert(UUIDMixin, Base):
         """
         validate_email(email_value)
         return email_value
+
+
+class EmailOutbox(UUIDMixin, Base):
+    """Model for emails waiting to be sent."""
+
+    __tablename__ = 'email_outbox'
+    recipient: Mapped[str] = mapped_column(String(NAME_FIELD_LENGTH), nullable=False)
+    subject: Mapped[str] = mapped_column(String(SUBJECT_FIELD_LENGTH), nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=get_current_datetime,
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=get_current_datetime,
+        index=True,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
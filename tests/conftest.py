@@ -3,11 +3,14 @@
 import asyncio
 from typing import AsyncGenerator
 
+import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient, Response
 
-from main import app, update_prices
+from main import app
+from utils import price_sources
+from utils.poller import update_prices
 
 
 def assert_content(response: Response, test_content: list | tuple) -> None:
@@ -82,6 +85,17 @@ async def add_coin(name: str, async_client: AsyncClient) -> None:
 sync_client = TestClient(app)
 
 
+@pytest.fixture(scope='session', autouse=True)
+def fake_exchange() -> None:
+    """Use local fake exchange with synthetic prices instead of requests to OKX."""
+    price_sources.set_price_source(
+        price_sources.FakePriceSource({
+            name: price_sources.get_synthetic_path(name)
+            for name in price_sources.FAKE_EXCHANGE_COINS
+        }),
+    )
+
+
 @pytest_asyncio.fixture(scope='session')
 async def async_client() -> AsyncGenerator[AsyncClient, None]:
     """Yield AsyncClient iterator.
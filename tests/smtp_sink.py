@@ -0,0 +1,63 @@
+"""Local SMTP sink server helpers shared by SMTP pool tests and benchmark."""
+
+import socket
+from email.message import EmailMessage
+
+SINK_HOST = '127.0.0.1'
+
+
+class SinkHandler:
+    """aiosmtpd handler counting connections and messages."""
+
+    def __init__(self) -> None:
+        """Create handler with empty counters."""
+        self.sessions: set[object] = set()
+        self.messages = 0
+
+    async def handle_DATA(  # noqa: N802 - aiosmtpd hook name
+        self,
+        server: object,
+        session: object,
+        envelope: object,
+    ) -> str:
+        """Accept and drop message, remember client session.
+
+        Args:
+            server: object - SMTP server.
+            session: object - client session.
+            envelope: object - message envelope.
+
+        Returns:
+            str: SMTP reply.
+        """
+        self.sessions.add(session)
+        self.messages += 1
+        return '250 OK'
+
+
+def make_message(index: int) -> EmailMessage:
+    """Create test message.
+
+    Args:
+        index: int - message number.
+
+    Returns:
+        EmailMessage: message.
+    """
+    message = EmailMessage()
+    message['From'] = 'sink@example.com'
+    message['To'] = f'user{index}@example.com'
+    message['Subject'] = 'Ваша цена!'
+    message.set_content('Sink message')
+    return message
+
+
+def get_free_port() -> int:
+    """Get free local port for sink server.
+
+    Returns:
+        int: port number.
+    """
+    with socket.socket() as sock:
+        sock.bind((SINK_HOST, 0))
+        return sock.getsockname()[1]
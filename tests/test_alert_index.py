@@ -0,0 +1,147 @@
+"""Tests for in-memory alert index."""
+
+import asyncio
+from contextlib import suppress
+from uuid import uuid4
+
+import pytest
+
+from utils.alert_index import DEC_ALERT, INC_ALERT, AlertEntry, AlertIndex
+
+coin_id = uuid4()
+EMAIL = 'load@example.com'
+STALE_THRESHOLD = 100
+CHECK_PRICE = 5
+
+
+class AlertsSession:
+    """Db session which returns alerts rows once it is released."""
+
+    def __init__(self, rows: list[tuple]) -> None:
+        """Create session.
+
+        Args:
+            rows: list[tuple] - alerts rows.
+        """
+        self.rows = rows
+        self.released = asyncio.Event()
+
+    async def execute(self, query: object) -> 'AlertsSession':
+        """Wait for release and return itself as query result.
+
+        Args:
+            query: object - ignored query.
+
+        Returns:
+            AlertsSession: result with rows.
+        """
+        await self.released.wait()
+        return self
+
+    def all(self) -> list[tuple]:
+        """Get rows.
+
+        Returns:
+            list[tuple]: alerts rows.
+        """
+        return self.rows
+
+
+def released_session() -> AlertsSession:
+    """Get session without alerts which answers at once.
+
+    Returns:
+        AlertsSession: released session.
+    """
+    session = AlertsSession([])
+    session.released.set()
+    return session
+
+
+def make_index(thresholds: dict[str, list[float]]) -> AlertIndex:
+    """Create index with coin alerts.
+
+    Args:
+        thresholds: dict[str, list[float]] - thresholds by alert type.
+
+    Returns:
+        AlertIndex: filled index.
+    """
+    index = AlertIndex()
+    for alert_type, prices in thresholds.items():
+        for price in prices:
+            index.add(AlertEntry(uuid4(), coin_id, alert_type, price, 'test@example.com'))
+    return index
+
+
+def test_pop_triggered() -> None:
+    """Test only reached alerts are fired and removed."""
+    index = make_index({INC_ALERT: [3, 1, 2], DEC_ALERT: [5, 4, 6]})
+    fired = index.pop_triggered(coin_id, 4)
+    assert sorted(alert.threshold_price for alert in fired) == [1, 2, 3, 4, 5, 6]
+    assert not index.is_triggered(coin_id, 4)
+    index = make_index({INC_ALERT: [3, 1, 2], DEC_ALERT: [1]})
+    fired = index.pop_triggered(coin_id, 2)
+    assert sorted(alert.threshold_price for alert in fired) == [1, 2]
+    assert index.is_triggered(coin_id, 3)
+    assert not index.is_triggered(uuid4(), 3)
+
+
+def test_update_and_remove() -> None:
+    """Test replaced and removed alerts are not fired."""
+    index = make_index({INC_ALERT: [1]})
+    alert_id = uuid4()
+    index.add(AlertEntry(alert_id, coin_id, INC_ALERT, 2, 'test@example.com'))
+    index.add(AlertEntry(alert_id, coin_id, INC_ALERT, 10, 'test@example.com'))
+    fired = index.pop_triggered(coin_id, 5)
+    assert len(fired) == 1
+    assert fired[0].id != alert_id
+    assert index.is_triggered(coin_id, 10)
+    index.remove(alert_id)
+    assert not index.pop_triggered(coin_id, 10)
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_load_swaps_books() -> None:
+    """Test loaded alerts replace index and changes made during load are kept."""
+    index = make_index({INC_ALERT: [STALE_THRESHOLD]})
+    db_alert = AlertEntry(uuid4(), coin_id, INC_ALERT, 1, EMAIL)
+    session = AlertsSession([tuple(db_alert)])
+    task = asyncio.create_task(index.load(session))
+    await asyncio.sleep(0)
+    added = AlertEntry(uuid4(), coin_id, DEC_ALERT, CHECK_PRICE * 2, EMAIL)
+    index.add(added)
+    session.released.set()
+    await task
+    fired = index.pop_triggered(coin_id, STALE_THRESHOLD)
+    assert {alert.id for alert in fired} == {db_alert.id}
+    assert [alert.id for alert in index.pop_triggered(coin_id, CHECK_PRICE)] == [added.id]
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_cancelled_load_keeps_index() -> None:
+    """Test cancelled load leaves previous alerts in index."""
+    index = make_index({INC_ALERT: [1]})
+    task = asyncio.create_task(index.load(AlertsSession([])))
+    await asyncio.sleep(0)
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+    assert index.is_triggered(coin_id, 1)
+    await index.load(released_session())
+    assert not index.is_triggered(coin_id, 1)
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_fired_alerts_are_not_reloaded() -> None:
+    """Test alerts popped during load are not brought back by loaded snapshot."""
+    db_alert = AlertEntry(uuid4(), coin_id, INC_ALERT, 1, EMAIL)
+    index = AlertIndex()
+    index.add(db_alert)
+    session = AlertsSession([tuple(db_alert)])
+    task = asyncio.create_task(index.load(session))
+    await asyncio.sleep(0)
+    assert index.pop_triggered(coin_id, CHECK_PRICE) == [db_alert]
+    session.released.set()
+    await task
+    assert not index.is_triggered(coin_id, CHECK_PRICE)
@@ -6,7 +6,7 @@ from fastapi import status
 from httpx import AsyncClient
 from test_api_get_coin import test_get_coins
 
-from main import update_prices
+from utils.poller import update_prices
 from utils.time_utils import get_delta_timestamp, get_now_timestamp
 
 
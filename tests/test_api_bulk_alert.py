@@ -0,0 +1,76 @@
+"""Tests for bulk alerts create and delete."""
+
+import math
+from uuid import uuid4
+
+import pytest
+from conftest import add_coin, get_coin_id
+from fastapi import status
+from httpx import AsyncClient, Response
+
+from api.alert_bulk_api import validate_alert
+from api_models.alert_bulk_models import AlertBulkItem
+from models import NAME_FIELD_LENGTH
+from utils.poller import update_prices
+
+BULK_URL = '/alerts/bulk'
+COIN_ID = uuid4()
+LONG_EMAIL = '{0}@example.com'.format('a' * NAME_FIELD_LENGTH)
+
+
+def get_statuses(response: Response) -> list[str]:
+    """Get statuses of bulk request items.
+
+    Args:
+        response: Response - bulk request response.
+
+    Returns:
+        list[str]: items statuses.
+    """
+    return [alert_result['status'] for alert_result in response.json()['alerts']]
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_bulk_alerts(async_client: AsyncClient) -> None:
+    """Test bulk create reports each alert and bulk delete removes created ones.
+
+    Args:
+        async_client: AsyncClient - client.
+    """
+    coin_name = 'ltc'
+    await add_coin(coin_name, async_client)
+    coin_id = await get_coin_id(coin_name, async_client)
+    await update_prices()
+    alert = {'email': 'bulk@example.com', 'threshold_price': 1.0, 'coin_id': coin_id}
+    response = await async_client.post(
+        BULK_URL,
+        json={'alerts': [alert, alert, {**alert, 'email': 'bulk'}]},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert get_statuses(response) == ['created', 'exists', 'invalid']
+    alert_id = response.json()['alerts'][0]['id']
+    response = await async_client.request(
+        'DELETE',
+        BULK_URL,
+        json={'ids': [alert_id, '00000000-0000-0000-0000-000000000000']},
+    )
+    assert get_statuses(response) == ['deleted', 'not_found']
+
+
+@pytest.mark.parametrize(
+    ('email', 'threshold_price'),
+    [
+        (LONG_EMAIL, 1.0),
+        ('bulk@example.com', math.nan),
+        ('bulk@example.com', math.inf),
+    ],
+)
+def test_alert_not_fitting_columns(email: str, threshold_price: float) -> None:
+    """Test alerts which do not fit db columns are invalid instead of failing insert.
+
+    Args:
+        email: str - alert email.
+        threshold_price: float - alert threshold price.
+    """
+    alert = AlertBulkItem(email=email, threshold_price=threshold_price, coin_id=COIN_ID)
+    assert validate_alert(alert, {COIN_ID: 1.0}) is not None
@@ -0,0 +1,43 @@
+"""Tests for coin prices candles."""
+
+import pytest
+from conftest import assert_json_contenttype, get_coin_id
+from fastapi import status
+from httpx import AsyncClient
+
+from utils.poller import update_prices
+from utils.rollup_job import update_rollups
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_get_coin_candles(async_client: AsyncClient) -> None:
+    """Test coin data with candles resolution.
+
+    Args:
+        async_client: AsyncClient - client.
+    """
+    coin_name = 'btc'
+    await update_prices()
+    await update_rollups(lag=0)
+    coin_id = await get_coin_id(coin_name, async_client)
+    response = await async_client.get(f'/coins/{coin_id}?resolution=1m')
+    assert response.status_code == status.HTTP_200_OK
+    assert_json_contenttype(response)
+    result_content: dict = response.json()
+    assert not result_content.get('prices')
+    candles = result_content.get('candles')
+    assert candles and all(candle['low'] <= candle['high'] for candle in candles)
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_get_coin_candles_wrong_resolution(async_client: AsyncClient) -> None:
+    """Test coin data with unknown candles resolution.
+
+    Args:
+        async_client: AsyncClient - client.
+    """
+    coin_id = await get_coin_id('btc', async_client)
+    response = await async_client.get(f'/coins/{coin_id}?resolution=2m')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert_json_contenttype(response)
+    assert response.json().get('detail') == 'Неверное разрешение свечей'
@@ -0,0 +1,54 @@
+"""Tests for coin prices export."""
+
+import json
+
+import pytest
+from conftest import get_coin_id
+from fastapi import status
+from httpx import AsyncClient
+
+from utils.poller import update_prices
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_export_prices_ndjson(async_client: AsyncClient) -> None:
+    """Test prices export as NDJSON.
+
+    Args:
+        async_client: AsyncClient - client.
+    """
+    await update_prices()
+    coin_id = await get_coin_id('btc', async_client)
+    response = await async_client.get(f'/coins/{coin_id}/prices.ndjson')
+    assert response.status_code == status.HTTP_200_OK
+    assert 'application/x-ndjson' in response.headers['content-type']
+    prices = [json.loads(line) for line in response.text.splitlines()]
+    assert prices and all(price_data['price'] for price_data in prices)
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_export_prices_csv(async_client: AsyncClient) -> None:
+    """Test prices export as CSV.
+
+    Args:
+        async_client: AsyncClient - client.
+    """
+    coin_id = await get_coin_id('btc', async_client)
+    response = await async_client.get(f'/coins/{coin_id}/prices.csv')
+    assert response.status_code == status.HTTP_200_OK
+    assert 'text/csv' in response.headers['content-type']
+    lines = response.text.splitlines()
+    assert lines[0] == 'price,timedate'
+    assert len(lines) > 1
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_export_unexisting_coin(async_client: AsyncClient) -> None:
+    """Test prices export of unexisting coin.
+
+    Args:
+        async_client: AsyncClient - client.
+    """
+    coin_id = '00000000-0000-0000-0000-000000000000'
+    response = await async_client.get(f'/coins/{coin_id}/prices.csv')
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -4,6 +4,8 @@ import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+ALERT_TYPE = 'alert_type'
+
 
 @pytest.mark.asyncio(scope='session')
 async def test_get_alerts(async_client: AsyncClient) -> None:
@@ -17,3 +19,35 @@ async def test_get_alerts(async_client: AsyncClient) -> None:
     assert 'application/json' in response.headers['content-type']
     response_content: dict = response.json()
     assert response_content.get('alerts')
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_get_alerts_filtered(async_client: AsyncClient) -> None:
+    """Test get alerts filtered by email, type and price range.
+
+    Args:
+        async_client: AsyncClient - client.
+    """
+    filters = {
+        'email': 'testemail@example.com',
+        ALERT_TYPE: 'dec',
+        'min_price': 0,
+        'max_price': 10,
+    }
+    response = await async_client.get('/alerts', params=filters)
+    assert response.status_code == status.HTTP_200_OK
+    for alert in response.json()['alerts']:
+        assert alert['email'] == filters['email']
+        assert alert[ALERT_TYPE] == filters[ALERT_TYPE]
+        assert filters['min_price'] <= alert['threshold_price'] <= filters['max_price']
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_get_alerts_wrong_type(async_client: AsyncClient) -> None:
+    """Test get alerts with unknown alert type.
+
+    Args:
+        async_client: AsyncClient - client.
+    """
+    response = await async_client.get('/alerts', params={ALERT_TYPE: 'up'})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
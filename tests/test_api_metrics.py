@@ -0,0 +1,26 @@
+"""Tests for metrics view."""
+
+import pytest
+from conftest import assert_json_contenttype
+from fastapi import status
+from httpx import AsyncClient
+
+from utils import metrics
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_get_metrics(async_client: AsyncClient) -> None:
+    """Test get metrics.
+
+    Args:
+        async_client: AsyncClient - client.
+    """
+    metrics.observe('test_seconds', 1)
+    metrics.observe('test_seconds', 3)
+    response = await async_client.get('/metrics')
+    assert response.status_code == status.HTTP_200_OK
+    assert_json_contenttype(response)
+    histogram = response.json()['histograms']['test_seconds']
+    assert histogram['count'] == 2
+    assert histogram['buckets']['1'] == 1
+    assert histogram['buckets']['+Inf'] == 2
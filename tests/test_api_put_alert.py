@@ -5,7 +5,7 @@ from conftest import add_coin, get_coin_id
 from fastapi import status
 from httpx import AsyncClient
 
-from main import update_prices
+from utils.poller import update_prices
 
 
 async def get_coins_ids(
@@ -0,0 +1,36 @@
+"""Tests for db pool usage metrics."""
+
+import sqlite3
+
+import pytest
+
+from utils import metrics
+from utils.db_pool import MeteredQueuePool
+
+
+def connect_sqlite() -> sqlite3.Connection:
+    """Create in-memory sqlite connection.
+
+    Returns:
+        sqlite3.Connection: connection.
+    """
+    return sqlite3.connect(':memory:')
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_pool_usage(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test checkout time is observed and saturation follows checked out connections.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(metrics, '_gauges', {})
+    monkeypatch.setattr(metrics, '_histograms', {})
+    pool = MeteredQueuePool(connect_sqlite, pool_size=1, max_overflow=1)
+    connections = [pool.connect(), pool.connect()]
+    pool_metrics = metrics.get_metrics()
+    assert pool_metrics['gauges']['db_pool_saturation'] == 1
+    assert pool_metrics['histograms']['db_pool_checkout_seconds']['count'] == 2
+    for connection in connections:
+        connection.close()
+    assert metrics.get_metrics()['gauges']['db_pool_checked_out'] == 0
@@ -0,0 +1,110 @@
+"""Tests for email outbox dispatcher."""
+
+import asyncio
+from uuid import uuid4
+
+import aiosmtplib
+import pytest
+
+from models import EmailOutbox
+from utils import dead_emails, email_dispatcher
+from utils.constants import EMAIL_RETRY_BASE_SECONDS, EMAIL_RETRY_MAX_SECONDS
+
+
+async def fail_send_email(subject: str, recipient: str, body: str) -> None:
+    """Send email stub which always fails.
+
+    Args:
+        subject: str - email subject.
+        recipient: str - email recipient.
+        body: str - email body.
+
+    Raises:
+        SMTPServerDisconnected: always.
+    """
+    raise aiosmtplib.SMTPServerDisconnected('Server disconnected')
+
+
+class FailingJob:
+    """Job stub which fails with unexpected error and then stops the loop."""
+
+    def __init__(self) -> None:
+        """Create job which was not called yet."""
+        self.calls = 0
+
+    async def __call__(self) -> int:
+        """Fail first call, cancel the loop on second call.
+
+        Raises:
+            RuntimeError: on first call.
+            CancelledError: on next calls.
+        """
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError('Unexpected error')
+        raise asyncio.CancelledError()
+
+
+def test_retry_delay() -> None:
+    """Test retry delay grows and is limited."""
+    assert email_dispatcher.get_retry_delay(1) == EMAIL_RETRY_BASE_SECONDS
+    assert email_dispatcher.get_retry_delay(2) == EMAIL_RETRY_BASE_SECONDS * 2
+    assert email_dispatcher.get_retry_delay(100) == EMAIL_RETRY_MAX_SECONDS
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_deliver_digest_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test failed email returns error text.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(email_dispatcher, 'send_email', fail_send_email)
+    email = EmailOutbox(
+        id=uuid4(),
+        recipient='testemail@example.com',
+        subject='subject',
+        body='body',
+    )
+    error = await email_dispatcher.deliver_digest([email], asyncio.Semaphore(1))
+    assert error == 'Server disconnected'
+
+
+def test_render_digest() -> None:
+    """Test emails for the same recipient are rendered as one digest."""
+    emails = [
+        EmailOutbox(id=uuid4(), recipient=recipient, subject='Ваша цена!', body=body)
+        for recipient, body in (
+            ('first@example.com', 'BTC'),
+            ('second@example.com', 'ETH'),
+            ('first@example.com', 'SOL'),
+        )
+    ]
+    digests = email_dispatcher.group_by_recipient(emails)
+    assert [len(digest) for digest in digests.values()] == [2, 1]
+    subject, body = email_dispatcher.render_digest(digests['first@example.com'])
+    assert subject == 'Ваша цена! (2)'
+    assert 'BTC' in body and 'SOL' in body
+    single = digests['second@example.com']
+    assert email_dispatcher.render_digest(single) == ('Ваша цена!', 'ETH')
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_dispatcher_survives_unexpected_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test dispatcher and dead emails purge loops continue after any error.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(email_dispatcher, 'EMAIL_DISPATCH_INTERVAL', 0)
+    monkeypatch.setattr(dead_emails, 'EMAIL_DEAD_CHECK_INTERVAL', 0)
+    loops = (
+        (email_dispatcher, 'dispatch_emails', email_dispatcher.run_email_dispatcher),
+        (dead_emails, 'purge_dead_emails', dead_emails.run_dead_emails_purge),
+    )
+    for module, job_name, run_loop in loops:
+        job = FailingJob()
+        monkeypatch.setattr(module, job_name, job)
+        with pytest.raises(asyncio.CancelledError):
+            await run_loop()
+        assert job.calls == 2
@@ -0,0 +1,48 @@
+"""Tests for cached exchange instruments catalog."""
+
+import pytest
+
+from utils import instruments
+from utils.price_sources import FakePriceSource
+
+
+def get_empty_source() -> FakePriceSource:
+    """Get exchange without instruments like failed exchange request.
+
+    Returns:
+        FakePriceSource: exchange without coins.
+    """
+    return FakePriceSource({})
+
+
+@pytest.fixture(autouse=True)
+def empty_catalog(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use empty catalog in tests, so app catalog is not changed.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(instruments, '_catalog', {})
+
+
+def test_is_listed() -> None:
+    """Test coin names are checked without request once catalog is loaded."""
+    assert instruments.is_listed('btc') is None
+    instruments.set_instruments({'BTC', 'eth'})
+    assert instruments.is_listed('btc')
+    assert instruments.is_listed('ETH')
+    assert instruments.is_listed('notacoin') is False
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_empty_refresh_keeps_catalog(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test failed instruments request does not clear catalog.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    instruments.set_instruments({'BTC'})
+
+    monkeypatch.setattr(instruments, 'get_price_source', get_empty_source)
+    await instruments.refresh_instruments()
+    assert instruments.is_listed('btc')
@@ -0,0 +1,36 @@
+"""Tests for keyset pagination helpers."""
+
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from utils.pagination import decode_cursor, encode_cursor, split_page
+
+
+def test_cursor_round_trip() -> None:
+    """Test cursor is decoded into the encoded sort key."""
+    timedate = datetime.now(timezone.utc)
+    row_id = uuid4()
+    cursor = encode_cursor(timedate, row_id)
+    assert decode_cursor(cursor, datetime.fromisoformat, UUID) == (timedate, row_id)
+
+
+@pytest.mark.parametrize('cursor', ['not a cursor', encode_cursor('not a uuid')])
+def test_invalid_cursor(cursor: str) -> None:
+    """Test invalid cursor is rejected with 400.
+
+    Args:
+        cursor: str - invalid cursor.
+    """
+    with pytest.raises(HTTPException, match='400'):
+        decode_cursor(cursor, UUID)
+
+
+def test_split_page() -> None:
+    """Test extra row is cut and cursor points to the last page row."""
+    page, next_cursor = split_page([1, 2, 3], 2, lambda row: (row,))
+    assert page == [1, 2]
+    assert decode_cursor(next_cursor, int) == (2,)
+    assert split_page([1, 2], 2, lambda row: (row,)) == ([1, 2], None)
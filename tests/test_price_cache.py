@@ -0,0 +1,48 @@
+"""Tests for in-process latest prices cache."""
+
+import pytest
+
+from utils import price_cache
+
+BTC = 'btc'
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use empty cache in tests, so app cache is not changed.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(price_cache, '_prices', {})
+    monkeypatch.setattr(price_cache, '_coins', {})
+
+
+def test_cached_prices(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test fresh prices are returned and missing prices cause a miss.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(price_cache, 'PRICE_CACHE_TTL', 60)
+    price_cache.set_prices({'eth': 2, BTC: 1}, ['eth', BTC])
+    assert price_cache.get_price('ETH') == 2
+    assert price_cache.get_prices() == [('BTC', 1), ('ETH', 2)]
+    price_cache.set_prices({BTC: 3}, [BTC, 'sol'])
+    assert price_cache.get_price(BTC) == 3
+    assert price_cache.get_prices() is None
+    price_cache.set_prices({'sol': 4}, [BTC, 'sol'])
+    price_cache.invalidate()
+    assert price_cache.get_prices() is None
+
+
+def test_stale_prices(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test prices older than ttl are not returned.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(price_cache, 'PRICE_CACHE_TTL', 0)
+    price_cache.set_prices({BTC: 1}, [BTC])
+    assert price_cache.get_price(BTC) is None
+    assert price_cache.get_prices() is None
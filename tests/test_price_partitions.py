@@ -0,0 +1,124 @@
+"""Tests for coins_prices partitions manager."""
+
+from datetime import date, timedelta
+from typing import Self
+
+import pytest
+from sqlalchemy import TextClause
+
+from utils import price_partitions
+
+TODAY = date.fromisoformat('2024-01-31')
+ROLLUP_LAG_DAYS = 3
+
+
+class PartitionsRecorder:
+    """Partitions changes recorder used instead of db queries."""
+
+    def __init__(self) -> None:
+        """Create empty recorder."""
+        self.created: list[date] = []
+        self.removed: list[date] = []
+
+    async def create(self, db: None, day: date) -> None:
+        """Record created partition.
+
+        Args:
+            db: None - db session.
+            day: date - partition day.
+        """
+        self.created.append(day)
+
+    async def remove(self, db: None, day: date) -> None:
+        """Record removed partition.
+
+        Args:
+            db: None - db session.
+            day: date - partition day.
+        """
+        self.removed.append(day)
+
+
+class StatementsRecorder:
+    """Db session stand-in which records statements and answers if default partition has rows."""
+
+    def __init__(self, has_default_prices: bool) -> None:
+        """Create session without statements.
+
+        Args:
+            has_default_prices: bool - answer to default partition rows check.
+        """
+        self.has_default_prices = has_default_prices
+        self.statements: list[str] = []
+
+    async def execute(self, statement: TextClause, bind_params: dict | None = None) -> Self:
+        """Record statement.
+
+        Args:
+            statement: TextClause - executed statement.
+            bind_params: dict | None, optional - statement parameters.
+
+        Returns:
+            Self: this recorder as the statement result.
+        """
+        self.statements.append(str(statement))
+        return self
+
+    def scalar(self) -> bool:
+        """Get default partition rows check answer.
+
+        Returns:
+            bool: if default partition has prices of the day.
+        """
+        return self.has_default_prices
+
+
+def test_partition_name() -> None:
+    """Test partition name contains partition day."""
+    assert price_partitions.get_partition_name(TODAY) == 'coins_prices_p2024_01_31'
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_partitions_by_retention(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test missing future partitions are created and old ones are removed.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    recorder = PartitionsRecorder()
+    monkeypatch.setattr(price_partitions, 'create_partition', recorder.create)
+    monkeypatch.setattr(price_partitions, 'remove_partition', recorder.remove)
+    monkeypatch.setattr(price_partitions, 'PRICE_PARTITIONS_AHEAD_DAYS', 2)
+    monkeypatch.setattr(price_partitions, 'PRICES_RETENTION_DAYS', 3)
+    existing = [TODAY - timedelta(days=offset) for offset in range(5)]
+    await price_partitions.create_partitions(None, existing, TODAY)
+    await price_partitions.remove_partitions(None, existing, TODAY, TODAY)
+    assert recorder.created == [TODAY + timedelta(days=1), TODAY + timedelta(days=2)]
+    assert recorder.removed == [TODAY - timedelta(days=4)]
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_not_rolled_up_partitions_are_kept(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test partitions are removed only if their days are in daily rollups.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    recorder = PartitionsRecorder()
+    monkeypatch.setattr(price_partitions, 'remove_partition', recorder.remove)
+    monkeypatch.setattr(price_partitions, 'PRICES_RETENTION_DAYS', 1)
+    existing = [TODAY - timedelta(days=offset) for offset in range(ROLLUP_LAG_DAYS, 0, -1)]
+    await price_partitions.remove_partitions(None, existing, TODAY, None)
+    assert not recorder.removed
+    await price_partitions.remove_partitions(None, existing, TODAY, existing[1])
+    assert recorder.removed == existing[:1]
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_default_partition_lock() -> None:
+    """Test default partition is locked only if it has prices of the new partition day."""
+    for has_default_prices in (False, True):
+        session = StatementsRecorder(has_default_prices)
+        await price_partitions.create_partition(session, TODAY)
+        locks = [statement for statement in session.statements if statement.startswith('LOCK')]
+        assert len(locks) == int(has_default_prices)
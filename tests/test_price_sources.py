@@ -0,0 +1,52 @@
+"""Tests for local fake exchange price source."""
+
+from pathlib import Path
+
+import pytest
+
+from utils.price_sources import FakePriceSource, get_synthetic_path, load_paths
+
+PATH_STEPS = 10
+HIGH_SPEED = 1000
+ELAPSED_SECONDS = 0.5
+BTC = 'BTC'
+ETH = 'ETH'
+
+
+def test_synthetic_path_is_deterministic() -> None:
+    """Test same seed gives same path and coins have different paths."""
+    path = get_synthetic_path('btc', PATH_STEPS)
+    assert len(path) == PATH_STEPS
+    assert path == get_synthetic_path(BTC, PATH_STEPS)
+    assert path != get_synthetic_path(BTC, PATH_STEPS, seed=1)
+    assert path != get_synthetic_path(ETH, PATH_STEPS)
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_replay_by_requests() -> None:
+    """Test each request moves one step, paths are replayed in a loop."""
+    source = FakePriceSource({'btc': [1.0, 2.0], 'eth': [3.0]}, speed=0)
+    assert await source.get_instruments() == {BTC, ETH}
+    assert await source.get_prices(['btc', 'eth', 'doge']) == {BTC: 1.0, ETH: 3.0}
+    assert await source.get_prices([BTC]) == {BTC: 2.0}
+    assert await source.get_prices([BTC]) == {BTC: 1.0}
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_replay_by_time() -> None:
+    """Test path steps follow time with given speed, not requests."""
+    source = FakePriceSource({BTC: list(range(HIGH_SPEED))}, speed=HIGH_SPEED)
+    source.started_at -= ELAPSED_SECONDS
+    price = (await source.get_prices([BTC]))[BTC]
+    assert HIGH_SPEED * ELAPSED_SECONDS <= price < HIGH_SPEED
+
+
+def test_load_paths(tmp_path: Path) -> None:
+    """Test recorded prices are grouped by coin in file order.
+
+    Args:
+        tmp_path: Path - temporary directory.
+    """
+    paths_file = tmp_path / 'paths.csv'
+    paths_file.write_text('coin,price\nbtc,1.5\neth,2\nBTC,3\n')
+    assert load_paths(str(paths_file)) == {BTC: [1.5, 3.0], ETH: [2.0]}
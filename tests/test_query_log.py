@@ -0,0 +1,62 @@
+"""Tests for SQL queries timing and logging."""
+
+import logging
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from utils import metrics, query_log
+
+
+def create_timed_engine() -> Engine:
+    """Create in-memory sqlite engine with query timing events.
+
+    Returns:
+        Engine: sqlite engine.
+    """
+    sqlite_engine = create_engine('sqlite://')
+    query_log.add_timing_events(sqlite_engine)
+    return sqlite_engine
+
+
+@pytest.mark.parametrize(('mode', 'logged'), [('slow', True), ('off', False)])
+def test_query_log(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    mode: str,
+    logged: bool,
+) -> None:
+    """Test queries are timed in every mode and logged at visible level only when mode allows.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+        caplog: pytest.LogCaptureFixture - log capture fixture.
+        mode: str - SQL_LOG_MODE.
+        logged: bool - if query should be logged.
+    """
+    monkeypatch.setattr(metrics, '_histograms', {})
+    monkeypatch.setattr(query_log, 'SQL_LOG_MODE', mode)
+    monkeypatch.setattr(query_log, 'SQL_SLOW_QUERY_SECONDS', 0)
+    with create_timed_engine().connect() as connection:
+        connection.execute(text('SELECT 1'))
+    histogram = metrics.get_metrics()['histograms'][query_log.QUERY_METRIC]
+    assert histogram['count'] == 1
+    records = [record for record in caplog.records if 'SELECT 1' in record.getMessage()]
+    assert logged is bool(records)
+    assert all(record.levelno == logging.WARNING for record in records)
+
+
+def test_failed_query_is_not_timed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test failed statement does not affect timing of next ones.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(metrics, '_histograms', {})
+    with create_timed_engine().connect() as connection:
+        with pytest.raises(OperationalError):
+            connection.execute(text('SELECT * FROM missing_table'))
+        connection.execute(text('SELECT 1'))
+    histogram = metrics.get_metrics()['histograms'][query_log.QUERY_METRIC]
+    assert histogram['count'] == 1
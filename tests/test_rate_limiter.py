@@ -0,0 +1,64 @@
+"""Tests for exchange requests rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from utils import rate_limiter
+
+RATE = 100
+BACKOFF_BASE = 10
+SLOW_RATE = 1
+CANCELLED_WAITERS = 10
+WAIT_TIMEOUT = 0.01
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_bucket_waits_for_token() -> None:
+    """Test requests over burst wait for refill."""
+    bucket = rate_limiter.TokenBucket(RATE, 1)
+    started = time.monotonic()
+    await bucket.acquire()
+    await bucket.acquire()
+    await bucket.acquire()
+    assert time.monotonic() - started >= 2 / RATE
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_cancelled_waiters_return_tokens() -> None:
+    """Test requests cancelled while waiting do not leave tokens debt."""
+    bucket = rate_limiter.TokenBucket(SLOW_RATE, 1)
+    await bucket.acquire()
+    for _ in range(CANCELLED_WAITERS):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(bucket.acquire(), WAIT_TIMEOUT)
+    assert bucket.tokens > -1
+    bucket.tokens += 1
+    await asyncio.wait_for(bucket.acquire(), WAIT_TIMEOUT)
+
+
+def test_backoff_doubles(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test pause grows on rate limit responses in a row and resets on success.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(rate_limiter, 'EXCHANGE_BACKOFF_BASE', BACKOFF_BASE)
+    bucket = rate_limiter.TokenBucket(RATE, 1)
+    bucket.backoff()
+    bucket.backoff()
+    assert bucket.blocked_until - time.monotonic() > BACKOFF_BASE
+    bucket.succeed()
+    assert not bucket.failures
+
+
+@pytest.mark.parametrize(('header', 'pause'), [('3', 3), (None, None), ('soon', None)])
+def test_parse_retry_after(header: str | None, pause: float | None) -> None:
+    """Test Retry-After header parsing.
+
+    Args:
+        header: str | None - header value.
+        pause: float | None - expected pause.
+    """
+    assert rate_limiter.parse_retry_after(header) == pause
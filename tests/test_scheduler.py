@@ -0,0 +1,44 @@
+"""Tests for fixed cadence scheduler."""
+
+import asyncio
+
+import pytest
+
+from utils import metrics, scheduler
+
+CYCLE_TIMEOUT = 0.01
+
+
+async def hang() -> None:
+    """Job which never finishes in time."""
+    await asyncio.sleep(1)
+
+
+@pytest.mark.parametrize(('now', 'next_tick'), [
+    (1.5, (2, 0)),
+    (2.5, (2, 0)),
+    (5.5, (4, 1)),
+])
+def test_get_next_tick(now: float, next_tick: tuple[float, int]) -> None:
+    """Test cadence is kept and overrun ticks are coalesced.
+
+    Args:
+        now: float - time when cycle started at 0 with interval 2 finished.
+        next_tick: tuple[float, int] - expected next tick and skipped ticks count.
+    """
+    assert scheduler.get_next_tick(0, now, 2) == next_tick
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_cycle_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test hung cycle is cancelled and counted.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(metrics, '_counters', {})
+    monkeypatch.setattr(metrics, '_histograms', {})
+    await scheduler.run_cycle(hang, CYCLE_TIMEOUT, 'test')
+    test_metrics = metrics.get_metrics()
+    assert test_metrics['counters'] == {'test_cycle_timeouts_total': 1}
+    assert test_metrics['histograms']['test_cycle_seconds']['count'] == 1
@@ -0,0 +1,144 @@
+"""Tests for SMTP connections pool."""
+
+import asyncio
+from email.message import EmailMessage
+from typing import Iterator
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtplib import SMTPServerDisconnected
+from smtp_sink import SINK_HOST, SinkHandler, get_free_port, make_message
+
+from utils import smtp_pool
+
+SEND_TIMEOUT = 0.01
+
+
+class StubClient:
+    """SMTP client stand-in which can hang or lose connection."""
+
+    def __init__(self, hangs: bool = False) -> None:
+        """Create connected client.
+
+        Args:
+            hangs: bool, optional - if sending never finishes.
+        """
+        self.hangs = hangs
+        self.broken = False
+        self.is_connected = True
+        self.messages: list[EmailMessage] = []
+
+    async def send_message(self, message: EmailMessage) -> None:
+        """Send message.
+
+        Args:
+            message: EmailMessage - message.
+
+        Raises:
+            SMTPServerDisconnected: if connection is broken.
+        """
+        await asyncio.sleep(SEND_TIMEOUT * 10 if self.hangs else 0)
+        if self.broken:
+            raise SMTPServerDisconnected('Connection lost')
+        self.messages.append(message)
+
+    async def quit(self) -> None:
+        """Close connection politely."""
+        self.close()
+
+    def close(self) -> None:
+        """Close connection."""
+        self.is_connected = False
+
+
+class StubConnections:
+    """Replacement of connections opening which hands out stub clients."""
+
+    def __init__(self, hangs: bool = False) -> None:
+        """Create opener without opened clients.
+
+        Args:
+            hangs: bool, optional - if sending with opened clients never finishes.
+        """
+        self.hangs = hangs
+        self.clients: list[StubClient] = []
+
+    async def open_connection(self, smtp_options: dict) -> smtp_pool.PooledSMTP:
+        """Open stub connection.
+
+        Args:
+            smtp_options: dict - ignored SMTP options.
+
+        Returns:
+            smtp_pool.PooledSMTP: connection with stub client.
+        """
+        self.clients.append(StubClient(self.hangs))
+        return smtp_pool.PooledSMTP(self.clients[-1])
+
+
+@pytest.fixture(name='smtp_sink')
+def run_smtp_sink() -> Iterator[Controller]:
+    """Run local SMTP sink server, it is stopped even if test fails.
+
+    Yields:
+        Iterator[Controller]: running server controller with SinkHandler.
+    """
+    controller = Controller(SinkHandler(), hostname=SINK_HOST, port=get_free_port())
+    controller.start()
+    yield controller
+    controller.stop()
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_pool_reuses_connection(smtp_sink: Controller) -> None:
+    """Test messages are sent through one connection.
+
+    Args:
+        smtp_sink: Controller - SMTP sink server.
+    """
+    pool = smtp_pool.SMTPPool(
+        size=1,
+        hostname=smtp_sink.hostname,
+        port=smtp_sink.port,
+        username=None,
+        password=None,
+        start_tls=False,
+    )
+    messages_count = 3
+    for index in range(messages_count):
+        await pool.send(make_message(index))
+    await pool.close()
+    assert smtp_sink.handler.messages == messages_count
+    assert len(smtp_sink.handler.sessions) == 1
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_cancelled_send_closes_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test connection is closed if sending is cancelled.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    connections = StubConnections(hangs=True)
+    monkeypatch.setattr(smtp_pool, 'open_connection', connections.open_connection)
+    pool = smtp_pool.SMTPPool(size=1)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(pool.send(make_message(0)), SEND_TIMEOUT)
+    assert not connections.clients[0].is_connected
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_retry_uses_new_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test message is resent with new connection, not with another stale idle one.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    connections = StubConnections()
+    monkeypatch.setattr(smtp_pool, 'open_connection', connections.open_connection)
+    pool = smtp_pool.SMTPPool(size=2)
+    await asyncio.gather(pool.send(make_message(0)), pool.send(make_message(1)))
+    for client in connections.clients:
+        client.broken = True
+    await pool.send(make_message(2))
+    assert len(connections.clients[-1].messages) == 1
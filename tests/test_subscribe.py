@@ -8,7 +8,7 @@ from fastapi import status
 from httpx import AsyncClient
 from test_root import test_root
 
-from main import update_prices
+from utils.poller import update_prices
 
 session_literal = 'session'
 subscribe_literal = '/subscribe'
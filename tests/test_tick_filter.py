@@ -0,0 +1,91 @@
+"""Tests for tick write filter."""
+
+import time
+from uuid import uuid4
+
+import pytest
+
+from models import Coin
+from utils import tick_filter
+
+HEARTBEAT = 60
+PRICE = 100
+REL_THRESHOLD = 0.01
+COIN_NAME = 'BTC'
+
+
+@pytest.fixture(autouse=True)
+def empty_filter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use empty filter state with heartbeat and 1% threshold.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(tick_filter, '_stored', {})
+    monkeypatch.setattr(tick_filter, 'TICK_FILTER_HEARTBEAT', HEARTBEAT)
+    monkeypatch.setattr(tick_filter, 'TICK_FILTER_REL_THRESHOLD', REL_THRESHOLD)
+
+
+@pytest.mark.parametrize(('price', 'elapsed', 'stored'), [
+    (PRICE, 0, False),
+    (PRICE + 0.5, 0, False),
+    (PRICE + 2, 0, True),
+    (PRICE, HEARTBEAT, True),
+])
+def test_should_store(price: float, elapsed: float, stored: bool) -> None:
+    """Test tick is stored if price moved over threshold or heartbeat passed.
+
+    Args:
+        price: float - new price.
+        elapsed: float - seconds since last stored tick.
+        stored: bool - if tick should be stored.
+    """
+    coin = Coin(id=uuid4(), name=COIN_NAME)
+    ticks = [(coin, PRICE)]
+    assert tick_filter.filter_prices(ticks) == ticks
+    tick_filter.mark_stored(ticks)
+    assert tick_filter.should_store(coin.id, price, time.monotonic() + elapsed) is stored
+
+
+def test_filter_off(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test every tick is stored if no filter setting is set.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(tick_filter, 'TICK_FILTER_HEARTBEAT', 0)
+    monkeypatch.setattr(tick_filter, 'TICK_FILTER_REL_THRESHOLD', 0)
+    coin = Coin(id=uuid4(), name=COIN_NAME)
+    ticks = [(coin, PRICE)]
+    tick_filter.mark_stored(ticks)
+    assert tick_filter.filter_prices(ticks) == ticks
+
+
+def test_threshold_without_heartbeat(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test zero heartbeat keeps threshold filter and never forces a tick.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(tick_filter, 'TICK_FILTER_HEARTBEAT', 0)
+    coin = Coin(id=uuid4(), name=COIN_NAME)
+    tick_filter.mark_stored([(coin, PRICE)])
+    assert not tick_filter.should_store(coin.id, PRICE, time.monotonic() + HEARTBEAT)
+    assert tick_filter.should_store(coin.id, PRICE * 2, time.monotonic())
+
+
+def test_not_saved_ticks_are_not_remembered() -> None:
+    """Test filtered ticks count as stored only after they are marked as saved."""
+    coin = Coin(id=uuid4(), name=COIN_NAME)
+    ticks = [(coin, PRICE)]
+    tick_filter.filter_prices(ticks)
+    assert tick_filter.filter_prices(ticks) == ticks
+
+
+def test_missing_coins_are_forgotten() -> None:
+    """Test stored ticks of coins which are not polled anymore are removed."""
+    kept, removed = Coin(id=uuid4(), name=COIN_NAME), Coin(id=uuid4(), name='ETH')
+    tick_filter.mark_stored([(kept, PRICE), (removed, PRICE)])
+    tick_filter.forget_missing([kept])
+    assert not tick_filter.should_store(kept.id, PRICE, time.monotonic())
+    assert tick_filter.should_store(removed.id, PRICE, time.monotonic())
@@ -0,0 +1,189 @@
+"""Tests for WebSocket tickers ingestion against local WebSocket server."""
+
+import asyncio
+import json
+from contextlib import suppress
+from typing import Awaitable, Callable
+from uuid import uuid4
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from models import Coin
+from utils import ws_ingest
+
+BTC_INST_ID = 'BTC-USD-SWAP'
+WS_PATH = '/ws'
+WAIT_STEP = 0.01
+WAIT_TIMEOUT = 5
+OPERATIONS_KEY = web.AppKey('operations', list)
+WebSocketView = Callable[[web.Request], Awaitable[web.WebSocketResponse]]
+
+
+def get_tickers_message(tickers: list[dict], channel: str = ws_ingest.TICKERS_CHANNEL) -> str:
+    """Get exchange message with tickers.
+
+    Args:
+        tickers: list[dict] - tickers data.
+        channel: str, optional - channel name.
+
+    Returns:
+        str: JSON message.
+    """
+    return json.dumps({'arg': {'channel': channel}, 'data': tickers})
+
+
+BTC_TICKER = get_tickers_message([{'instId': BTC_INST_ID, 'last': '1.5'}])
+
+
+class StreamRecorder:
+    """Coins source and prices pipeline which records processed prices."""
+
+    def __init__(self) -> None:
+        """Create recorder with one coin."""
+        self.coin = Coin(id=uuid4(), name='BTC')
+        self.prices: list[ws_ingest.CoinPrices] = []
+
+    async def load_coins(self) -> list[Coin]:
+        """Get coins.
+
+        Returns:
+            list[Coin]: coins.
+        """
+        return [self.coin]
+
+    async def process_prices(self, coins: list[Coin], prices: list[tuple[Coin, float]]) -> None:
+        """Record prices.
+
+        Args:
+            coins: list[Coin] - all coins.
+            prices: list[tuple[Coin, float]] - new prices.
+        """
+        self.prices.append(prices)
+
+
+async def tickers_handler(request: web.Request) -> web.WebSocketResponse:
+    """Answer subscriptions with ticker, first connection is closed after it.
+
+    Args:
+        request: web.Request - WebSocket request.
+
+    Returns:
+        web.WebSocketResponse: connection.
+    """
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+    operations = request.app[OPERATIONS_KEY]
+    operations.append([])
+    async for message in ws:
+        operations[-1].append(json.loads(message.data)['op'])
+        await ws.send_str(BTC_TICKER)
+        if len(operations) == 1:
+            await ws.close()
+    return ws
+
+
+async def run_stream(
+    view: WebSocketView,
+    reached: Callable[[web.Application, StreamRecorder], bool],
+) -> tuple[web.Application, StreamRecorder]:
+    """Run stream against local server until condition is reached or wait timeout.
+
+    Args:
+        view: WebSocketView - server WebSocket handler.
+        reached: Callable[[web.Application, StreamRecorder], bool] - stop condition.
+
+    Returns:
+        tuple[web.Application, StreamRecorder]: server app and prices recorder.
+    """
+    app = web.Application()
+    app[OPERATIONS_KEY] = []
+    app.router.add_get(WS_PATH, view)
+    server = TestServer(app)
+    await server.start_server()
+    recorder = StreamRecorder()
+    stream = ws_ingest.TickerStream(
+        str(server.make_url(WS_PATH)),
+        recorder.load_coins,
+        recorder.process_prices,
+    )
+    task = asyncio.create_task(stream.run())
+    for _ in range(int(WAIT_TIMEOUT / WAIT_STEP)):
+        if reached(app, recorder):
+            break
+        await asyncio.sleep(WAIT_STEP)
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+    await server.close()
+    return app, recorder
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_stream_resubscribes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test ticks are processed and coins are subscribed again after reconnect.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    monkeypatch.setattr(ws_ingest, 'WS_FLUSH_INTERVAL', WAIT_STEP)
+    monkeypatch.setattr(ws_ingest, 'WS_RECONNECT_DELAY', WAIT_STEP)
+    app, recorder = await run_stream(
+        tickers_handler,
+        lambda server_app, stream_recorder: len(stream_recorder.prices) >= 2,
+    )
+    assert app[OPERATIONS_KEY][:2] == [['subscribe'], ['subscribe']]
+    assert recorder.prices[:2] == [[(recorder.coin, 1.5)], [(recorder.coin, 1.5)]]
+
+
+def test_ignored_messages() -> None:
+    """Test pong, subscription events and other channels do not add ticks."""
+    stream = ws_ingest.TickerStream()
+    stream.handle_message('pong')
+    stream.handle_message(json.dumps({'event': 'subscribe', 'arg': {'channel': 'tickers'}}))
+    stream.handle_message(get_tickers_message([{'instId': 'x'}], 'trades'))
+    assert not stream.ticks
+
+
+async def silent_handler(request: web.Request) -> web.WebSocketResponse:
+    """Accept connection and read messages without answering, like half-open connection.
+
+    Args:
+        request: web.Request - WebSocket request.
+
+    Returns:
+        web.WebSocketResponse: connection.
+    """
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+    request.app[OPERATIONS_KEY].append([])
+    async for _ in ws:
+        await asyncio.sleep(0)
+    return ws
+
+
+@pytest.mark.asyncio(scope='session')
+async def test_stream_reconnects_without_pong(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test stream reconnects when server stops answering pings.
+
+    Args:
+        monkeypatch: pytest.MonkeyPatch - monkeypatch fixture.
+    """
+    for setting in ('WS_FLUSH_INTERVAL', 'WS_RECONNECT_DELAY', 'WS_PING_INTERVAL'):
+        monkeypatch.setattr(ws_ingest, setting, WAIT_STEP)
+    monkeypatch.setattr(ws_ingest, 'WS_PONG_TIMEOUT', WAIT_STEP * 2)
+    app, _ = await run_stream(
+        silent_handler,
+        lambda server_app, stream_recorder: len(server_app[OPERATIONS_KEY]) >= 2,
+    )
+    assert len(app[OPERATIONS_KEY]) >= 2
+
+
+def test_malformed_tickers_are_skipped() -> None:
+    """Test bad messages and tickers are skipped and good tickers are kept."""
+    stream = ws_ingest.TickerStream()
+    stream.handle_message('not json')
+    stream.handle_message(get_tickers_message([{'instId': 'ETH-USD-SWAP', 'last': ''}]))
+    stream.handle_message(BTC_TICKER)
+    assert stream.ticks == {'BTC': 1.5}
@@ -0,0 +1,162 @@
+"""Module with alert firing engines.
+
+`index` engine finds reached alerts in the in-memory alert index,
+`sql` engine finds and deletes them with one db statement.
+"""
+
+import asyncio
+import logging
+from uuid import UUID
+
+from sqlalchemy import and_, delete, or_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Alert
+
+from .alert_index import DEC_ALERT, INC_ALERT, AlertEntry, alert_index
+from .constants import ALERT_ENGINE, ALERT_INDEX_RESYNC_SECONDS
+from .db_utils import get_session
+
+logger = logging.getLogger(__name__)
+
+SQL_ENGINE = 'sql'
+
+_loaded = asyncio.Event()
+
+
+async def claim_alerts(db: AsyncSession, fired: list[AlertEntry]) -> list[AlertEntry]:
+    """Delete fired alerts from db.
+
+    Alerts already deleted by someone else are skipped.
+
+    Args:
+        db: AsyncSession - db session.
+        fired: list[AlertEntry] - alerts reached by price.
+
+    Raises:
+        SQLAlchemyError: on db error, alerts are returned to the index.
+
+    Returns:
+        list[AlertEntry]: deleted alerts.
+    """
+    fired_ids = [entry.id for entry in fired]
+    try:
+        deleted = await db.execute(
+            delete(Alert).where(Alert.id.in_(fired_ids)).returning(Alert.id),
+            execution_options={'synchronize_session': False},
+        )
+    except SQLAlchemyError:
+        for fired_entry in fired:
+            alert_index.add(fired_entry)
+        raise
+    deleted_ids = set(deleted.scalars().all())
+    return [alert for alert in fired if alert.id in deleted_ids]
+
+
+async def claim_reached_alerts(
+    db: AsyncSession,
+    coin_id: UUID,
+    current_price: float,
+) -> list[AlertEntry]:
+    """Find and delete reached coin alerts with one statement.
+
+    Args:
+        db: AsyncSession - db session.
+        coin_id: UUID - coin id.
+        current_price: float - current coin price.
+
+    Returns:
+        list[AlertEntry]: deleted alerts.
+    """
+    deleted = await db.execute(
+        delete(Alert).where(
+            Alert.coin_id == coin_id,
+            or_(
+                and_(Alert.alert_type == INC_ALERT, Alert.threshold_price <= current_price),
+                and_(Alert.alert_type == DEC_ALERT, Alert.threshold_price >= current_price),
+            ),
+        ).returning(
+            Alert.id,
+            Alert.coin_id,
+            Alert.alert_type,
+            Alert.threshold_price,
+            Alert.email,
+        ),
+        execution_options={'synchronize_session': False},
+    )
+    return [AlertEntry(*row) for row in deleted.all()]
+
+
+def may_fire(coin_id: UUID, current_price: float, moved: bool = True) -> bool:
+    """Check if price can fire coin alerts without db request.
+
+    `sql` engine can not check thresholds without db, so it skips prices dropped by tick filter.
+
+    Args:
+        coin_id: UUID - coin id.
+        current_price: float - current coin price.
+        moved: bool, optional - False if price did not move since last stored one.
+
+    Returns:
+        bool: False if no alert can be reached.
+    """
+    if ALERT_ENGINE == SQL_ENGINE:
+        return moved
+    return alert_index.is_triggered(coin_id, current_price)
+
+
+async def fire_alerts(db: AsyncSession, coin_id: UUID, current_price: float) -> list[AlertEntry]:
+    """Find reached coin alerts and delete them.
+
+    Args:
+        db: AsyncSession - db session.
+        coin_id: UUID - coin id.
+        current_price: float - current coin price.
+
+    Returns:
+        list[AlertEntry]: fired alerts.
+    """
+    if ALERT_ENGINE == SQL_ENGINE:
+        return await claim_reached_alerts(db, coin_id, current_price)
+    fired = alert_index.pop_triggered(coin_id, current_price)
+    return await claim_alerts(db, fired) if fired else []
+
+
+def restore_alerts(fired: list[AlertEntry]) -> None:
+    """Return fired alerts to the index if their deletion was not committed.
+
+    Args:
+        fired: list[AlertEntry] - fired alerts.
+    """
+    if ALERT_ENGINE == SQL_ENGINE:
+        return
+    for fired_entry in fired:
+        alert_index.add(fired_entry)
+
+
+async def sync_alerts() -> None:
+    """Load alert index from db if it is used."""
+    if ALERT_ENGINE != SQL_ENGINE:
+        async for session in get_session():
+            await alert_index.load(session)
+    _loaded.set()
+
+
+async def wait_alerts_loaded() -> None:
+    """Wait until alert index is loaded first time, so alerts are not checked against empty one."""
+    await _loaded.wait()
+
+
+async def run_alerts_sync() -> None:
+    """Infinite loop for loading alert index at startup and syncing it with db.
+
+    Index is synced apart from poll cycles, so long loads do not delay prices.
+    """
+    infinite = True
+    while infinite:
+        try:
+            await sync_alerts()
+        except (SQLAlchemyError, OSError):
+            logger.exception('Alert index sync failed')
+        await asyncio.sleep(ALERT_INDEX_RESYNC_SECONDS)
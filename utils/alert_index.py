@@ -0,0 +1,244 @@
+"""Module with in-memory index of alerts thresholds."""
+
+import asyncio
+import time
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Alert
+
+INC_ALERT = 'inc'
+DEC_ALERT = 'dec'
+LOAD_CHUNK_SIZE = 10000
+
+
+class AlertEntry(NamedTuple):
+    """Alert data needed to fire it."""
+
+    id: UUID
+    coin_id: UUID
+    alert_type: str
+    threshold_price: float
+    email: str
+
+
+class ThresholdBook:
+    """Alerts of one coin and type sorted by threshold price."""
+
+    def __init__(self) -> None:
+        """Create empty book."""
+        self.thresholds: list[float] = []
+        self.entries: list[AlertEntry] = []
+
+    def add(self, entry: AlertEntry) -> None:
+        """Insert alert keeping thresholds sorted.
+
+        Args:
+            entry: AlertEntry - alert to insert.
+        """
+        position = bisect_right(self.thresholds, entry.threshold_price)
+        self.thresholds.insert(position, entry.threshold_price)
+        self.entries.insert(position, entry)
+
+    def remove(self, alert_id: UUID, threshold_price: float) -> None:
+        """Remove alert.
+
+        Args:
+            alert_id: UUID - alert id.
+            threshold_price: float - alert threshold price.
+        """
+        start = bisect_left(self.thresholds, threshold_price)
+        end = bisect_right(self.thresholds, threshold_price)
+        for position in range(start, end):
+            if self.entries[position].id == alert_id:
+                self.thresholds.pop(position)
+                self.entries.pop(position)
+                return
+
+    def pop_below(self, price: float) -> list[AlertEntry]:
+        """Remove and return alerts with threshold less or equal to price.
+
+        Args:
+            price: float - current price.
+
+        Returns:
+            list[AlertEntry]: removed alerts.
+        """
+        position = bisect_right(self.thresholds, price)
+        fired = self.entries[:position]
+        self.thresholds = self.thresholds[position:]
+        self.entries = self.entries[position:]
+        return fired
+
+    def pop_above(self, price: float) -> list[AlertEntry]:
+        """Remove and return alerts with threshold greater or equal to price.
+
+        Args:
+            price: float - current price.
+
+        Returns:
+            list[AlertEntry]: removed alerts.
+        """
+        position = bisect_left(self.thresholds, price)
+        fired = self.entries[position:]
+        self.thresholds = self.thresholds[:position]
+        self.entries = self.entries[:position]
+        return fired
+
+
+Books = dict[tuple[UUID, str], ThresholdBook]
+AlertsLocations = dict[UUID, tuple[UUID, str, float]]
+
+
+def index_entry(books: Books, alerts: AlertsLocations, entry: AlertEntry) -> None:
+    """Put alert into its threshold book and remember where it is.
+
+    Args:
+        books: Books - threshold books by coin and alert type.
+        alerts: AlertsLocations - coin, type and threshold by alert id.
+        entry: AlertEntry - alert.
+    """
+    books.setdefault((entry.coin_id, entry.alert_type), ThresholdBook()).add(entry)
+    alerts[entry.id] = (entry.coin_id, entry.alert_type, entry.threshold_price)
+
+
+async def load_books(db: AsyncSession) -> tuple[Books, AlertsLocations]:
+    """Build threshold books of all alerts from db.
+
+    Alerts are indexed in chunks, so prices are processed while books are built.
+
+    Args:
+        db: AsyncSession - db session.
+
+    Returns:
+        tuple[Books, AlertsLocations]: books and alerts locations.
+    """
+    query = await db.execute(
+        select(
+            Alert.id,
+            Alert.coin_id,
+            Alert.alert_type,
+            Alert.threshold_price,
+            Alert.email,
+        ).order_by(Alert.threshold_price),
+    )
+    books: Books = {}
+    alerts: AlertsLocations = {}
+    for position, alert in enumerate(query.all(), 1):
+        index_entry(books, alerts, AlertEntry(*alert))
+        if not position % LOAD_CHUNK_SIZE:
+            await asyncio.sleep(0)
+    return books, alerts
+
+
+class AlertIndex:
+    """Alerts thresholds by coin, `inc` and `dec` alerts are kept separately."""
+
+    def __init__(self) -> None:
+        """Create empty index."""
+        self._books: Books = {}
+        self._alerts: AlertsLocations = {}
+        self._journal: list[tuple] | None = None
+        self.loaded_at: float | None = None
+
+    def add(self, alert: Alert) -> None:
+        """Add alert or replace it if alert is already indexed.
+
+        Args:
+            alert: Alert - alert, alert entry or row with alert columns.
+        """
+        self.remove(alert.id)
+        entry = AlertEntry(
+            alert.id,
+            alert.coin_id,
+            alert.alert_type,
+            alert.threshold_price,
+            alert.email,
+        )
+        index_entry(self._books, self._alerts, entry)
+        if self._journal is not None:
+            self._journal.append((self.add, entry))
+
+    def remove(self, alert_id: UUID) -> None:
+        """Remove alert from index.
+
+        Args:
+            alert_id: UUID - alert id.
+        """
+        if self._journal is not None:
+            self._journal.append((self.remove, alert_id))
+        location = self._alerts.pop(alert_id, None)
+        if location is not None:
+            coin_id, alert_type, threshold_price = location
+            self._books[(coin_id, alert_type)].remove(alert_id, threshold_price)
+
+    def is_triggered(self, coin_id: UUID, price: float) -> bool:
+        """Check if any coin alert is reached by price.
+
+        Args:
+            coin_id: UUID - coin id.
+            price: float - current price.
+
+        Returns:
+            bool: True if at least one alert is reached.
+        """
+        inc_book = self._books.get((coin_id, INC_ALERT))
+        dec_book = self._books.get((coin_id, DEC_ALERT))
+        inc_reached = inc_book and inc_book.thresholds and inc_book.thresholds[0] <= price
+        dec_reached = dec_book and dec_book.thresholds and dec_book.thresholds[-1] >= price
+        return bool(inc_reached or dec_reached)
+
+    def pop_triggered(self, coin_id: UUID, price: float) -> list[AlertEntry]:
+        """Remove and return coin alerts reached by price.
+
+        Removals are journaled like `remove`, so reload does not bring fired alerts back.
+
+        Args:
+            coin_id: UUID - coin id.
+            price: float - current price.
+
+        Returns:
+            list[AlertEntry]: reached alerts.
+        """
+        fired = []
+        if (coin_id, INC_ALERT) in self._books:
+            fired.extend(self._books[(coin_id, INC_ALERT)].pop_below(price))
+        if (coin_id, DEC_ALERT) in self._books:
+            fired.extend(self._books[(coin_id, DEC_ALERT)].pop_above(price))
+        for entry in fired:
+            self._alerts.pop(entry.id, None)
+            if self._journal is not None:
+                self._journal.append((self.remove, entry.id))
+        return fired
+
+    async def load(self, db: AsyncSession) -> None:
+        """Load all alerts from db into new books and swap them in.
+
+        Changes made while alerts are loading are applied after swap.
+
+        Args:
+            db: AsyncSession - db session.
+
+        Raises:
+            asyncio.CancelledError: if load is cancelled, index is kept.
+            Exception: on load error, index is kept.
+        """
+        self._journal = []
+        try:
+            books, alerts = await load_books(db)
+        except (asyncio.CancelledError, Exception):
+            self._journal = None
+            raise
+        journal, self._journal = self._journal, None
+        self._books = books
+        self._alerts = alerts
+        for operation, argument in journal:
+            operation(argument)
+        self.loaded_at = time.monotonic()
+
+
+alert_index = AlertIndex()
@@ -0,0 +1,48 @@
+"""Module with app background tasks."""
+
+import asyncio
+
+from .alert_engine import run_alerts_sync, wait_alerts_loaded
+from .constants import PRICE_INGEST_MODE
+from .dead_emails import run_dead_emails_purge
+from .email_dispatcher import run_email_dispatcher
+from .http_utils import close_http_session, get_http_session
+from .instruments import run_instruments_refresh
+from .poller import periodic_function
+from .price_partitions import run_partition_manager
+from .rollup_job import run_rollups
+from .smtp_pool import close_smtp_pool
+from .ws_ingest import run_ws_ingest
+
+_tasks: list[asyncio.Task] = []
+
+
+async def run_price_ingest() -> None:
+    """Start prices ingestion once alert index is loaded first time."""
+    await wait_alerts_loaded()
+    if PRICE_INGEST_MODE == 'ws':
+        await run_ws_ingest()
+    else:
+        await periodic_function()
+
+
+async def start_background_tasks() -> None:
+    """Open shared clients and start background tasks."""
+    get_http_session()
+    _tasks.append(asyncio.create_task(run_instruments_refresh()))
+    _tasks.append(asyncio.create_task(run_alerts_sync()))
+    _tasks.append(asyncio.create_task(run_price_ingest()))
+    _tasks.append(asyncio.create_task(run_email_dispatcher()))
+    _tasks.append(asyncio.create_task(run_dead_emails_purge()))
+    _tasks.append(asyncio.create_task(run_rollups()))
+    _tasks.append(asyncio.create_task(run_partition_manager()))
+
+
+async def stop_background_tasks() -> None:
+    """Cancel background tasks and close shared clients."""
+    for task in _tasks:
+        task.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
+    _tasks.clear()
+    await close_http_session()
+    await close_smtp_pool()
@@ -6,9 +6,109 @@ from dotenv import load_dotenv
 
 DEFAULT_SMTP_PORT = 587
 DEFAULT_APP_PORT = 8000
+DEFAULT_HTTP_POOL_SIZE = 100
+DEFAULT_HTTP_POOL_PER_HOST = 20
+DEFAULT_HTTP_KEEPALIVE_TIMEOUT = 30
+DEFAULT_HTTP_DNS_CACHE_TTL = 300
+DEFAULT_HTTP_TIMEOUT = 10
+DEFAULT_ALERT_INDEX_RESYNC_SECONDS = 60
+DEFAULT_PRICE_CACHE_TTL = 10
+DEFAULT_POLL_INTERVAL = 2
+DEFAULT_POLL_CYCLE_TIMEOUT = 30
+DEFAULT_COIN_FETCH_TIMEOUT = 5
+DEFAULT_POLL_CONCURRENCY = 10
+DEFAULT_TICK_FILTER_HEARTBEAT = 0
+DEFAULT_TICK_FILTER_ABS_EPSILON = 0
+DEFAULT_TICK_FILTER_REL_THRESHOLD = 0
+DEFAULT_FAKE_EXCHANGE_COINS = 'BTC,ETH,SOL,UNI,LTC,DOGE,XRP,ADA,DOT,LINK'
+DEFAULT_FAKE_EXCHANGE_SPEED = 0
+DEFAULT_FAKE_EXCHANGE_SEED = 0
+DEFAULT_FAKE_EXCHANGE_STEPS = 1000
+DEFAULT_FAKE_EXCHANGE_VOLATILITY = 0.001
+DEFAULT_WS_FLUSH_INTERVAL = 0.5
+DEFAULT_WS_COINS_REFRESH_INTERVAL = 5
+DEFAULT_WS_PING_INTERVAL = 20
+DEFAULT_WS_PONG_TIMEOUT = 10
+DEFAULT_WS_RECONNECT_DELAY = 1
+DEFAULT_EXCHANGE_RATE_LIMIT = 10
+DEFAULT_EXCHANGE_RATE_BURST = 20
+DEFAULT_EXCHANGE_BACKOFF_BASE = 1
+DEFAULT_EXCHANGE_BACKOFF_MAX = 60
+DEFAULT_DB_POOL_SIZE = 10
+DEFAULT_DB_MAX_OVERFLOW = 20
+DEFAULT_DB_POOL_TIMEOUT = 30
+DEFAULT_DB_POOL_RECYCLE = 1800
+DEFAULT_DB_STATEMENT_CACHE_SIZE = 100
+DEFAULT_SQL_SLOW_QUERY_SECONDS = 0.5
+DEFAULT_SQL_LOG_SAMPLE_RATE = 0.01
+DEFAULT_INSTRUMENTS_REFRESH_INTERVAL = 600
+DEFAULT_EXPORT_CHUNK_SIZE = 1000
+DEFAULT_ROLLUP_INTERVAL = 30
+DEFAULT_ROLLUP_LAG_SECONDS = 10
+DEFAULT_PRICES_RETENTION_DAYS = 30
+DEFAULT_PRICE_PARTITIONS_AHEAD_DAYS = 7
+DEFAULT_PRICE_PARTITIONS_INTERVAL = 3600
+DEFAULT_EMAIL_DISPATCH_CONCURRENCY = 10
+DEFAULT_EMAIL_DISPATCH_BATCH_SIZE = 100
+DEFAULT_EMAIL_DISPATCH_INTERVAL = 1
+DEFAULT_EMAIL_MAX_ATTEMPTS = 5
+DEFAULT_EMAIL_RETRY_BASE_SECONDS = 5
+DEFAULT_EMAIL_RETRY_MAX_SECONDS = 600
+DEFAULT_EMAIL_CLAIM_SECONDS = 60
+DEFAULT_EMAIL_DIGEST_WINDOW = 5
+DEFAULT_EMAIL_DEAD_RETENTION_DAYS = 7
+DEFAULT_EMAIL_DEAD_CHECK_INTERVAL = 60
+DEFAULT_SMTP_POOL_SIZE = 5
+DEFAULT_SMTP_POOL_MAX_MESSAGES = 100
+DEFAULT_SMTP_POOL_IDLE_CHECK_SECONDS = 30
 
 load_dotenv()
 
+
+def _int_env(field: str, default: int) -> int:
+    """Get integer value from the environment.
+
+    Args:
+        field: str - variable name.
+        default: int - value if variable is not set or not a number.
+
+    Returns:
+        int: variable value.
+    """
+    env_value = getenv(field)
+    return int(env_value) if env_value and env_value.isdigit() else default
+
+
+def _flag_env(field: str, default: bool = True) -> bool:
+    """Get flag from the environment, flag is on if it is set to anything except false.
+
+    Args:
+        field: str - variable name.
+        default: bool, optional - value if variable is not set.
+
+    Returns:
+        bool: variable value.
+    """
+    env_value = getenv(field)
+    return default if env_value is None else env_value != 'false'
+
+
+def _float_env(field: str, default: float) -> float:
+    """Get float value from the environment.
+
+    Args:
+        field: str - variable name.
+        default: float - value if variable is not set or not a number.
+
+    Returns:
+        float: variable value.
+    """
+    try:
+        return float(getenv(field, default))
+    except ValueError:
+        return default
+
+
 pg_fields = ['POSTGRES_HOST', 'POSTGRES_PORT', 'POSTGRES_USER', 'POSTGRES_PASSWORD', 'POSTGRES_DB']
 smtp_fields = ['SMTP_HOST', 'SMTP_PORT', 'SMTP_USERNAME', 'SMTP_PASSWORD']
 
@@ -20,6 +120,13 @@ HOST = HOST if getenv('DEBUG_MODE') == 'false' else 'localhost'
 
 SMTP_HOST, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD = [getenv(field) for field in smtp_fields]
 SMTP_PORT = int(SMTP_PORT) if SMTP_PORT and SMTP_PORT.isdigit() else DEFAULT_SMTP_PORT
+SMTP_START_TLS = _flag_env('SMTP_START_TLS')
+SMTP_POOL_SIZE = _int_env('SMTP_POOL_SIZE', DEFAULT_SMTP_POOL_SIZE)
+SMTP_POOL_MAX_MESSAGES = _int_env('SMTP_POOL_MAX_MESSAGES', DEFAULT_SMTP_POOL_MAX_MESSAGES)
+SMTP_POOL_IDLE_CHECK_SECONDS = _float_env(
+    'SMTP_POOL_IDLE_CHECK_SECONDS',
+    DEFAULT_SMTP_POOL_IDLE_CHECK_SECONDS,
+)
 
 APP_HOST = getenv('APP_HOST', '127.0.0.1')
 APP_PORT = getenv('APP_PORT')
@@ -27,3 +134,98 @@ try:
     APP_PORT = int(APP_PORT) if APP_PORT and APP_PORT.isdigit() else DEFAULT_APP_PORT
 except ValueError:
     APP_PORT = DEFAULT_APP_PORT
+
+DB_POOL_SIZE = _int_env('DB_POOL_SIZE', DEFAULT_DB_POOL_SIZE)
+DB_MAX_OVERFLOW = _int_env('DB_MAX_OVERFLOW', DEFAULT_DB_MAX_OVERFLOW)
+DB_POOL_TIMEOUT = _float_env('DB_POOL_TIMEOUT', DEFAULT_DB_POOL_TIMEOUT)
+DB_POOL_RECYCLE = _int_env('DB_POOL_RECYCLE', DEFAULT_DB_POOL_RECYCLE)
+DB_POOL_PRE_PING = _flag_env('DB_POOL_PRE_PING')
+DB_STATEMENT_CACHE_SIZE = _int_env('DB_STATEMENT_CACHE_SIZE', DEFAULT_DB_STATEMENT_CACHE_SIZE)
+SQL_LOG_MODE = getenv('SQL_LOG_MODE', 'slow')
+SQL_SLOW_QUERY_SECONDS = _float_env('SQL_SLOW_QUERY_SECONDS', DEFAULT_SQL_SLOW_QUERY_SECONDS)
+SQL_LOG_SAMPLE_RATE = _float_env('SQL_LOG_SAMPLE_RATE', DEFAULT_SQL_LOG_SAMPLE_RATE)
+
+OKX_API_URL = getenv('OKX_API_URL', 'https://www.okx.com/api/v5')
+HTTP_POOL_SIZE = _int_env('HTTP_POOL_SIZE', DEFAULT_HTTP_POOL_SIZE)
+HTTP_POOL_PER_HOST = _int_env('HTTP_POOL_PER_HOST', DEFAULT_HTTP_POOL_PER_HOST)
+HTTP_KEEPALIVE_TIMEOUT = _float_env('HTTP_KEEPALIVE_TIMEOUT', DEFAULT_HTTP_KEEPALIVE_TIMEOUT)
+HTTP_DNS_CACHE_TTL = _int_env('HTTP_DNS_CACHE_TTL', DEFAULT_HTTP_DNS_CACHE_TTL)
+HTTP_TIMEOUT = _float_env('HTTP_TIMEOUT', DEFAULT_HTTP_TIMEOUT)
+COIN_FETCH_TIMEOUT = _float_env('COIN_FETCH_TIMEOUT', DEFAULT_COIN_FETCH_TIMEOUT)
+POLL_INTERVAL = _float_env('POLL_INTERVAL', DEFAULT_POLL_INTERVAL)
+POLL_CYCLE_TIMEOUT = _float_env('POLL_CYCLE_TIMEOUT', DEFAULT_POLL_CYCLE_TIMEOUT)
+POLL_CONCURRENCY = _int_env('POLL_CONCURRENCY', DEFAULT_POLL_CONCURRENCY)
+TICK_FILTER_HEARTBEAT = _float_env('TICK_FILTER_HEARTBEAT', DEFAULT_TICK_FILTER_HEARTBEAT)
+TICK_FILTER_ABS_EPSILON = _float_env('TICK_FILTER_ABS_EPSILON', DEFAULT_TICK_FILTER_ABS_EPSILON)
+TICK_FILTER_REL_THRESHOLD = _float_env(
+    'TICK_FILTER_REL_THRESHOLD',
+    DEFAULT_TICK_FILTER_REL_THRESHOLD,
+)
+PRICE_INGEST_MODE = getenv('PRICE_INGEST_MODE', 'rest')
+OKX_WS_URL = getenv('OKX_WS_URL', 'wss://ws.okx.com:8443/ws/v5/public')
+PRICE_SOURCE = getenv('PRICE_SOURCE', 'okx')
+FAKE_EXCHANGE_PATHS = getenv('FAKE_EXCHANGE_PATHS')
+FAKE_EXCHANGE_COINS = getenv('FAKE_EXCHANGE_COINS', DEFAULT_FAKE_EXCHANGE_COINS).split(',')
+FAKE_EXCHANGE_SPEED = _float_env('FAKE_EXCHANGE_SPEED', DEFAULT_FAKE_EXCHANGE_SPEED)
+FAKE_EXCHANGE_SEED = _int_env('FAKE_EXCHANGE_SEED', DEFAULT_FAKE_EXCHANGE_SEED)
+FAKE_EXCHANGE_STEPS = _int_env('FAKE_EXCHANGE_STEPS', DEFAULT_FAKE_EXCHANGE_STEPS)
+FAKE_EXCHANGE_VOLATILITY = _float_env('FAKE_EXCHANGE_VOLATILITY', DEFAULT_FAKE_EXCHANGE_VOLATILITY)
+WS_FLUSH_INTERVAL = _float_env('WS_FLUSH_INTERVAL', DEFAULT_WS_FLUSH_INTERVAL)
+WS_COINS_REFRESH_INTERVAL = _float_env(
+    'WS_COINS_REFRESH_INTERVAL',
+    DEFAULT_WS_COINS_REFRESH_INTERVAL,
+)
+WS_PING_INTERVAL = _float_env('WS_PING_INTERVAL', DEFAULT_WS_PING_INTERVAL)
+WS_PONG_TIMEOUT = _float_env('WS_PONG_TIMEOUT', DEFAULT_WS_PONG_TIMEOUT)
+WS_RECONNECT_DELAY = _float_env('WS_RECONNECT_DELAY', DEFAULT_WS_RECONNECT_DELAY)
+EXCHANGE_RATE_LIMIT = _float_env('EXCHANGE_RATE_LIMIT', DEFAULT_EXCHANGE_RATE_LIMIT)
+EXCHANGE_RATE_BURST = _float_env('EXCHANGE_RATE_BURST', DEFAULT_EXCHANGE_RATE_BURST)
+EXCHANGE_BACKOFF_BASE = _float_env('EXCHANGE_BACKOFF_BASE', DEFAULT_EXCHANGE_BACKOFF_BASE)
+EXCHANGE_BACKOFF_MAX = _float_env('EXCHANGE_BACKOFF_MAX', DEFAULT_EXCHANGE_BACKOFF_MAX)
+
+ALERT_INDEX_RESYNC_SECONDS = _float_env(
+    'ALERT_INDEX_RESYNC_SECONDS',
+    DEFAULT_ALERT_INDEX_RESYNC_SECONDS,
+)
+ALERT_ENGINE = getenv('ALERT_ENGINE', 'index')
+PRICE_CACHE_TTL = _float_env('PRICE_CACHE_TTL', DEFAULT_PRICE_CACHE_TTL)
+INSTRUMENTS_REFRESH_INTERVAL = _float_env(
+    'INSTRUMENTS_REFRESH_INTERVAL',
+    DEFAULT_INSTRUMENTS_REFRESH_INTERVAL,
+)
+EXPORT_CHUNK_SIZE = _int_env('EXPORT_CHUNK_SIZE', DEFAULT_EXPORT_CHUNK_SIZE)
+ROLLUP_INTERVAL = _float_env('ROLLUP_INTERVAL', DEFAULT_ROLLUP_INTERVAL)
+ROLLUP_LAG_SECONDS = _float_env('ROLLUP_LAG_SECONDS', DEFAULT_ROLLUP_LAG_SECONDS)
+PRICES_RETENTION_DAYS = _int_env('PRICES_RETENTION_DAYS', DEFAULT_PRICES_RETENTION_DAYS)
+PRICE_PARTITIONS_AHEAD_DAYS = _int_env(
+    'PRICE_PARTITIONS_AHEAD_DAYS',
+    DEFAULT_PRICE_PARTITIONS_AHEAD_DAYS,
+)
+PRICE_PARTITIONS_INTERVAL = _float_env(
+    'PRICE_PARTITIONS_INTERVAL',
+    DEFAULT_PRICE_PARTITIONS_INTERVAL,
+)
+PRICE_PARTITIONS_DROP = _flag_env('PRICE_PARTITIONS_DROP')
+
+EMAIL_DISPATCH_CONCURRENCY = _int_env(
+    'EMAIL_DISPATCH_CONCURRENCY',
+    DEFAULT_EMAIL_DISPATCH_CONCURRENCY,
+)
+EMAIL_DISPATCH_BATCH_SIZE = _int_env(
+    'EMAIL_DISPATCH_BATCH_SIZE',
+    DEFAULT_EMAIL_DISPATCH_BATCH_SIZE,
+)
+EMAIL_DISPATCH_INTERVAL = _float_env('EMAIL_DISPATCH_INTERVAL', DEFAULT_EMAIL_DISPATCH_INTERVAL)
+EMAIL_MAX_ATTEMPTS = _int_env('EMAIL_MAX_ATTEMPTS', DEFAULT_EMAIL_MAX_ATTEMPTS)
+EMAIL_RETRY_BASE_SECONDS = _float_env('EMAIL_RETRY_BASE_SECONDS', DEFAULT_EMAIL_RETRY_BASE_SECONDS)
+EMAIL_RETRY_MAX_SECONDS = _float_env('EMAIL_RETRY_MAX_SECONDS', DEFAULT_EMAIL_RETRY_MAX_SECONDS)
+EMAIL_CLAIM_SECONDS = _float_env('EMAIL_CLAIM_SECONDS', DEFAULT_EMAIL_CLAIM_SECONDS)
+EMAIL_DIGEST_WINDOW = _float_env('EMAIL_DIGEST_WINDOW', DEFAULT_EMAIL_DIGEST_WINDOW)
+EMAIL_DEAD_RETENTION_DAYS = _int_env(
+    'EMAIL_DEAD_RETENTION_DAYS',
+    DEFAULT_EMAIL_DEAD_RETENTION_DAYS,
+)
+EMAIL_DEAD_CHECK_INTERVAL = _float_env(
+    'EMAIL_DEAD_CHECK_INTERVAL',
+    DEFAULT_EMAIL_DEAD_CHECK_INTERVAL,
+)
@@ -0,0 +1,66 @@
+"""Module with the db connections pool which reports its usage to metrics."""
+
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from . import metrics
+from .constants import (DB_MAX_OVERFLOW, DB_POOL_PRE_PING, DB_POOL_RECYCLE,
+                        DB_POOL_SIZE, DB_POOL_TIMEOUT, DB_STATEMENT_CACHE_SIZE)
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool which observes checkout wait and saturation."""
+
+    def report_usage(self) -> None:
+        """Set gauges of checked out connections and their share of pool capacity."""
+        checked_out = self.checkedout()
+        capacity = self.size() + max(self._max_overflow, 0)
+        metrics.set_gauge('db_pool_checked_out', checked_out)
+        metrics.set_gauge('db_pool_saturation', checked_out / capacity if capacity else 0)
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """Get connection, waiting for a free one if pool is exhausted.
+
+        Raises:
+            PoolTimeoutError: if no connection is freed in pool timeout.
+
+        Returns:
+            ConnectionPoolEntry: pooled connection.
+        """
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            metrics.increment('db_pool_timeouts_total')
+            raise
+        metrics.observe('db_pool_checkout_seconds', time.perf_counter() - started)
+        self.report_usage()
+        return connection
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        """Return connection to pool.
+
+        Args:
+            record: ConnectionPoolEntry - pooled connection.
+        """
+        super()._do_return_conn(record)
+        self.report_usage()
+
+
+def get_pool_options() -> dict:
+    """Get engine pool and asyncpg options from settings.
+
+    Returns:
+        dict: create_async_engine keyword arguments.
+    """
+    return {
+        'poolclass': MeteredQueuePool,
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW,
+        'pool_timeout': DB_POOL_TIMEOUT,
+        'pool_recycle': DB_POOL_RECYCLE or -1,
+        'pool_pre_ping': DB_POOL_PRE_PING,
+        'connect_args': {'prepared_statement_cache_size': DB_STATEMENT_CACHE_SIZE},
+    }
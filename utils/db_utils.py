@@ -6,6 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from .constants import DBNAME, HOST, PASSWORD, PORT, USER
+from .db_pool import get_pool_options
+from .query_log import instrument_engine
 
 
 def load_db(protocol: str = 'postgresql+psycopg') -> str:
@@ -34,10 +36,14 @@ def load_async_db() -> str:
 def init_session() -> AsyncSession:
     """Initialize session.
 
+    SQL is not echoed, queries are timed and logged by query_log.
+    Pool reports checkout wait and saturation to metrics.
+
     Returns:
         AsyncSession: created session.
     """
-    engine = create_async_engine(load_async_db(), echo=True)
+    engine = create_async_engine(load_async_db(), **get_pool_options())
+    instrument_engine(engine)
     return sessionmaker(
         autocommit=False,
         autoflush=False,
@@ -0,0 +1,52 @@
+"""Module with purging of emails which were not sent after all attempts."""
+
+import asyncio
+import logging
+from datetime import timedelta
+
+from sqlalchemy import delete, func, select
+
+from models import EmailOutbox
+
+from . import metrics
+from .constants import (EMAIL_DEAD_CHECK_INTERVAL, EMAIL_DEAD_RETENTION_DAYS,
+                        EMAIL_MAX_ATTEMPTS)
+from .db_utils import get_session
+from .time_utils import get_current_datetime
+
+logger = logging.getLogger(__name__)
+
+
+async def purge_dead_emails() -> int:
+    """Delete emails which failed all attempts more than EMAIL_DEAD_RETENTION_DAYS ago.
+
+    Number of kept dead emails is set to `email_outbox_dead` gauge.
+
+    Returns:
+        int: number of deleted emails.
+    """
+    is_dead = EmailOutbox.attempts >= EMAIL_MAX_ATTEMPTS
+    expired_at = get_current_datetime() - timedelta(days=EMAIL_DEAD_RETENTION_DAYS)
+    async for session in get_session():
+        purged = await session.execute(
+            delete(EmailOutbox).where(is_dead, EmailOutbox.next_attempt_at < expired_at),
+            execution_options={'synchronize_session': False},
+        )
+        dead_count = await session.scalar(
+            select(func.count()).select_from(EmailOutbox).where(is_dead),
+        )
+        await session.commit()
+    metrics.set_gauge('email_outbox_dead', dead_count)
+    metrics.increment('emails_dead_purged_total', purged.rowcount)
+    return purged.rowcount
+
+
+async def run_dead_emails_purge() -> None:
+    """Infinite loop for purging dead emails."""
+    infinite = True
+    while infinite:
+        try:
+            await purge_dead_emails()
+        except Exception:
+            logger.exception('Dead emails purge failed')
+        await asyncio.sleep(EMAIL_DEAD_CHECK_INTERVAL)
@@ -0,0 +1,201 @@
+"""Module with the email outbox dispatcher."""
+
+import asyncio
+import logging
+from datetime import timedelta
+
+import aiosmtplib
+from sqlalchemy import Row, delete, select, update
+
+from models import EmailOutbox
+
+from . import metrics
+from .constants import (EMAIL_CLAIM_SECONDS, EMAIL_DIGEST_WINDOW,
+                        EMAIL_DISPATCH_BATCH_SIZE, EMAIL_DISPATCH_CONCURRENCY,
+                        EMAIL_DISPATCH_INTERVAL, EMAIL_MAX_ATTEMPTS,
+                        EMAIL_RETRY_BASE_SECONDS, EMAIL_RETRY_MAX_SECONDS)
+from .db_utils import get_session
+from .email_utils import send_email
+from .time_utils import get_current_datetime
+
+logger = logging.getLogger(__name__)
+
+
+def get_retry_delay(attempts: int) -> float:
+    """Get delay before next sending attempt.
+
+    Args:
+        attempts: int - number of failed attempts.
+
+    Returns:
+        float: delay in seconds, doubled after every attempt.
+    """
+    return min(EMAIL_RETRY_BASE_SECONDS * 2 ** (attempts - 1), EMAIL_RETRY_MAX_SECONDS)
+
+
+async def claim_emails() -> list[Row]:
+    """Claim due emails for sending.
+
+    Emails wait EMAIL_DIGEST_WINDOW seconds to be sent in one digest with
+    other emails for the same recipient. Claimed emails are hidden from
+    other dispatchers for EMAIL_CLAIM_SECONDS.
+
+    Returns:
+        list[Row]: claimed emails.
+    """
+    now = get_current_datetime()
+    due_emails = select(EmailOutbox.id).where(
+        EmailOutbox.next_attempt_at <= now,
+        EmailOutbox.created_at <= now - timedelta(seconds=EMAIL_DIGEST_WINDOW),
+        EmailOutbox.attempts < EMAIL_MAX_ATTEMPTS,
+    ).order_by(
+        EmailOutbox.next_attempt_at,
+    ).limit(EMAIL_DISPATCH_BATCH_SIZE).with_for_update(skip_locked=True)
+    async for session in get_session():
+        claimed = await session.execute(
+            update(EmailOutbox).where(
+                EmailOutbox.id.in_(due_emails),
+            ).values(
+                next_attempt_at=now + timedelta(seconds=EMAIL_CLAIM_SECONDS),
+            ).returning(
+                EmailOutbox.id,
+                EmailOutbox.recipient,
+                EmailOutbox.subject,
+                EmailOutbox.body,
+                EmailOutbox.attempts,
+            ),
+            execution_options={'synchronize_session': False},
+        )
+        emails = claimed.all()
+        await session.commit()
+    return emails
+
+
+def group_by_recipient(emails: list[Row]) -> dict[str, list[Row]]:
+    """Group claimed emails by recipient.
+
+    Args:
+        emails: list[Row] - claimed emails.
+
+    Returns:
+        dict[str, list[Row]]: emails by recipient.
+    """
+    digests: dict[str, list[Row]] = {}
+    for email in emails:
+        digests.setdefault(email.recipient, []).append(email)
+    return digests
+
+
+def render_digest(emails: list[Row]) -> tuple[str, str]:
+    """Render one message from emails for the same recipient.
+
+    Args:
+        emails: list[Row] - recipient emails.
+
+    Returns:
+        tuple[str, str]: subject and body.
+    """
+    first_email = emails[0]
+    emails_count = len(emails)
+    if emails_count == 1:
+        return first_email.subject, first_email.body
+    bodies = '\n'.join(email.body.strip() for email in emails)
+    return (
+        f'{first_email.subject} ({emails_count})',
+        f'Сработало уведомлений: {emails_count}.\n\n{bodies}',
+    )
+
+
+async def deliver_digest(emails: list[Row], semaphore: asyncio.Semaphore) -> str | None:
+    """Send claimed emails for the same recipient as one message.
+
+    Args:
+        emails: list[Row] - recipient emails.
+        semaphore: asyncio.Semaphore - limit of messages sent at the same time.
+
+    Returns:
+        str | None: error text if message was not sent.
+    """
+    subject, body = render_digest(emails)
+    async with semaphore:
+        try:
+            await send_email(subject, emails[0].recipient, body)
+        except (aiosmtplib.SMTPException, OSError) as error:
+            return str(error) or type(error).__name__
+    return None
+
+
+async def save_results(emails: list[Row], errors: list[str | None]) -> None:
+    """Delete sent emails and schedule retries for failed ones.
+
+    Emails which failed EMAIL_MAX_ATTEMPTS times are not claimed anymore and
+    stay in outbox until they are purged by dead_emails module.
+
+    Args:
+        emails: list[Row] - claimed emails.
+        errors: list[str | None] - sending errors of emails.
+    """
+    now = get_current_datetime()
+    sent_ids = [email.id for email, error in zip(emails, errors) if error is None]
+    retries = [
+        {
+            'id': email.id,
+            'attempts': email.attempts + 1,
+            'last_error': error,
+            'next_attempt_at': now + timedelta(seconds=get_retry_delay(email.attempts + 1)),
+        }
+        for email, error in zip(emails, errors)
+        if error is not None
+    ]
+    dead_count = sum(retry['attempts'] >= EMAIL_MAX_ATTEMPTS for retry in retries)
+    if dead_count:
+        logger.warning(f'{dead_count} emails were not sent after {EMAIL_MAX_ATTEMPTS} attempts')
+    async for session in get_session():
+        if sent_ids:
+            await session.execute(
+                delete(EmailOutbox).where(EmailOutbox.id.in_(sent_ids)),
+                execution_options={'synchronize_session': False},
+            )
+        if retries:
+            await session.execute(update(EmailOutbox), retries)
+        await session.commit()
+    metrics.increment('emails_sent_total', len(sent_ids))
+    metrics.increment('emails_failed_total', len(retries))
+    metrics.increment('emails_dead_total', dead_count)
+
+
+async def dispatch_emails() -> int:
+    """Send one batch of due emails, one message per recipient.
+
+    Returns:
+        int: number of claimed emails.
+    """
+    emails = await claim_emails()
+    if not emails:
+        return 0
+    digests = group_by_recipient(emails)
+    semaphore = asyncio.Semaphore(EMAIL_DISPATCH_CONCURRENCY)
+    digest_errors = await asyncio.gather(*[
+        deliver_digest(digest, semaphore) for digest in digests.values()
+    ])
+    errors = {
+        claimed.id: error
+        for digest, error in zip(digests.values(), digest_errors)
+        for claimed in digest
+    }
+    await save_results(emails, [errors[email.id] for email in emails])
+    metrics.increment('email_digests_sent_total', digest_errors.count(None))
+    return len(emails)
+
+
+async def run_email_dispatcher() -> None:
+    """Infinite loop for sending emails from outbox."""
+    infinite = True
+    while infinite:
+        try:
+            claimed = await dispatch_emails()
+        except Exception:
+            logger.exception('Email dispatch failed')
+            claimed = 0
+        if claimed < EMAIL_DISPATCH_BATCH_SIZE:
+            await asyncio.sleep(EMAIL_DISPATCH_INTERVAL)
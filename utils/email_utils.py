@@ -4,12 +4,16 @@ from email.message import EmailMessage
 
 import aiosmtplib
 
-from .constants import SMTP_HOST, SMTP_PASSWORD, SMTP_PORT, SMTP_USERNAME
+from .constants import (SMTP_HOST, SMTP_PASSWORD, SMTP_POOL_SIZE, SMTP_PORT,
+                        SMTP_START_TLS, SMTP_USERNAME)
+from .smtp_pool import get_smtp_pool
 
 
 async def send_email(subject: str, recipient: str, body: str) -> None:
     """Send email to the given recipient.
 
+    Pooled SMTP connection is used if SMTP_POOL_SIZE is set.
+
     Args:
         subject: str - email subject.
         recipient: str - email recipient.
@@ -21,11 +25,14 @@ async def send_email(subject: str, recipient: str, body: str) -> None:
     message['Subject'] = subject
     message.set_content(body)
 
+    if SMTP_POOL_SIZE:
+        await get_smtp_pool().send(message)
+        return
     await aiosmtplib.send(
         message,
         hostname=SMTP_HOST,
         port=SMTP_PORT,
         username=SMTP_USERNAME,
         password=SMTP_PASSWORD,
-        start_tls=True,
+        start_tls=SMTP_START_TLS,
     )
@@ -0,0 +1,51 @@
+"""Module with the shared HTTP client for exchange calls."""
+
+import asyncio
+
+import aiohttp
+
+from .constants import (HTTP_DNS_CACHE_TTL, HTTP_KEEPALIVE_TIMEOUT,
+                        HTTP_POOL_PER_HOST, HTTP_POOL_SIZE, HTTP_TIMEOUT)
+
+_shared = {}
+
+
+def create_http_session() -> aiohttp.ClientSession:
+    """Create HTTP session with pooled keep-alive connections.
+
+    Returns:
+        aiohttp.ClientSession: created session.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_SIZE,
+        limit_per_host=HTTP_POOL_PER_HOST,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+    )
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Get app-lifetime HTTP session, create it on first use.
+
+    Returns:
+        aiohttp.ClientSession: shared session.
+    """
+    loop = asyncio.get_running_loop()
+    session = _shared.get('session')
+    if session is None or session.closed or _shared.get('loop') is not loop:
+        session = create_http_session()
+        _shared.update(session=session, loop=loop)
+    return session
+
+
+async def close_http_session() -> None:
+    """Close shared HTTP session and its connections."""
+    session = _shared.pop('session', None)
+    _shared.pop('loop', None)
+    if session is not None and not session.closed:
+        await session.close()
@@ -0,0 +1,55 @@
+"""Module with cached catalog of exchange instruments used for coin names validation."""
+
+import asyncio
+import logging
+
+import aiohttp
+
+from .constants import INSTRUMENTS_REFRESH_INTERVAL
+from .price_sources import get_price_source
+
+logger = logging.getLogger(__name__)
+
+_catalog: dict[str, frozenset[str]] = {}
+
+
+def set_instruments(names: set[str]) -> None:
+    """Replace catalog with new instruments list.
+
+    Args:
+        names: set[str] - coin names with swap instrument.
+    """
+    _catalog['names'] = frozenset(name.upper() for name in names)
+
+
+def is_listed(name: str) -> bool | None:
+    """Check if coin has swap instrument on exchange without request.
+
+    Args:
+        name: str - coin name.
+
+    Returns:
+        bool | None: True if coin is listed, None if catalog is not loaded yet.
+    """
+    names = _catalog.get('names')
+    if names is None:
+        return None
+    return name.upper() in names
+
+
+async def refresh_instruments() -> None:
+    """Load instruments from price source, empty response keeps previous catalog."""
+    names = await get_price_source().get_instruments()
+    if names:
+        set_instruments(names)
+
+
+async def run_instruments_refresh() -> None:
+    """Infinite loop for loading instruments at startup and refreshing them."""
+    infinite = True
+    while infinite:
+        try:
+            await refresh_instruments()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            logger.exception('Instruments refresh failed')
+        await asyncio.sleep(INSTRUMENTS_REFRESH_INTERVAL)
@@ -0,0 +1,94 @@
+"""Module with in-process app metrics."""
+
+from bisect import bisect_left
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_counters: dict[str, float] = {}
+_gauges: dict[str, float] = {}
+_histograms: dict[str, 'Histogram'] = {}
+
+
+class Histogram:
+    """Histogram with fixed buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Create empty histogram.
+
+        Args:
+            buckets: tuple[float, ...], optional - sorted bucket upper bounds.
+        """
+        self.buckets = buckets
+        self.bucket_counts = [0 for _ in range(len(buckets) + 1)]
+        self.count = 0
+        self.total: float = 0
+
+    def observe(self, metric_value: float) -> None:
+        """Add value to the histogram.
+
+        Args:
+            metric_value: float - observed value.
+        """
+        self.bucket_counts[bisect_left(self.buckets, metric_value)] += 1
+        self.count += 1
+        self.total += metric_value
+
+    def to_dict(self) -> dict:
+        """Get histogram data with cumulative bucket counts.
+
+        Returns:
+            dict: count, sum and buckets.
+        """
+        cumulative = 0
+        buckets = {}
+        bounds = [str(bound) for bound in self.buckets] + ['+Inf']
+        for bound, bucket_count in zip(bounds, self.bucket_counts):
+            cumulative += bucket_count
+            buckets[bound] = cumulative
+        return {'count': self.count, 'sum': self.total, 'buckets': buckets}
+
+
+def increment(name: str, amount: float = 1) -> None:
+    """Increase counter.
+
+    Args:
+        name: str - metric name.
+        amount: float, optional - increment. Defaults to 1.
+    """
+    _counters[name] = _counters.get(name, 0) + amount
+
+
+def set_gauge(name: str, metric_value: float) -> None:
+    """Set gauge value.
+
+    Args:
+        name: str - metric name.
+        metric_value: float - current value.
+    """
+    _gauges[name] = metric_value
+
+
+def observe(name: str, metric_value: float, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+    """Add value to histogram, create it on first use.
+
+    Args:
+        name: str - metric name.
+        metric_value: float - observed value.
+        buckets: tuple[float, ...], optional - buckets for a new histogram.
+    """
+    if name not in _histograms:
+        _histograms[name] = Histogram(buckets)
+    _histograms[name].observe(metric_value)
+
+
+def get_metrics() -> dict:
+    """Get all metrics.
+
+    Returns:
+        dict: counters, gauges and histograms by name.
+    """
+    return {
+        'counters': dict(_counters),
+        'gauges': dict(_gauges),
+        'histograms': {name: hist.to_dict() for name, hist in _histograms.items()},
+    }
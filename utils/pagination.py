@@ -0,0 +1,109 @@
+"""Module with keyset pagination helpers."""
+
+import base64
+import json
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import Select, tuple_
+
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+
+@dataclass
+class PageParams:
+    """Query parameters of a page: next_cursor of the previous page and page size."""
+
+    after: str | None = None
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT)
+
+
+def encode_cursor(*cursor_values) -> str:
+    """Encode sort key of the last page row into opaque cursor.
+
+    Args:
+        cursor_values: sort key values.
+
+    Returns:
+        str: url safe cursor.
+    """
+    payload = json.dumps([str(cursor_value) for cursor_value in cursor_values])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _parse_cursor(cursor: str, parsers: tuple[Callable, ...]) -> tuple:
+    """Parse cursor into sort key values.
+
+    Args:
+        cursor: str - cursor from previous page.
+        parsers: tuple[Callable, ...] - parsers of sort key values.
+
+    Returns:
+        tuple: sort key values.
+    """
+    cursor_values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    return tuple(
+        parse(cursor_value)
+        for parse, cursor_value in zip(parsers, cursor_values, strict=True)
+    )
+
+
+def decode_cursor(cursor: str, *parsers: Callable) -> tuple:
+    """Decode cursor into sort key values.
+
+    Args:
+        cursor: str - cursor from previous page.
+        parsers: Callable - parsers of sort key values.
+
+    Raises:
+        HTTPException: if cursor is not valid.
+
+    Returns:
+        tuple: sort key values.
+    """
+    try:
+        return _parse_cursor(cursor, parsers)
+    except (ValueError, TypeError):
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, 'Неверный курсор страницы')
+
+
+def paginate(query: Select, columns: tuple, after: tuple | None, limit: int) -> Select:
+    """Add keyset condition, stable order and limit to query.
+
+    One extra row is selected to find out if next page exists.
+
+    Args:
+        query: Select - query of all rows.
+        columns: tuple - unique sort key columns.
+        after: tuple | None - sort key of the last row of previous page.
+        limit: int - page size.
+
+    Returns:
+        Select: page query.
+    """
+    if after is not None:
+        query = query.where(tuple_(*columns) > tuple_(*after))
+    return query.order_by(*columns).limit(limit + 1)
+
+
+def split_page(
+    rows: Sequence,
+    limit: int,
+    get_key: Callable[..., tuple],
+) -> tuple[list, str | None]:
+    """Cut extra row of paginated query and build next page cursor.
+
+    Args:
+        rows: Sequence - rows of paginated query.
+        limit: int - page size.
+        get_key: Callable[..., tuple] - sort key of a row.
+
+    Returns:
+        tuple[list, str | None]: page rows and cursor, cursor is None on the last page.
+    """
+    if len(rows) <= limit:
+        return list(rows), None
+    page = list(rows[:limit])
+    return page, encode_cursor(*get_key(page[-1]))
@@ -0,0 +1,205 @@
+"""Module with the price poller."""
+
+import asyncio
+import time
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Coin, CoinLatestPrice, CoinPrice, EmailOutbox
+from utils import (alert_engine, metrics, price_cache, price_sources,
+                   scheduler, tick_filter)
+from utils.alert_index import AlertEntry
+from utils.constants import POLL_CONCURRENCY, POLL_CYCLE_TIMEOUT, POLL_INTERVAL
+from utils.db_utils import get_session
+from utils.time_utils import get_current_datetime
+
+
+def get_alert_email(coin: Coin, current_price: float, alert: AlertEntry) -> dict:
+    """Get outbox email for fired alert.
+
+    Args:
+        coin: Coin - alert coin.
+        current_price: float - current coin price.
+        alert: AlertEntry - fired alert.
+
+    Returns:
+        dict: email outbox fields.
+    """
+    email_body = f"""Спешим сообщить!
+Цена {coin.name} достигла {current_price}.
+Вы получили это сообщение потому что подписались на обновление цены до {alert.threshold_price}.
+    """
+    return {'recipient': alert.email, 'subject': 'Ваша цена!', 'body': email_body}
+
+
+async def queue_emails(
+    db: AsyncSession,
+    coin: Coin,
+    current_price: float,
+    fired: list[AlertEntry],
+) -> None:
+    """Add emails of fired alerts to the outbox and commit alerts deletion.
+
+    Args:
+        db: AsyncSession - db session.
+        coin: Coin - alerts coin.
+        current_price: float - current coin price.
+        fired: list[AlertEntry] - fired alerts.
+    """
+    await db.execute(
+        insert(EmailOutbox),
+        [get_alert_email(coin, current_price, alert) for alert in fired],
+    )
+    await db.commit()
+
+
+async def check_alerts_and_send_emails(
+    db: AsyncSession,
+    coin: Coin,
+    current_price: float,
+) -> AsyncSession:
+    """Alerts check and queue emails if price reached expected value.
+
+    Emails are added to the outbox in the transaction which deletes alerts,
+    alerts are returned to the index if the transaction is not committed.
+
+    Args:
+        db: AsyncSession - db session.
+        coin: Coin - coin for price update.
+        current_price: float - current coin price.
+
+    Raises:
+        asyncio.CancelledError: if cancelled before commit.
+        Exception: on emails insert or commit error.
+
+    Returns:
+        AsyncSession: updated db session.
+    """
+    fired = await alert_engine.fire_alerts(db, coin.id, current_price)
+    if not fired:
+        return db
+    try:
+        await queue_emails(db, coin, current_price, fired)
+    except (asyncio.CancelledError, Exception):
+        alert_engine.restore_alerts(fired)
+        raise
+    return db
+
+
+async def save_prices(prices: list[tuple[Coin, float]]) -> None:
+    """Save prices of a poll cycle in one transaction.
+
+    Prices are added to the history and replace older latest prices of coins.
+
+    Args:
+        prices: list[tuple[Coin, float]] - coins with their new prices.
+    """
+    if not prices:
+        return
+    started = time.perf_counter()
+    timedate = get_current_datetime()
+    rows = [
+        {'coin_id': coin.id, 'price': price, 'timedate': timedate}
+        for coin, price in prices
+    ]
+    latest = pg_insert(CoinLatestPrice)
+    async for session in get_session():
+        await session.execute(insert(CoinPrice), rows)
+        await session.execute(
+            latest.on_conflict_do_update(
+                index_elements=[CoinLatestPrice.coin_id],
+                set_={'price': latest.excluded.price, 'timedate': latest.excluded.timedate},
+                where=CoinLatestPrice.timedate < latest.excluded.timedate,
+            ),
+            rows,
+        )
+        await session.commit()
+    metrics.observe('prices_commit_seconds', time.perf_counter() - started)
+    metrics.set_gauge('prices_rows_per_cycle', len(prices))
+    metrics.increment('prices_rows_total', len(prices))
+
+
+async def update_price_for_coin(coin: Coin, current_price: float) -> None:
+    """Fire reached coin alerts.
+
+    Args:
+        coin: Coin - coin for price update.
+        current_price: float - new coin price.
+    """
+    async for session in get_session():
+        session = await check_alerts_and_send_emails(session, coin, current_price)
+        await session.commit()
+
+
+async def update_price_with_limit(
+    semaphore: asyncio.Semaphore,
+    coin: Coin,
+    current_price: float,
+) -> None:
+    """Process new price for coin when semaphore allows.
+
+    Args:
+        semaphore: asyncio.Semaphore - limit of coins processed at once.
+        coin: Coin - coin for price update.
+        current_price: float - new coin price.
+    """
+    async with semaphore:
+        await update_price_for_coin(coin, current_price)
+
+
+async def load_coins() -> list[Coin]:
+    """Get all coins.
+
+    Returns:
+        list[Coin]: coins.
+    """
+    async for session in get_session():
+        coins = await session.execute(select(Coin))
+        coins = coins.scalars().all()
+    return coins
+
+
+async def process_prices(coins: list[Coin], prices: list[tuple[Coin, float]]) -> None:
+    """Save new prices, update prices cache and fire reached alerts.
+
+    Only ticks passed by tick filter are saved, alerts are checked only if price can reach them.
+
+    Args:
+        coins: list[Coin] - all coins.
+        prices: list[tuple[Coin, float]] - coins with their new prices.
+    """
+    tick_filter.forget_missing(coins)
+    stored = tick_filter.filter_prices(prices)
+    await save_prices(stored)
+    tick_filter.mark_stored(stored)
+    price_cache.set_prices(
+        {coin.name: price for coin, price in prices},
+        [coin.name for coin in coins],
+    )
+    moved = {coin.id for coin, _ in stored}
+    semaphore = asyncio.Semaphore(POLL_CONCURRENCY)
+    await asyncio.gather(*[
+        update_price_with_limit(semaphore, coin, price)
+        for coin, price in prices
+        if alert_engine.may_fire(coin.id, price, coin.id in moved)
+    ])
+
+
+async def update_prices() -> None:
+    """Update prices for all coins."""
+    coins = await load_coins()
+    source = price_sources.get_price_source()
+    coins_prices = await source.get_prices([coin.name for coin in coins])
+    prices = [
+        (coin, coins_prices[coin.name])
+        for coin in coins
+        if coin.name in coins_prices
+    ]
+    await process_prices(coins, prices)
+
+
+async def periodic_function() -> None:
+    """Infinite loop for update prices every POLL_INTERVAL seconds."""
+    await scheduler.run_periodic(update_prices, POLL_INTERVAL, POLL_CYCLE_TIMEOUT, 'poll')
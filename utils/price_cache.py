@@ -0,0 +1,91 @@
+"""Module with in-process cache of latest coin prices fed by the price poller.
+
+The cache gets every polled price, including ticks which the tick filter did
+not save, so a cached price can be newer than the latest price in the db.
+"""
+
+import time
+from typing import NamedTuple
+
+from .constants import PRICE_CACHE_TTL
+
+
+class CachedPrice(NamedTuple):
+    """Last known coin price."""
+
+    price: float
+    cached_at: float
+
+
+class CachedCoins(NamedTuple):
+    """Names of all coins known to the poller."""
+
+    names: list[str]
+    cached_at: float
+
+
+COINS_KEY = 'coins'
+
+_prices: dict[str, CachedPrice] = {}
+_coins: dict[str, CachedCoins] = {}
+
+
+def _is_fresh(cached_at: float) -> bool:
+    """Check if cached value is not older than PRICE_CACHE_TTL.
+
+    Args:
+        cached_at: float - monotonic time when value was cached.
+
+    Returns:
+        bool: True if value can be used.
+    """
+    return time.monotonic() - cached_at < PRICE_CACHE_TTL
+
+
+def set_prices(prices: dict[str, float], coin_names: list[str]) -> None:
+    """Save prices of a poll cycle.
+
+    Args:
+        prices: dict[str, float] - new prices by coin name.
+        coin_names: list[str] - names of all coins known to the poller.
+    """
+    now = time.monotonic()
+    for name, price in prices.items():
+        _prices[name.upper()] = CachedPrice(price, now)
+    _coins[COINS_KEY] = CachedCoins(sorted(coin.upper() for coin in coin_names), now)
+
+
+def get_price(name: str) -> float | None:
+    """Get fresh cached coin price.
+
+    Args:
+        name: str - coin name.
+
+    Returns:
+        float | None: price or None if price is not cached or stale.
+    """
+    cached = _prices.get(name.upper())
+    if cached is None or not _is_fresh(cached.cached_at):
+        return None
+    return cached.price
+
+
+def get_prices() -> list[tuple[str, float]] | None:
+    """Get fresh cached prices of all coins.
+
+    Returns:
+        list[tuple[str, float]] | None: names and prices sorted by name
+            or None if coins list or any coin price is not cached or stale.
+    """
+    coins = _coins.get(COINS_KEY)
+    if coins is None or not _is_fresh(coins.cached_at):
+        return None
+    prices = [(name, get_price(name)) for name in coins.names]
+    if any(price is None for _, price in prices):
+        return None
+    return prices
+
+
+def invalidate() -> None:
+    """Forget coins list, used after new coin is added."""
+    _coins.clear()
@@ -0,0 +1,201 @@
+"""Module with the manager of daily coins_prices partitions."""
+
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .constants import (PRICE_PARTITIONS_AHEAD_DAYS, PRICE_PARTITIONS_DROP,
+                        PRICE_PARTITIONS_INTERVAL, PRICES_RETENTION_DAYS)
+from .db_utils import get_session
+from .rollups import get_watermark
+from .time_utils import get_current_datetime
+
+logger = logging.getLogger(__name__)
+
+PRICES_TABLE = 'coins_prices'
+PARTITION_PREFIX = f'{PRICES_TABLE}_p'
+DEFAULT_PARTITION = f'{PRICES_TABLE}_default'
+RETENTION_RESOLUTION = '1d'
+SELECT_PARTITIONS = """
+SELECT child.relname FROM pg_inherits
+JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+WHERE parent.relname = :table
+"""
+SELECT_DEFAULT_PRICES = f"""
+SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE timedate >= :start AND timedate < :end)
+"""  # noqa: S608 - table name is not user input
+
+DayRange = dict[str, datetime]
+
+
+def get_partition_name(day: date) -> str:
+    """Get name of the partition with prices of the day.
+
+    Args:
+        day: date - partition day.
+
+    Returns:
+        str: partition table name.
+    """
+    day_suffix = day.isoformat().replace('-', '_')
+    return f'{PARTITION_PREFIX}{day_suffix}'
+
+
+def get_day_start(day: date) -> datetime:
+    """Get start of the UTC day.
+
+    Args:
+        day: date - day.
+
+    Returns:
+        datetime: midnight of the day in UTC.
+    """
+    return datetime.combine(day, time.min, timezone.utc)
+
+
+async def get_partition_days(db: AsyncSession) -> list[date]:
+    """Get days of existing daily partitions, default partition is skipped.
+
+    Args:
+        db: AsyncSession - db session.
+
+    Returns:
+        list[date]: sorted partition days.
+    """
+    query = await db.execute(text(SELECT_PARTITIONS), {'table': PRICES_TABLE})
+    return sorted(
+        date.fromisoformat(name.removeprefix(PARTITION_PREFIX).replace('_', '-'))
+        for name in query.scalars().all()
+        if name.startswith(PARTITION_PREFIX)
+    )
+
+
+async def attach_with_default_prices(
+    db: AsyncSession,
+    name: str,
+    bounds: str,
+    day_range: DayRange,
+) -> None:
+    """Create partition from prices of the day which were saved to the default partition.
+
+    The default partition is locked, so no prices of the day are saved there meanwhile.
+
+    Args:
+        db: AsyncSession - db session.
+        name: str - partition table name.
+        bounds: str - partition bounds clause.
+        day_range: DayRange - `start` and `end` of the day.
+    """
+    await db.execute(text(f'LOCK TABLE {DEFAULT_PARTITION} IN ACCESS EXCLUSIVE MODE'))
+    await db.execute(
+        text(
+            f'CREATE TABLE {name} (LIKE {PRICES_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        ),
+    )
+    move_prices = f"""WITH moved AS (
+        DELETE FROM {DEFAULT_PARTITION} WHERE timedate >= :start AND timedate < :end RETURNING *
+    )
+    INSERT INTO {name} SELECT * FROM moved"""  # noqa: S608 - tables names are not user input
+    await db.execute(text(move_prices), day_range)
+    await db.execute(text(f'ALTER TABLE {PRICES_TABLE} ATTACH PARTITION {name} {bounds}'))
+
+
+async def create_partition(db: AsyncSession, day: date) -> None:
+    """Create partition for prices of the UTC day.
+
+    Prices of the day saved to the default partition are moved to the new one,
+    otherwise partition could not be attached. The default partition is locked
+    only in this case, usually partitions are created ahead and nothing is moved.
+
+    Args:
+        db: AsyncSession - db session.
+        day: date - partition day.
+    """
+    name = get_partition_name(day)
+    next_day = day + timedelta(days=1)
+    bounds = f"FOR VALUES FROM ('{day.isoformat()} UTC') TO ('{next_day.isoformat()} UTC')"
+    day_range = {'start': get_day_start(day), 'end': get_day_start(next_day)}
+    default_prices = await db.execute(text(SELECT_DEFAULT_PRICES), day_range)
+    if default_prices.scalar():
+        await attach_with_default_prices(db, name, bounds, day_range)
+        return
+    await db.execute(text(f'CREATE TABLE {name} PARTITION OF {PRICES_TABLE} {bounds}'))
+
+
+async def remove_partition(db: AsyncSession, day: date) -> None:
+    """Detach partition of the day and drop it unless PRICE_PARTITIONS_DROP is off.
+
+    Args:
+        db: AsyncSession - db session.
+        day: date - partition day.
+    """
+    name = get_partition_name(day)
+    await db.execute(text(f'ALTER TABLE {PRICES_TABLE} DETACH PARTITION {name}'))
+    if PRICE_PARTITIONS_DROP:
+        await db.execute(text(f'DROP TABLE {name}'))
+
+
+async def create_partitions(db: AsyncSession, existing: list[date], today: date) -> None:
+    """Create missing partitions for today and PRICE_PARTITIONS_AHEAD_DAYS next days.
+
+    Args:
+        db: AsyncSession - db session.
+        existing: list[date] - days of existing partitions.
+        today: date - current day.
+    """
+    for offset in range(PRICE_PARTITIONS_AHEAD_DAYS + 1):
+        day = today + timedelta(days=offset)
+        if day not in existing:
+            await create_partition(db, day)
+
+
+async def remove_partitions(
+    db: AsyncSession,
+    existing: list[date],
+    today: date,
+    rolled_up_until: date | None,
+) -> None:
+    """Remove partitions older than PRICES_RETENTION_DAYS, 0 keeps all partitions.
+
+    Only days which are already in daily rollups are removed, so the long tail is kept there.
+
+    Args:
+        db: AsyncSession - db session.
+        existing: list[date] - days of existing partitions.
+        today: date - current day.
+        rolled_up_until: date | None - days before it are rolled up, None if rollups are empty.
+    """
+    if not PRICES_RETENTION_DAYS or rolled_up_until is None:
+        return
+    oldest_day = min(today - timedelta(days=PRICES_RETENTION_DAYS), rolled_up_until)
+    for day in existing:
+        if day < oldest_day:
+            await remove_partition(db, day)
+
+
+async def manage_partitions() -> None:
+    """Create partitions for next days and remove rolled up partitions older than retention."""
+    today = get_current_datetime().date()
+    async for session in get_session():
+        existing = await get_partition_days(session)
+        await create_partitions(session, existing, today)
+        watermark = await get_watermark(session, RETENTION_RESOLUTION)
+        rolled_up_until = None if watermark is None else watermark.date()
+        await remove_partitions(session, existing, today, rolled_up_until)
+        await session.commit()
+
+
+async def run_partition_manager() -> None:
+    """Infinite loop for managing coins_prices partitions."""
+    infinite = True
+    while infinite:
+        try:
+            await manage_partitions()
+        except (SQLAlchemyError, OSError):
+            logger.exception('Prices partitions update failed')
+        await asyncio.sleep(PRICE_PARTITIONS_INTERVAL)
@@ -0,0 +1,197 @@
+"""Module with exchange price sources: OKX API and local fake exchange."""
+
+import csv
+import random
+import time
+from abc import ABC, abstractmethod
+
+from api import coin_utils
+
+from .constants import (FAKE_EXCHANGE_COINS, FAKE_EXCHANGE_PATHS,
+                        FAKE_EXCHANGE_SEED, FAKE_EXCHANGE_SPEED,
+                        FAKE_EXCHANGE_STEPS, FAKE_EXCHANGE_VOLATILITY,
+                        PRICE_SOURCE)
+
+PricePaths = dict[str, list[float]]
+
+FAKE_START_PRICE_MIN = 1
+FAKE_START_PRICE_MAX = 1000
+FAKE_PRICE_DIGITS = 8
+SOURCE_KEY = 'source'
+
+
+class PriceSource(ABC):
+    """Exchange which gives last prices and list of tradable coins."""
+
+    @abstractmethod
+    async def get_prices(self, names: list[str]) -> dict[str, float]:
+        """Get last prices of coins, coins without price are skipped.
+
+        Args:
+            names: list[str] - coins names.
+
+        Returns:
+            dict[str, float]: price by upper cased coin name.
+        """
+
+    @abstractmethod
+    async def get_instruments(self) -> set[str]:
+        """Get names of coins which can be added.
+
+        Returns:
+            set[str]: upper cased coin names, empty set if exchange did not answer.
+        """
+
+
+class OkxPriceSource(PriceSource):
+    """OKX public API, prices of coins swap instruments."""
+
+    async def get_prices(self, names: list[str]) -> dict[str, float]:
+        """Get last prices of coins, coins without price are skipped.
+
+        Args:
+            names: list[str] - coins names.
+
+        Returns:
+            dict[str, float]: price by upper cased coin name.
+        """
+        tickers = await coin_utils.get_coins_tickers(names)
+        return {name: float(ticker['last']) for name, ticker in tickers.items()}
+
+    async def get_instruments(self) -> set[str]:
+        """Get names of coins with swap instrument.
+
+        Returns:
+            set[str]: upper cased coin names, empty set if exchange did not answer.
+        """
+        return await coin_utils.get_swap_instruments()
+
+
+def get_synthetic_path(
+    name: str,
+    steps: int = FAKE_EXCHANGE_STEPS,
+    seed: int = FAKE_EXCHANGE_SEED,
+    volatility: float = FAKE_EXCHANGE_VOLATILITY,
+) -> list[float]:
+    """Get random walk of coin price, same arguments give same path.
+
+    Args:
+        name: str - coin name, each coin has its own path.
+        steps: int, optional - path length.
+        seed: int, optional - random seed.
+        volatility: float, optional - standard deviation of relative price change per step.
+
+    Returns:
+        list[float]: prices.
+    """
+    generator = random.Random(f'{seed}:{name.upper()}')
+    price = generator.uniform(FAKE_START_PRICE_MIN, FAKE_START_PRICE_MAX)
+    path = []
+    for _ in range(steps):
+        path.append(round(price, FAKE_PRICE_DIGITS))
+        price *= 1 + generator.gauss(0, volatility)
+    return path
+
+
+def load_paths(file_path: str) -> PricePaths:
+    """Load recorded prices from CSV file with `coin` and `price` columns.
+
+    Args:
+        file_path: str - path to CSV file.
+
+    Returns:
+        PricePaths: prices in file order by upper cased coin name.
+    """
+    paths: PricePaths = {}
+    with open(file_path, newline='') as paths_file:
+        for row in csv.DictReader(paths_file):
+            paths.setdefault(row['coin'].upper(), []).append(float(row['price']))
+    return paths
+
+
+class FakePriceSource(PriceSource):
+    """Local exchange which replays price paths in a loop without network requests."""
+
+    def __init__(self, paths: PricePaths, speed: float = FAKE_EXCHANGE_SPEED) -> None:
+        """Create fake exchange.
+
+        Args:
+            paths: PricePaths - prices by coin name, listed coins are the paths keys.
+            speed: float, optional - path steps per second, 0 - one step per prices request.
+        """
+        self.paths = {name.upper(): path for name, path in paths.items() if path}
+        self.speed = speed
+        self.requests = 0
+        self.started_at = time.monotonic()
+
+    def get_step(self) -> int:
+        """Get current step of price paths.
+
+        Returns:
+            int: step number.
+        """
+        if self.speed > 0:
+            return int((time.monotonic() - self.started_at) * self.speed)
+        return self.requests
+
+    async def get_prices(self, names: list[str]) -> dict[str, float]:
+        """Get prices of current step, unknown coins are skipped.
+
+        Args:
+            names: list[str] - coins names.
+
+        Returns:
+            dict[str, float]: price by upper cased coin name.
+        """
+        step = self.get_step()
+        self.requests += 1
+        names = [name.upper() for name in names]
+        return {
+            name: self.paths[name][step % len(self.paths[name])]
+            for name in names
+            if name in self.paths
+        }
+
+    async def get_instruments(self) -> set[str]:
+        """Get coins which have price path.
+
+        Returns:
+            set[str]: upper cased coin names.
+        """
+        return set(self.paths)
+
+
+def create_price_source() -> PriceSource:
+    """Create price source chosen by PRICE_SOURCE setting.
+
+    Returns:
+        PriceSource: OKX API or fake exchange with recorded or synthetic paths.
+    """
+    if PRICE_SOURCE != 'fake':
+        return OkxPriceSource()
+    if FAKE_EXCHANGE_PATHS:
+        return FakePriceSource(load_paths(FAKE_EXCHANGE_PATHS))
+    return FakePriceSource({name: get_synthetic_path(name) for name in FAKE_EXCHANGE_COINS})
+
+
+_source: dict[str, PriceSource] = {}
+
+
+def get_price_source() -> PriceSource:
+    """Get app price source, it is created on first use.
+
+    Returns:
+        PriceSource: price source.
+    """
+    if SOURCE_KEY not in _source:
+        _source[SOURCE_KEY] = create_price_source()
+    return _source[SOURCE_KEY]
+
+
+def set_price_source(source: PriceSource) -> None:
+    """Replace app price source, used by tests and load tests.
+
+    Args:
+        source: PriceSource - new price source.
+    """
+    _source[SOURCE_KEY] = source
@@ -0,0 +1,89 @@
+"""Module with SQL queries timing and sampled logging."""
+
+import json
+import logging
+import random
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from . import metrics
+from .constants import (SQL_LOG_MODE, SQL_LOG_SAMPLE_RATE,
+                        SQL_SLOW_QUERY_SECONDS)
+
+logger = logging.getLogger(__name__)
+
+QUERY_START_KEY = 'query_start_time'
+QUERY_METRIC = 'db_query_seconds'
+
+
+def should_log(duration: float) -> bool:
+    """Check if query should be logged in current SQL_LOG_MODE.
+
+    Args:
+        duration: float - query duration in seconds.
+
+    Returns:
+        bool: True for slow queries in `slow` mode and for sampled queries in `sample` mode.
+    """
+    if SQL_LOG_MODE == 'slow':
+        return duration >= SQL_SLOW_QUERY_SECONDS
+    if SQL_LOG_MODE == 'sample':
+        return random.random() < SQL_LOG_SAMPLE_RATE  # noqa: S311 - not for security
+    return False
+
+
+def before_cursor_execute(**event_args) -> None:
+    """Remember query start time on execution context.
+
+    Context lives only while statement runs, so failed statements leave nothing behind.
+
+    Args:
+        event_args: conn, cursor, statement, parameters, context and executemany of the event.
+    """
+    context = event_args['context']
+    if context is not None:
+        setattr(context, QUERY_START_KEY, time.perf_counter())
+
+
+def after_cursor_execute(**event_args) -> None:
+    """Observe query duration and log it as JSON line if needed.
+
+    Records are written at WARNING level, so they are visible without logging setup.
+
+    Args:
+        event_args: conn, cursor, statement, parameters, context and executemany of the event.
+    """
+    started = getattr(event_args['context'], QUERY_START_KEY, None)
+    if started is None:
+        return
+    duration = time.perf_counter() - started
+    metrics.observe(QUERY_METRIC, duration)
+    if should_log(duration):
+        logger.warning(json.dumps({
+            'event': 'sql_query',
+            'mode': SQL_LOG_MODE,
+            'duration': round(duration, 6),
+            'statement': event_args['statement'],
+        }))
+
+
+def add_timing_events(sync_engine: Engine) -> None:
+    """Add query timing events to sync engine.
+
+    Args:
+        sync_engine: Engine - engine or sync engine of async one.
+    """
+    event.listen(sync_engine, 'before_cursor_execute', before_cursor_execute, named=True)
+    event.listen(sync_engine, 'after_cursor_execute', after_cursor_execute, named=True)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Add query timing events to engine.
+
+    Args:
+        engine: AsyncEngine - app engine.
+    """
+    add_timing_events(engine.sync_engine)
@@ -0,0 +1,103 @@
+"""Module with per-host token bucket rate limiter for exchange requests."""
+
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from . import metrics
+from .constants import (EXCHANGE_BACKOFF_BASE, EXCHANGE_BACKOFF_MAX,
+                        EXCHANGE_RATE_BURST, EXCHANGE_RATE_LIMIT)
+
+
+class TokenBucket:
+    """Token bucket which also pauses requests after rate limit responses."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Create full bucket.
+
+        Args:
+            rate: float - tokens added per second, 0 disables limit.
+            capacity: float - max tokens, requests burst size.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until: float = 0
+        self.failures = 0
+
+    async def acquire(self) -> None:
+        """Take token, wait for it if bucket is empty or paused.
+
+        Token is reserved before waiting, so waiting requests are served in order.
+        Reserved token is given back if waiting request is cancelled.
+
+        Raises:
+            asyncio.CancelledError: if request is cancelled while waiting.
+        """
+        if self.rate <= 0:
+            return
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= 1
+        wait = max(-self.tokens / self.rate, self.blocked_until - now)
+        if wait > 0:
+            metrics.observe('exchange_rate_wait_seconds', wait)
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.tokens += 1
+                raise
+
+    def backoff(self, retry_after: float | None = None) -> None:
+        """Pause requests after rate limit response.
+
+        Pause is doubled on every rate limit response in a row.
+
+        Args:
+            retry_after: float | None, optional - pause requested by server.
+        """
+        self.failures += 1
+        delay = retry_after or min(
+            EXCHANGE_BACKOFF_BASE * 2 ** (self.failures - 1),
+            EXCHANGE_BACKOFF_MAX,
+        )
+        self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+        metrics.increment('exchange_rate_limited_total')
+
+    def succeed(self) -> None:
+        """Reset backoff after successful response."""
+        self.failures = 0
+
+
+_buckets: dict[str, TokenBucket] = {}
+
+
+def get_bucket(url: str) -> TokenBucket:
+    """Get rate limiter of url host, create it on first use.
+
+    Args:
+        url: str - request url.
+
+    Returns:
+        TokenBucket: host bucket.
+    """
+    host = urlsplit(url).netloc
+    if host not in _buckets:
+        _buckets[host] = TokenBucket(EXCHANGE_RATE_LIMIT, EXCHANGE_RATE_BURST)
+    return _buckets[host]
+
+
+def parse_retry_after(header: str | None) -> float | None:
+    """Get pause from Retry-After header, dates are not supported.
+
+    Args:
+        header: str | None - header value.
+
+    Returns:
+        float | None: pause in seconds or None.
+    """
+    if header and header.isdigit():
+        return float(header)
+    return None
@@ -0,0 +1,43 @@
+"""Module with the background job which keeps price rollups up to date."""
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from . import metrics
+from .constants import ROLLUP_INTERVAL, ROLLUP_LAG_SECONDS
+from .db_utils import get_session
+from .rollups import RESOLUTIONS, update_rollup
+from .time_utils import get_current_datetime
+
+logger = logging.getLogger(__name__)
+
+
+async def update_rollups(lag: float = ROLLUP_LAG_SECONDS) -> None:
+    """Update rollups of all resolutions in one transaction.
+
+    Args:
+        lag: float, optional - prices younger than lag seconds are left for the next run,
+            so prices of not yet committed transactions are not missed.
+    """
+    started = time.perf_counter()
+    end = get_current_datetime() - timedelta(seconds=lag)
+    async for session in get_session():
+        for resolution in RESOLUTIONS:
+            await update_rollup(session, resolution, end)
+        await session.commit()
+    metrics.observe('rollups_update_seconds', time.perf_counter() - started)
+
+
+async def run_rollups() -> None:
+    """Infinite loop for updating rollups."""
+    infinite = True
+    while infinite:
+        try:
+            await update_rollups()
+        except (SQLAlchemyError, OSError):
+            logger.exception('Rollups update failed')
+        await asyncio.sleep(ROLLUP_INTERVAL)
@@ -0,0 +1,158 @@
+"""Module with open-high-low-close rollups of coin prices."""
+
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from uuid import UUID
+
+from sqlalchemy import Select, func, literal, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import CoinPrice, CoinPriceRollup
+
+BASE_RESOLUTION = '1m'
+RESOLUTIONS = MappingProxyType({
+    BASE_RESOLUTION: timedelta(minutes=1),
+    '5m': timedelta(minutes=5),
+    '1h': timedelta(hours=1),
+    '1d': timedelta(days=1),
+})
+BUCKETS_ORIGIN = datetime.fromtimestamp(0, timezone.utc)
+ROLLUP_COLUMNS = (
+    'coin_id',
+    'resolution',
+    'bucket',
+    'open_price',
+    'high_price',
+    'low_price',
+    'close_price',
+    'ticks_count',
+)
+
+
+async def get_watermark(db: AsyncSession, resolution: str) -> datetime | None:
+    """Get start of the latest bucket of resolution.
+
+    Args:
+        db: AsyncSession - db session.
+        resolution: str - rollup resolution.
+
+    Returns:
+        datetime | None: bucket start or None if rollup is empty.
+    """
+    query = await db.execute(
+        select(
+            func.max(CoinPriceRollup.bucket),
+        ).where(
+            CoinPriceRollup.resolution == resolution,
+        ),
+    )
+    return query.scalar()
+
+
+def select_ticks(start: datetime | None, end: datetime) -> Select:
+    """Build query which aggregates raw prices into base resolution buckets.
+
+    Args:
+        start: datetime | None - start of the first bucket, None for all prices.
+        end: datetime - prices newer than end are left for the next run.
+
+    Returns:
+        Select: rollup rows query.
+    """
+    bucket = func.date_bin(RESOLUTIONS[BASE_RESOLUTION], CoinPrice.timedate, BUCKETS_ORIGIN)
+    query = select(
+        CoinPrice.coin_id,
+        literal(BASE_RESOLUTION),
+        bucket,
+        func.array_agg(aggregate_order_by(CoinPrice.price, CoinPrice.timedate))[1],
+        func.max(CoinPrice.price),
+        func.min(CoinPrice.price),
+        func.array_agg(aggregate_order_by(CoinPrice.price, CoinPrice.timedate.desc()))[1],
+        func.count(),
+    ).where(
+        CoinPrice.timedate < end,
+    ).group_by(CoinPrice.coin_id, bucket)
+    if start is not None:
+        query = query.where(CoinPrice.timedate >= start)
+    return query
+
+
+def select_buckets(resolution: str, start: datetime | None) -> Select:
+    """Build query which merges base resolution buckets into larger ones.
+
+    Args:
+        resolution: str - target resolution.
+        start: datetime | None - start of the first bucket, None for all buckets.
+
+    Returns:
+        Select: rollup rows query.
+    """
+    source = CoinPriceRollup
+    bucket = func.date_bin(RESOLUTIONS[resolution], source.bucket, BUCKETS_ORIGIN)
+    query = select(
+        source.coin_id,
+        literal(resolution),
+        bucket,
+        func.array_agg(aggregate_order_by(source.open_price, source.bucket))[1],
+        func.max(source.high_price),
+        func.min(source.low_price),
+        func.array_agg(aggregate_order_by(source.close_price, source.bucket.desc()))[1],
+        func.sum(source.ticks_count),
+    ).where(
+        source.resolution == BASE_RESOLUTION,
+    ).group_by(source.coin_id, bucket)
+    if start is not None:
+        query = query.where(source.bucket >= start)
+    return query
+
+
+async def update_rollup(db: AsyncSession, resolution: str, end: datetime) -> None:
+    """Recalculate buckets of resolution starting from the latest saved one.
+
+    Args:
+        db: AsyncSession - db session.
+        resolution: str - rollup resolution.
+        end: datetime - prices newer than end are left for the next run.
+    """
+    start = await get_watermark(db, resolution)
+    if resolution == BASE_RESOLUTION:
+        rows = select_ticks(start, end)
+    else:
+        rows = select_buckets(resolution, start)
+    upsert = insert(CoinPriceRollup).from_select(ROLLUP_COLUMNS, rows)
+    await db.execute(
+        upsert.on_conflict_do_update(
+            index_elements=ROLLUP_COLUMNS[:3],
+            set_={column: upsert.excluded[column] for column in ROLLUP_COLUMNS[3:]},
+        ),
+    )
+
+
+async def get_candles(
+    db: AsyncSession,
+    coin_id: UUID,
+    resolution: str,
+    period: tuple[datetime, datetime],
+) -> list[CoinPriceRollup]:
+    """Get coin rollup buckets of period.
+
+    Args:
+        db: AsyncSession - db session.
+        coin_id: UUID - coin id.
+        resolution: str - rollup resolution.
+        period: tuple[datetime, datetime] - period start and end.
+
+    Returns:
+        list[CoinPriceRollup]: buckets sorted by time.
+    """
+    start, end = period
+    query = await db.execute(
+        select(CoinPriceRollup).where(
+            CoinPriceRollup.coin_id == coin_id,
+            CoinPriceRollup.resolution == resolution,
+            CoinPriceRollup.bucket > start - RESOLUTIONS[resolution],
+            CoinPriceRollup.bucket <= end,
+        ).order_by(CoinPriceRollup.bucket),
+    )
+    return list(query.scalars().all())
@@ -0,0 +1,75 @@
+"""Module with the fixed cadence scheduler of background jobs."""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def get_next_tick(scheduled: float, now: float, interval: float) -> tuple[float, int]:
+    """Get start of the next tick, ticks missed while cycle overran are coalesced into one.
+
+    Args:
+        scheduled: float - planned start of the finished cycle.
+        now: float - current loop time.
+        interval: float - ticks interval.
+
+    Returns:
+        tuple[float, int]: planned start of the next cycle and count of skipped ticks.
+    """
+    missed = int((now - scheduled) // interval)
+    if missed < 1:
+        return scheduled + interval, 0
+    return scheduled + missed * interval, missed - 1
+
+
+async def run_cycle(job: Callable[[], Awaitable], timeout: float, name: str) -> None:
+    """Run job with timeout, errors are logged so next ticks are not stopped.
+
+    Args:
+        job: Callable[[], Awaitable] - job function.
+        timeout: float - cycle timeout in seconds.
+        name: str - job name used as metrics prefix.
+    """
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(job(), timeout)
+    except asyncio.TimeoutError:
+        metrics.increment(f'{name}_cycle_timeouts_total')
+        logger.warning(f'{name} cycle timed out after {timeout} seconds')
+    except Exception:
+        metrics.increment(f'{name}_cycle_errors_total')
+        logger.exception(f'{name} cycle failed')
+    metrics.observe(f'{name}_cycle_seconds', time.perf_counter() - started)
+
+
+async def run_periodic(
+    job: Callable[[], Awaitable],
+    interval: float,
+    timeout: float,
+    name: str,
+) -> None:
+    """Run job forever on fixed cadence which does not drift with cycle duration.
+
+    Cycles never overlap, a tick which comes while cycle is running is skipped.
+
+    Args:
+        job: Callable[[], Awaitable] - job function.
+        interval: float - ticks interval in seconds.
+        timeout: float - cycle timeout in seconds.
+        name: str - job name used as metrics prefix.
+    """
+    loop = asyncio.get_running_loop()
+    scheduled = loop.time()
+    infinite = True
+    while infinite:
+        metrics.set_gauge(f'{name}_lag_seconds', loop.time() - scheduled)
+        await run_cycle(job, timeout, name)
+        scheduled, skipped = get_next_tick(scheduled, loop.time(), interval)
+        if skipped:
+            metrics.increment(f'{name}_ticks_skipped_total', skipped)
+        await asyncio.sleep(max(scheduled - loop.time(), 0))
@@ -0,0 +1,194 @@
+"""Module with the pool of persistent SMTP connections."""
+
+import asyncio
+import time
+from email.message import EmailMessage
+
+from aiosmtplib import SMTP, SMTPException, SMTPServerDisconnected
+
+from .constants import (SMTP_HOST, SMTP_PASSWORD, SMTP_POOL_IDLE_CHECK_SECONDS,
+                        SMTP_POOL_MAX_MESSAGES, SMTP_POOL_SIZE, SMTP_PORT,
+                        SMTP_START_TLS, SMTP_USERNAME)
+
+_shared = {}
+
+
+class PooledSMTP:
+    """SMTP connection with usage statistics."""
+
+    def __init__(self, client: SMTP) -> None:
+        """Wrap connected client.
+
+        Args:
+            client: SMTP - connected and authenticated client.
+        """
+        self.client = client
+        self.sent = 0
+        self.last_used = time.monotonic()
+
+
+async def open_connection(smtp_options: dict) -> PooledSMTP:
+    """Open and authenticate new SMTP connection.
+
+    Args:
+        smtp_options: dict - SMTP client options.
+
+    Raises:
+        asyncio.CancelledError: if cancelled, connection is closed.
+
+    Returns:
+        PooledSMTP: ready connection.
+    """
+    client = SMTP(**smtp_options)
+    try:
+        await client.connect()
+    except asyncio.CancelledError:
+        client.close()
+        raise
+    return PooledSMTP(client)
+
+
+class SMTPPool:
+    """Pool of long-lived authenticated SMTP connections."""
+
+    def __init__(self, size: int = SMTP_POOL_SIZE, **smtp_options) -> None:
+        """Create empty pool, connections are opened on demand.
+
+        Args:
+            size: int, optional - max number of connections.
+            smtp_options: SMTP client options. Defaults to settings from constants.
+        """
+        self.smtp_options = {
+            'hostname': SMTP_HOST,
+            'port': SMTP_PORT,
+            'username': SMTP_USERNAME or None,
+            'password': SMTP_PASSWORD or None,
+            'start_tls': SMTP_START_TLS,
+        }
+        self.smtp_options.update(smtp_options)
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[PooledSMTP] = []
+
+    async def send(self, message: EmailMessage) -> None:
+        """Send message with pooled connection.
+
+        Reused connection which was closed by server is replaced once with new connection.
+
+        Args:
+            message: EmailMessage - message for send.
+
+        Raises:
+            SMTPServerDisconnected: if new connection was disconnected too.
+        """
+        async with self._slots:
+            connection = await self._acquire()
+            try:
+                await self._send_with(connection, message)
+            except SMTPServerDisconnected:
+                if not connection.sent:
+                    raise
+                await self._send_with(await open_connection(self.smtp_options), message)
+
+    async def close(self) -> None:
+        """Close idle connections."""
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await self._discard(connection)
+
+    async def _send_with(self, connection: PooledSMTP, message: EmailMessage) -> None:
+        """Send message and return connection to the pool.
+
+        Args:
+            connection: PooledSMTP - connection for send.
+            message: EmailMessage - message for send.
+
+        Raises:
+            SMTPServerDisconnected: if connection is lost, connection is closed.
+            SMTPException: on other sending errors.
+            asyncio.CancelledError: if cancelled, connection is closed.
+            Exception: on unexpected errors, connection is closed.
+        """
+        try:
+            await connection.client.send_message(message)
+        except (SMTPServerDisconnected, ConnectionError) as error:
+            await self._discard(connection)
+            raise SMTPServerDisconnected(str(error)) from error
+        except SMTPException:
+            await self._release(connection)
+            raise
+        except (asyncio.CancelledError, Exception):
+            connection.client.close()
+            raise
+        connection.sent += 1
+        await self._release(connection)
+
+    async def _acquire(self) -> PooledSMTP:
+        """Get idle connection or open and authenticate new one.
+
+        Connection idle for SMTP_POOL_IDLE_CHECK_SECONDS is checked with NOOP.
+
+        Raises:
+            asyncio.CancelledError: if cancelled during check, connection is closed.
+
+        Returns:
+            PooledSMTP: ready connection.
+        """
+        while self._idle:
+            connection = self._idle.pop()
+            idle_seconds = time.monotonic() - connection.last_used
+            if idle_seconds < SMTP_POOL_IDLE_CHECK_SECONDS:
+                return connection
+            try:
+                await connection.client.noop()
+            except (SMTPException, ConnectionError):
+                await self._discard(connection)
+            except asyncio.CancelledError:
+                connection.client.close()
+                raise
+            else:
+                return connection
+        return await open_connection(self.smtp_options)
+
+    async def _release(self, connection: PooledSMTP) -> None:
+        """Return connection to the pool or close it after SMTP_POOL_MAX_MESSAGES.
+
+        Args:
+            connection: PooledSMTP - used connection.
+        """
+        if connection.sent >= SMTP_POOL_MAX_MESSAGES:
+            await self._discard(connection)
+            return
+        connection.last_used = time.monotonic()
+        self._idle.append(connection)
+
+    async def _discard(self, connection: PooledSMTP) -> None:
+        """Close connection.
+
+        Args:
+            connection: PooledSMTP - connection for close.
+        """
+        if connection.client.is_connected:
+            try:
+                await connection.client.quit()
+            except (SMTPException, ConnectionError):
+                connection.client.close()
+
+
+def get_smtp_pool() -> SMTPPool:
+    """Get app-lifetime SMTP pool, create it on first use.
+
+    Returns:
+        SMTPPool: shared pool.
+    """
+    loop = asyncio.get_running_loop()
+    if _shared.get('loop') is not loop:
+        _shared.update(pool=SMTPPool(), loop=loop)
+    return _shared['pool']
+
+
+async def close_smtp_pool() -> None:
+    """Close connections of shared SMTP pool."""
+    pool = _shared.pop('pool', None)
+    _shared.pop('loop', None)
+    if pool is not None:
+        await pool.close()
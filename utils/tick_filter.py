@@ -0,0 +1,103 @@
+"""Module with the write filter which drops ticks that did not move the price."""
+
+import time
+from typing import NamedTuple
+from uuid import UUID
+
+from models import Coin
+
+from . import metrics
+from .constants import (TICK_FILTER_ABS_EPSILON, TICK_FILTER_HEARTBEAT,
+                        TICK_FILTER_REL_THRESHOLD)
+
+
+class StoredTick(NamedTuple):
+    """Last stored coin price."""
+
+    price: float
+    stored_at: float
+
+
+_stored: dict[UUID, StoredTick] = {}
+
+
+def has_moved(stored_price: float, price: float) -> bool:
+    """Check if price moved further than both absolute and relative thresholds.
+
+    Args:
+        stored_price: float - last stored price.
+        price: float - new price.
+
+    Returns:
+        bool: True if price change exceeds thresholds, any change with zero thresholds.
+    """
+    threshold = max(TICK_FILTER_ABS_EPSILON, TICK_FILTER_REL_THRESHOLD * abs(stored_price))
+    return abs(price - stored_price) > threshold
+
+
+def is_enabled() -> bool:
+    """Check if any filter setting is set, otherwise every tick is stored.
+
+    Returns:
+        bool: True if filter is on.
+    """
+    return any((TICK_FILTER_HEARTBEAT, TICK_FILTER_ABS_EPSILON, TICK_FILTER_REL_THRESHOLD))
+
+
+def should_store(coin_id: UUID, price: float, now: float) -> bool:
+    """Check if tick should be stored.
+
+    Tick is stored if price moved or TICK_FILTER_HEARTBEAT seconds passed since last stored one,
+    zero heartbeat stores only moved prices.
+
+    Args:
+        coin_id: UUID - coin id.
+        price: float - new price.
+        now: float - monotonic time of tick.
+
+    Returns:
+        bool: True if tick should be stored.
+    """
+    stored = _stored.get(coin_id)
+    if not is_enabled() or stored is None:
+        return True
+    if 0 < TICK_FILTER_HEARTBEAT <= now - stored.stored_at:
+        return True
+    return has_moved(stored.price, price)
+
+
+def filter_prices(prices: list[tuple[Coin, float]]) -> list[tuple[Coin, float]]:
+    """Get ticks which should be stored.
+
+    Args:
+        prices: list[tuple[Coin, float]] - coins with their new prices.
+
+    Returns:
+        list[tuple[Coin, float]]: ticks for storing.
+    """
+    now = time.monotonic()
+    stored = [(coin, price) for coin, price in prices if should_store(coin.id, price, now)]
+    metrics.increment('prices_ticks_filtered_total', len(prices) - len(stored))
+    return stored
+
+
+def mark_stored(prices: list[tuple[Coin, float]]) -> None:
+    """Remember ticks as stored, called once they are committed.
+
+    Args:
+        prices: list[tuple[Coin, float]] - saved coins prices.
+    """
+    now = time.monotonic()
+    for coin, price in prices:
+        _stored[coin.id] = StoredTick(price, now)
+
+
+def forget_missing(coins: list[Coin]) -> None:
+    """Forget stored ticks of coins which are not polled anymore.
+
+    Args:
+        coins: list[Coin] - all polled coins.
+    """
+    coin_ids = {coin.id for coin in coins}
+    for coin_id in _stored.keys() - coin_ids:
+        _stored.pop(coin_id)
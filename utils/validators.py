@@ -5,7 +5,7 @@ from datetime import datetime
 
 from fastapi import HTTPException, status
 
-from api.coin_utils import get_coin_data
+from utils.instruments import is_listed, refresh_instruments
 from utils.time_utils import get_delta_timestamp, get_now_timestamp
 
 
@@ -53,14 +53,19 @@ def validate_email(email: str) -> str:
 async def check_coin_name(name: str) -> bool:
     """Check coin name for exists.
 
+    Cached instruments catalog is used, it is loaded from price source if it is not loaded yet.
+
     Args:
         name: str - Coin name.
 
     Returns:
         bool: True if coin name exists.
     """
-    coin_data = await get_coin_data(name)
-    return coin_data and coin_data['code'] == '0' and coin_data['data']
+    listed = is_listed(name)
+    if listed is not None:
+        return listed
+    await refresh_instruments()
+    return bool(is_listed(name))
 
 
 async def _validate_not_future(timestamp: float) -> None:
@@ -0,0 +1,206 @@
+"""Module with WebSocket ingestion of exchange tickers."""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Awaitable, Callable
+
+import aiohttp
+
+from api.coin_utils import INSTRUMENT_SUFFIX, get_inst_id
+from models import Coin
+
+from . import metrics, poller
+from .constants import (OKX_WS_URL, WS_COINS_REFRESH_INTERVAL,
+                        WS_FLUSH_INTERVAL, WS_PING_INTERVAL, WS_PONG_TIMEOUT,
+                        WS_RECONNECT_DELAY)
+from .http_utils import get_http_session
+
+logger = logging.getLogger(__name__)
+
+TICKERS_CHANNEL = 'tickers'
+
+CoinsLoader = Callable[[], Awaitable[list[Coin]]]
+CoinPrices = list[tuple[Coin, float]]
+PricesProcessor = Callable[[list[Coin], CoinPrices], Awaitable[None]]
+
+
+def parse_ticker(ticker: dict) -> tuple[str, float] | None:
+    """Get coin name and last price from ticker.
+
+    Args:
+        ticker: dict - ticker data.
+
+    Returns:
+        tuple[str, float] | None: coin name and price, None if ticker is malformed.
+    """
+    try:
+        return ticker['instId'].removesuffix(INSTRUMENT_SUFFIX), float(ticker['last'])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def get_subscription(operation: str, names: set[str]) -> str:
+    """Get message which subscribes to or unsubscribes from coins tickers.
+
+    Args:
+        operation: str - `subscribe` or `unsubscribe`.
+        names: set[str] - coins names.
+
+    Returns:
+        str: JSON message.
+    """
+    return json.dumps({
+        'op': operation,
+        'args': [
+            {'channel': TICKERS_CHANNEL, 'instId': get_inst_id(name)}
+            for name in sorted(names)
+        ],
+    })
+
+
+class TickerStream:
+    """Tickers subscription of all coins, ticks are processed in batches like poll cycles."""
+
+    def __init__(
+        self,
+        url: str = OKX_WS_URL,
+        load_coins: CoinsLoader = poller.load_coins,
+        process_prices: PricesProcessor = poller.process_prices,
+    ) -> None:
+        """Create stream.
+
+        Args:
+            url: str, optional - exchange public WebSocket url.
+            load_coins: CoinsLoader, optional - coins loader.
+            process_prices: PricesProcessor, optional - pipeline for new prices.
+        """
+        self.url = url
+        self._load_coins = load_coins
+        self._process_prices = process_prices
+        self.coins: dict[str, Coin] = {}
+        self.subscribed: set[str] = set()
+        self.ticks: dict[str, float] = {}
+        self._synced_at: float = 0
+        self._flushed_at: float = 0
+        self._received_at: float = 0
+        self._pinged_at: float | None = None
+
+    async def run(self) -> None:
+        """Keep connection open, reconnect and subscribe again after close or any error."""
+        infinite = True
+        while infinite:
+            try:
+                await self.consume()
+            except Exception:
+                logger.exception('Tickers stream failed')
+            metrics.increment('ws_reconnects_total')
+            await asyncio.sleep(WS_RECONNECT_DELAY)
+
+    async def consume(self) -> None:
+        """Read tickers until connection is closed.
+
+        Subscriptions are synced with coins table and ticks are flushed between messages.
+        """
+        async with get_http_session().ws_connect(self.url) as ws:
+            self.subscribed = set()
+            self._synced_at = 0
+            self._received_at = time.monotonic()
+            self._pinged_at = None
+            while not ws.closed:
+                try:
+                    message = await ws.receive(timeout=WS_FLUSH_INTERVAL)
+                except asyncio.TimeoutError:
+                    message = None
+                if message is not None and message.type != aiohttp.WSMsgType.TEXT:
+                    break
+                if message is not None:
+                    self.handle_message(message.data)
+                await self.maintain(ws)
+        await self.flush()
+
+    def handle_message(self, message: str) -> None:
+        """Remember latest price of each coin from tickers message.
+
+        Malformed messages and tickers are skipped and counted, connection is kept.
+
+        Args:
+            message: str - received message.
+        """
+        self._received_at = time.monotonic()
+        self._pinged_at = None
+        if message == 'pong':
+            return
+        try:
+            payload = json.loads(message)
+        except ValueError:
+            metrics.increment('ws_bad_messages_total')
+            return
+        if payload.get('event') == 'error':
+            logger.error(f'Tickers subscription error: {message}')
+        if payload.get('arg', {}).get('channel') != TICKERS_CHANNEL:
+            return
+        for ticker in payload.get('data') or []:
+            tick = parse_ticker(ticker)
+            if tick is None:
+                metrics.increment('ws_bad_ticks_total')
+                continue
+            name, price = tick
+            self.ticks[name] = price
+            metrics.increment('ws_ticks_total')
+
+    async def maintain(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Sync subscriptions, flush ticks and keep idle connection alive when it is time.
+
+        Connection is closed if nothing is received within WS_PONG_TIMEOUT after ping,
+        so half-open connection is reconnected.
+
+        Args:
+            ws: aiohttp.ClientWebSocketResponse - exchange connection.
+        """
+        now = time.monotonic()
+        if now - self._synced_at >= WS_COINS_REFRESH_INTERVAL:
+            await self.sync_subscriptions(ws)
+        if now - self._flushed_at >= WS_FLUSH_INTERVAL:
+            await self.flush()
+        if self._pinged_at is not None and now - self._pinged_at >= WS_PONG_TIMEOUT:
+            metrics.increment('ws_pong_timeouts_total')
+            await ws.close()
+        elif self._pinged_at is None and now - self._received_at >= WS_PING_INTERVAL:
+            await ws.send_str('ping')
+            self._pinged_at = now
+
+    async def sync_subscriptions(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Subscribe to added coins and unsubscribe from removed ones.
+
+        Args:
+            ws: aiohttp.ClientWebSocketResponse - exchange connection.
+        """
+        self.coins = {coin.name: coin for coin in await self._load_coins()}
+        self._synced_at = time.monotonic()
+        added = self.coins.keys() - self.subscribed
+        removed = self.subscribed - self.coins.keys()
+        if added:
+            await ws.send_str(get_subscription('subscribe', added))
+        if removed:
+            await ws.send_str(get_subscription('unsubscribe', removed))
+        self.subscribed = set(self.coins)
+        metrics.set_gauge('ws_subscribed_coins', len(self.subscribed))
+
+    async def flush(self) -> None:
+        """Process latest prices received since previous flush."""
+        self._flushed_at = time.monotonic()
+        ticks, self.ticks = self.ticks, {}
+        prices = [
+            (self.coins[name], price)
+            for name, price in ticks.items()
+            if name in self.coins
+        ]
+        if prices:
+            await self._process_prices(list(self.coins.values()), prices)
+
+
+async def run_ws_ingest() -> None:
+    """Infinite loop for ingesting prices from exchange tickers stream."""
+    await TickerStream().run()